@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+"""
+Benchmark a per-customer fan-out: save and reopen the master deck vs. clone_presentation.
+
+Builds a master deck with text, tables and an image, then creates one variant
+per customer with a small title edit, either by re-opening the saved master
+(parsing every part each time) or by cloning the in-memory presentation.
+
+Usage:
+    python benchmarks/bench_clone.py --variants 100 --slides 30
+"""
+import argparse
+import io
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PIL import Image
+from pptx import Presentation
+from pptx.util import Inches
+
+from utils.presentation_utils import clone_presentation
+
+
+def build_master(slide_count: int):
+    """Build a master deck with a title, bullets, a table on every fifth slide and one image."""
+    pres = Presentation()
+    for i in range(slide_count):
+        slide = pres.slides.add_slide(pres.slide_layouts[1])
+        slide.shapes.title.text = f"Slide {i} for CUSTOMER"
+        slide.placeholders[1].text = f"Point a {i}\nPoint b {i}\nPoint c {i}"
+        if i % 5 == 0:
+            table = slide.shapes.add_table(3, 3, Inches(1), Inches(4), Inches(6), Inches(2)).table
+            for r in range(3):
+                for c in range(3):
+                    table.cell(r, c).text = f"{r},{c}"
+
+    image = io.BytesIO()
+    Image.new("RGB", (800, 600), "steelblue").save(image, "PNG")
+    image.seek(0)
+    pres.slides[0].shapes.add_picture(image, Inches(6), Inches(1))
+    return pres
+
+
+def personalize(pres, customer: str) -> None:
+    """The per-variant edit: replace the customer placeholder in every title."""
+    for slide in pres.slides:
+        title = slide.shapes.title
+        title.text = title.text.replace("CUSTOMER", customer)
+
+
+def fan_out(make_copy, variants: int):
+    """Create and personalize variants; return them with the time spent on edits alone."""
+    results = []
+    edit_time = 0.0
+    for n in range(variants):
+        pres = make_copy()
+        start = time.perf_counter()
+        personalize(pres, f"Customer {n}")
+        edit_time += time.perf_counter() - start
+        results.append(pres)
+    return results, edit_time
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark presentation cloning")
+    parser.add_argument("--variants", type=int, default=100, help="Number of variants to create")
+    parser.add_argument("--slides", type=int, default=30, help="Number of slides in the master deck")
+    args = parser.parse_args()
+
+    master = build_master(args.slides)
+
+    # The reopen flow pays for one save of the master as well
+    start = time.perf_counter()
+    buffer = io.BytesIO()
+    master.save(buffer)
+    master_bytes = buffer.getvalue()
+    reopened, reopen_edit_time = fan_out(lambda: Presentation(io.BytesIO(master_bytes)), args.variants)
+    reopen_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    cloned, clone_edit_time = fan_out(lambda: clone_presentation(master), args.variants)
+    clone_time = time.perf_counter() - start
+
+    expected = [[s.shapes.title.text for s in pres.slides] for pres in reopened]
+    if [[s.shapes.title.text for s in pres.slides] for pres in cloned] != expected:
+        print("Result mismatch between reopened and cloned variants")
+        sys.exit(1)
+
+    print(f"variants:       {args.variants:8d}")
+    print(f"slides:         {args.slides:8d}")
+    print(f"save + reopen:  {reopen_time * 1000:8.1f} ms  (edits {reopen_edit_time * 1000:.1f} ms)")
+    print(f"clone:          {clone_time * 1000:8.1f} ms  (edits {clone_edit_time * 1000:.1f} ms)")
+    print(f"copy speedup:   {(reopen_time - reopen_edit_time) / (clone_time - clone_edit_time):8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python
+"""
+Benchmark slide layout validation: pairwise proxy checks vs. snapshot + sweep line.
+
+Builds a slide with many randomly placed shapes, checks that the pairwise
+implementation and validate_slide_layout return identical results, and
+reports the time each one needs. The pairwise run is slow (minutes at 1k
+shapes); use --shapes to try smaller slides first.
+
+Usage:
+    python benchmarks/bench_layout_validation.py --shapes 1000 --repeat 3
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pptx import Presentation
+from pptx.util import Emu
+
+from utils.validation_utils import calculate_shape_distance, shapes_overlap, validate_slide_layout
+
+
+def build_slide(shape_count: int, seed: int = 0):
+    """Build a slide with title placeholders plus randomly placed rectangles."""
+    rng = random.Random(seed)
+    pres = Presentation()
+    slide = pres.slides.add_slide(pres.slide_layouts[1])
+    for _ in range(shape_count):
+        slide.shapes.add_shape(
+            1,
+            Emu(rng.randint(-200000, 9000000)), Emu(rng.randint(0, 6800000)),
+            Emu(rng.randint(50000, 400000)), Emu(rng.randint(50000, 300000))
+        )
+    return slide
+
+
+def pairwise_validate_slide_layout(slide):
+    """The O(n^2) layout validation that compares every pair through shape proxies."""
+    result = {
+        'layout_valid': True,
+        'issues': [],
+        'suggestions': [],
+        'shape_count': len(slide.shapes),
+        'overlapping_shapes': []
+    }
+    try:
+        shapes = list(slide.shapes)
+        for i, shape1 in enumerate(shapes):
+            for j, shape2 in enumerate(shapes[i+1:], i+1):
+                if shapes_overlap(shape1, shape2):
+                    result['overlapping_shapes'].append({
+                        'shape1_index': i,
+                        'shape2_index': j,
+                        'shape1_name': getattr(shape1, 'name', f'Shape {i}'),
+                        'shape2_name': getattr(shape2, 'name', f'Shape {j}')
+                    })
+        if result['overlapping_shapes']:
+            result['layout_valid'] = False
+            result['issues'].append(f"Found {len(result['overlapping_shapes'])} overlapping shapes")
+            result['suggestions'].append("Consider repositioning overlapping shapes")
+
+        slide_width = 10 * 914400
+        slide_height = 7.5 * 914400
+        shapes_outside = []
+        for i, shape in enumerate(shapes):
+            if (shape.left < 0 or shape.top < 0 or
+                shape.left + shape.width > slide_width or
+                shape.top + shape.height > slide_height):
+                shapes_outside.append(i)
+        if shapes_outside:
+            result['layout_valid'] = False
+            result['issues'].append(f"Found {len(shapes_outside)} shapes outside slide boundaries")
+            result['suggestions'].append("Reposition shapes to fit within slide boundaries")
+
+        if len(shapes) > 1:
+            min_spacing = float('inf')
+            for i, shape1 in enumerate(shapes):
+                for shape2 in shapes[i+1:]:
+                    min_spacing = min(min_spacing, calculate_shape_distance(shape1, shape2))
+            min_spacing = min_spacing if min_spacing != float('inf') else 0
+            if min_spacing < 0.1 * 914400:
+                result['suggestions'].append("Consider increasing spacing between shapes")
+        return result
+    except Exception as e:
+        result['layout_valid'] = False
+        result['error'] = str(e)
+        return result
+
+
+def best_time(func, slide, repeat: int) -> float:
+    """Return the best wall-clock time in seconds of func(slide)."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(slide)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark slide layout validation")
+    parser.add_argument("--shapes", type=int, default=1000, help="Number of shapes on the slide")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="Number of timed sweep-line repetitions (best is reported)")
+    args = parser.parse_args()
+
+    slide = build_slide(args.shapes)
+
+    # The pairwise run takes minutes at 1k shapes, so it is timed once and doubles as the reference
+    start = time.perf_counter()
+    expected = pairwise_validate_slide_layout(slide)
+    pairwise_time = time.perf_counter() - start
+
+    if validate_slide_layout(slide) != expected:
+        print("Result mismatch between pairwise and sweep-line validation")
+        sys.exit(1)
+
+    sweep_time = best_time(validate_slide_layout, slide, args.repeat)
+
+    print(f"shapes:              {args.shapes:8d}")
+    print(f"overlapping pairs:   {len(expected['overlapping_shapes']):8d}")
+    print(f"pairwise validation: {pairwise_time * 1000:8.1f} ms")
+    print(f"sweep validation:    {sweep_time * 1000:8.1f} ms")
+    print(f"speedup:             {pairwise_time / sweep_time:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
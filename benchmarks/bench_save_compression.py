@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+"""
+Benchmark save time and file size under the zip compression policies.
+
+Builds a media-heavy deck (incompressible images) and a text-heavy deck, then
+saves each with python-pptx's default (deflate every part) and with the
+'fast', 'balanced' and 'smallest' policies, single-threaded and with a
+thread pool. Saved files are checked to hold the same parts as the default.
+
+Usage:
+    python benchmarks/bench_save_compression.py --images 12 --text-slides 500 --repeat 3
+"""
+import argparse
+import io
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from PIL import Image
+from pptx import Presentation
+from pptx.util import Inches
+
+from utils.package_utils import ZipCompressionPolicy
+from utils.presentation_utils import save_presentation
+
+
+def build_media_deck(image_count: int, image_size: int):
+    """A deck with one noise image (does not compress) per slide."""
+    pres = Presentation()
+    for i in range(image_count):
+        slide = pres.slides.add_slide(pres.slide_layouts[5])
+        slide.shapes.title.text = f"Photo {i}"
+        image = io.BytesIO()
+        Image.frombytes("RGB", (image_size, image_size), os.urandom(image_size * image_size * 3)).save(image, "PNG")
+        image.seek(0)
+        slide.shapes.add_picture(image, Inches(1), Inches(1.5), Inches(5))
+    return pres
+
+
+def build_text_deck(slide_count: int):
+    """A deck with titles, bullets and a table on every fifth slide."""
+    pres = Presentation()
+    for i in range(slide_count):
+        slide = pres.slides.add_slide(pres.slide_layouts[1])
+        slide.shapes.title.text = f"Slide {i} title"
+        slide.placeholders[1].text = "\n".join(f"Bullet point {j} on slide {i}" for j in range(8))
+        if i % 5 == 0:
+            table = slide.shapes.add_table(6, 6, Inches(1), Inches(4), Inches(8), Inches(2)).table
+            for r in range(6):
+                for c in range(6):
+                    table.cell(r, c).text = f"r{r}c{c}"
+    return pres
+
+
+def part_blobs(path: str):
+    pres = Presentation(path)
+    return {str(part.partname): part.blob for part in pres.part.package.iter_parts()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark zip compression policies on save")
+    parser.add_argument("--images", type=int, default=12, help="Number of images in the media deck")
+    parser.add_argument("--image-size", type=int, default=1200, help="Image width and height in pixels")
+    parser.add_argument("--text-slides", type=int, default=500, help="Number of slides in the text deck")
+    parser.add_argument("--repeat", type=int, default=3, help="Number of saves per configuration")
+    args = parser.parse_args()
+
+    configurations = [("default", None)]
+    for preset in ("fast", "balanced", "smallest"):
+        configurations.append((f"{preset} (1 thread)", ZipCompressionPolicy.from_preset(preset, max_workers=1)))
+        configurations.append((f"{preset} (pool)", ZipCompressionPolicy.from_preset(preset)))
+
+    decks = [
+        ("media deck", build_media_deck(args.images, args.image_size)),
+        ("text deck", build_text_deck(args.text_slides)),
+    ]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for deck_name, pres in decks:
+            print(f"{deck_name}:")
+            reference = None
+            for label, policy in configurations:
+                path = os.path.join(tmp, "deck.pptx")
+                best = None
+                for _ in range(args.repeat):
+                    start = time.perf_counter()
+                    save_presentation(pres, path, policy)
+                    elapsed = time.perf_counter() - start
+                    best = elapsed if best is None else min(best, elapsed)
+
+                blobs = part_blobs(path)
+                if reference is None:
+                    reference = blobs
+                elif blobs != reference:
+                    print(f"  {label}: saved parts differ from the default save")
+                    sys.exit(1)
+                print(f"  {label:22s} {best * 1000:9.1f} ms  {os.path.getsize(path) / 1e6:8.2f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+#!/usr/bin/env python
+"""
+Benchmark slide text extraction: python-pptx proxies vs. direct XPath.
+
+Builds a synthetic deck, checks that both implementations return identical
+results, and reports the time each one needs to extract the whole deck.
+
+Usage:
+    python benchmarks/bench_text_extraction.py --slides 500 --repeat 5
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pptx import Presentation
+from pptx.util import Inches
+
+from utils.content_utils import extract_slide_text_content, extract_slide_text_content_xml
+
+
+def build_deck(slide_count: int) -> Presentation:
+    """Build a deck with titles, bullet placeholders, text boxes and a table every fifth slide."""
+    pres = Presentation()
+    for i in range(slide_count):
+        slide = pres.slides.add_slide(pres.slide_layouts[1])
+        slide.shapes.title.text = f"Slide {i} title"
+        slide.placeholders[1].text = "\n".join(f"Bullet point {j} on slide {i}" for j in range(5))
+        for j in range(3):
+            textbox = slide.shapes.add_textbox(Inches(1 + j * 3), Inches(6), Inches(2.5), Inches(1))
+            textbox.text_frame.text = f"Note {j} for slide {i}"
+        if i % 5 == 0:
+            table = slide.shapes.add_table(4, 4, Inches(1), Inches(4), Inches(8), Inches(1.5)).table
+            for row in range(4):
+                for col in range(4):
+                    table.cell(row, col).text = f"R{row}C{col}"
+    return pres
+
+
+def time_extraction(extract, slides, repeat: int) -> float:
+    """Return the best wall-clock time in seconds to extract all slides."""
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for slide in slides:
+            extract(slide)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark slide text extraction")
+    parser.add_argument("--slides", type=int, default=500, help="Number of slides in the synthetic deck")
+    parser.add_argument("--repeat", type=int, default=5, help="Number of timed repetitions (best is reported)")
+    args = parser.parse_args()
+
+    pres = build_deck(args.slides)
+    slides = list(pres.slides)
+
+    for index, slide in enumerate(slides):
+        if extract_slide_text_content(slide) != extract_slide_text_content_xml(slide._element):
+            print(f"Result mismatch on slide {index}")
+            sys.exit(1)
+
+    proxy_time = time_extraction(extract_slide_text_content, slides, args.repeat)
+    xpath_time = time_extraction(lambda slide: extract_slide_text_content_xml(slide._element), slides, args.repeat)
+
+    print(f"slides:           {args.slides:8d}")
+    print(f"proxy extraction: {proxy_time * 1000:8.1f} ms")
+    print(f"xpath extraction: {xpath_time * 1000:8.1f} ms")
+    print(f"speedup:          {proxy_time / xpath_time:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
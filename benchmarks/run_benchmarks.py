@@ -0,0 +1,509 @@
+#!/usr/bin/env python
+"""
+Benchmark suite for server startup and the registered MCP tools.
+
+Tools are called in-process through the FastMCP app (argument validation and
+result serialization included, no transport). Each benchmark runs in a child
+process of its own so that peak RSS is attributed to one benchmark. Results
+are written as JSON with latency percentiles, peak RSS and output file size;
+given a baseline, benchmarks whose p50 latency, peak RSS or output size grew
+by more than the threshold are reported and the exit status is 1.
+
+benchmarks/baseline.json holds full (not --quick) results together with the
+machine they were recorded on. Latencies only compare on like hardware, so a
+comparison against a baseline from other hardware warns; re-record it with
+--save-baseline on the machine that runs the comparison (e.g. the CI runner)
+and commit it whenever that machine or an intended performance change moves
+the numbers.
+
+Usage:
+    python benchmarks/run_benchmarks.py --output results.json
+    python benchmarks/run_benchmarks.py --save-baseline benchmarks/baseline.json
+    python benchmarks/run_benchmarks.py --baseline benchmarks/baseline.json --threshold 0.25
+    python benchmarks/run_benchmarks.py --only tables,charts --quick
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List, Optional
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+# Metrics compared against the baseline; larger is worse for all of them
+COMPARED_METRICS = ("p50_ms", "peak_rss_mb", "output_bytes")
+
+
+# ---- Measurement helpers ----
+
+def percentile(sorted_samples: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of already sorted samples."""
+    rank = max(1, math.ceil(fraction * len(sorted_samples)))
+    return sorted_samples[rank - 1]
+
+
+def summarize(samples_ms: List[float]) -> Dict:
+    """Latency statistics of a list of samples in milliseconds."""
+    ordered = sorted(samples_ms)
+    return {
+        "iterations": len(ordered),
+        "min_ms": round(ordered[0], 3),
+        "p50_ms": round(percentile(ordered, 0.50), 3),
+        "p90_ms": round(percentile(ordered, 0.90), 3),
+        "p99_ms": round(percentile(ordered, 0.99), 3),
+        "max_ms": round(ordered[-1], 3),
+        "mean_ms": round(sum(ordered) / len(ordered), 3)
+    }
+
+
+def peak_rss_mb(children: bool = False) -> Optional[float]:
+    """Peak resident set size of this process (or its waited-for children) in MB."""
+    if resource is None:
+        return None
+    usage = resource.getrusage(resource.RUSAGE_CHILDREN if children else resource.RUSAGE_SELF)
+    # ru_maxrss is in bytes on macOS and in kilobytes elsewhere
+    divisor = 1024 * 1024 if sys.platform == "darwin" else 1024
+    return round(usage.ru_maxrss / divisor, 1)
+
+
+class ToolClient:
+    """Calls registered tools on the server's FastMCP app and unwraps the results."""
+
+    def __init__(self):
+        import ppt_mcp_server
+        self.app = ppt_mcp_server.app
+        self.presentations = ppt_mcp_server.presentations
+        self.loop = asyncio.new_event_loop()
+
+    def call(self, name: str, **arguments):
+        """Call a tool; raise RuntimeError if it reports an error."""
+        result = self.loop.run_until_complete(self.app.call_tool(name, arguments))
+        if isinstance(result, tuple):
+            result = result[1].get("result", result[1])
+        if isinstance(result, dict) and "error" in result:
+            raise RuntimeError(f"{name} failed: {result['error']}")
+        return result
+
+    def timed(self, name: str, **arguments) -> float:
+        """Call a tool and return the elapsed time in milliseconds."""
+        start = time.perf_counter()
+        self.call(name, **arguments)
+        return (time.perf_counter() - start) * 1000
+
+
+def build_text_deck(path: str, slide_count: int) -> None:
+    """Save a deck with titles, bullets, text boxes and a table every fifth slide."""
+    from pptx import Presentation
+    from pptx.util import Inches
+
+    pres = Presentation()
+    for i in range(slide_count):
+        slide = pres.slides.add_slide(pres.slide_layouts[1])
+        slide.shapes.title.text = f"Slide {i} title"
+        slide.placeholders[1].text = "\n".join(f"Bullet point {j} on slide {i}" for j in range(5))
+        slide.shapes.add_textbox(Inches(1), Inches(6), Inches(4), Inches(1)).text = f"Note {i}"
+        if i % 5 == 0:
+            table = slide.shapes.add_table(4, 4, Inches(5), Inches(4), Inches(4), Inches(2)).table
+            for r in range(4):
+                for c in range(4):
+                    table.cell(r, c).text = f"r{r}c{c}"
+    pres.save(path)
+
+
+def saved_size(client, presentation_id: str, work_dir: str) -> int:
+    """Save a presentation (untimed) and return the file size in bytes."""
+    path = os.path.join(work_dir, f"{presentation_id}.pptx")
+    client.call("save_presentation", file_path=path, presentation_id=presentation_id)
+    return os.path.getsize(path)
+
+
+# ---- Benchmarks ----
+# Each benchmark takes (client, scale, work_dir) and returns a result dictionary
+# with at least 'samples_ms'; scale shrinks iteration counts for --quick runs.
+
+def bench_startup(client, scale: float, work_dir: str) -> Dict:
+    """Import the server in a fresh interpreter and answer a tool listing."""
+    code = (
+        "import time, asyncio; start = time.perf_counter(); import ppt_mcp_server; "
+        "asyncio.run(ppt_mcp_server.app.list_tools()); print((time.perf_counter() - start) * 1000)"
+    )
+    samples = []
+    for _ in range(max(2, int(5 * scale))):
+        output = subprocess.run([sys.executable, "-c", code], cwd=ROOT_DIR, capture_output=True,
+                                text=True, check=True).stdout
+        samples.append(float(output.strip().splitlines()[-1]))
+    return {"samples_ms": samples, "peak_rss_mb": peak_rss_mb(children=True)}
+
+
+def bench_create_presentation(client, scale: float, work_dir: str) -> Dict:
+    """Create an empty presentation."""
+    samples = [client.timed("create_presentation", id=f"bench_{i}") for i in range(max(5, int(50 * scale)))]
+    return {"samples_ms": samples}
+
+
+def bench_slide_templates(client, scale: float, work_dir: str) -> Dict:
+    """Create one slide from each template in slide_layout_templates.json."""
+    template_ids = [template["id"] for template in client.call("list_slide_templates")["available_templates"]]
+    samples = []
+    per_template = {}
+    for _ in range(max(1, int(3 * scale))):
+        client.call("create_presentation", id="bench_templates")
+        for template_id in template_ids:
+            elapsed = client.timed("create_slide_from_template", template_id=template_id,
+                                   presentation_id="bench_templates")
+            samples.append(elapsed)
+            per_template.setdefault(template_id, []).append(elapsed)
+    return {
+        "samples_ms": samples,
+        "output_bytes": saved_size(client, "bench_templates", work_dir),
+        "template_count": len(template_ids),
+        "per_template_p50_ms": {
+            template_id: round(percentile(sorted(values), 0.5), 3) for template_id, values in per_template.items()
+        }
+    }
+
+
+def bench_gradient_backgrounds(client, scale: float, work_dir: str) -> Dict:
+    """Add slides with professional and custom gradient backgrounds."""
+    client.call("create_presentation", id="bench_gradients")
+    samples = []
+    for i in range(max(4, int(20 * scale))):
+        if i % 2:
+            arguments = {"background_type": "gradient", "background_colors": [[0, 120, 215], [255, 255, 255]]}
+        else:
+            arguments = {"background_type": "professional_gradient", "color_scheme": "modern_blue"}
+        samples.append(client.timed("add_slide", layout_index=6, presentation_id="bench_gradients", **arguments))
+    return {"samples_ms": samples, "output_bytes": saved_size(client, "bench_gradients", work_dir)}
+
+
+def make_table_benchmark(rows: int, cols: int) -> Callable:
+    def bench_table(client, scale: float, work_dir: str) -> Dict:
+        client.call("create_presentation", id="bench_tables")
+        data = [[f"r{r}c{c}" for c in range(cols)] for r in range(rows)]
+        samples = []
+        for _ in range(max(2, int(10 * scale))):
+            client.call("add_slide", layout_index=6, presentation_id="bench_tables")
+            slide_index = len(client.presentations["bench_tables"].slides) - 1
+            samples.append(client.timed("add_table", slide_index=slide_index, rows=rows, cols=cols, left=0.5,
+                                        top=0.5, width=9.0, height=6.0, data=data,
+                                        presentation_id="bench_tables"))
+        return {"samples_ms": samples, "output_bytes": saved_size(client, "bench_tables", work_dir)}
+    bench_table.__doc__ = f"Add a {rows}x{cols} table with data and header formatting."
+    return bench_table
+
+
+def make_chart_benchmark(chart_type: str, points: int, series: int) -> Callable:
+    def bench_chart(client, scale: float, work_dir: str) -> Dict:
+        client.call("create_presentation", id="bench_charts")
+        categories = [f"c{i}" for i in range(points)]
+        values = [[float((i * (s + 3)) % 97) for i in range(points)] for s in range(series)]
+        names = [f"Series {s}" for s in range(series)]
+        samples = []
+        for _ in range(max(2, int(10 * scale))):
+            client.call("add_slide", layout_index=6, presentation_id="bench_charts")
+            slide_index = len(client.presentations["bench_charts"].slides) - 1
+            samples.append(client.timed("add_chart", slide_index=slide_index, chart_type=chart_type, left=0.5,
+                                        top=0.5, width=9.0, height=6.0, categories=categories,
+                                        series_names=names, series_values=values,
+                                        presentation_id="bench_charts"))
+        return {"samples_ms": samples, "output_bytes": saved_size(client, "bench_charts", work_dir)}
+    bench_chart.__doc__ = f"Add a {chart_type} chart with {series} series of {points} points."
+    return bench_chart
+
+
+def bench_text_extraction(client, scale: float, work_dir: str) -> Dict:
+    """Extract the text of a synthetic 500-slide deck."""
+    path = os.path.join(work_dir, "text_500.pptx")
+    build_text_deck(path, 500)
+    client.call("open_presentation", file_path=path, id="bench_text")
+    samples = [
+        client.timed("extract_presentation_text", presentation_id="bench_text")
+        for _ in range(max(2, int(5 * scale)))
+    ]
+    return {"samples_ms": samples}
+
+
+def bench_save_open_roundtrip(client, scale: float, work_dir: str) -> Dict:
+    """Save a 100-slide deck and open the saved file again."""
+    source = os.path.join(work_dir, "roundtrip_source.pptx")
+    target = os.path.join(work_dir, "roundtrip.pptx")
+    build_text_deck(source, 100)
+    client.call("open_presentation", file_path=source, id="bench_roundtrip")
+    samples = []
+    for i in range(max(2, int(5 * scale))):
+        start = time.perf_counter()
+        client.call("save_presentation", file_path=target, presentation_id="bench_roundtrip")
+        client.call("open_presentation", file_path=target, id=f"bench_roundtrip_{i}")
+        samples.append((time.perf_counter() - start) * 1000)
+    return {"samples_ms": samples, "output_bytes": os.path.getsize(target)}
+
+
+def bench_incremental_save(client, scale: float, work_dir: str) -> Dict:
+    """Edit one title of a 30-slide deck with 25 MB of images and save it incrementally in place."""
+    from PIL import Image
+    from pptx import Presentation
+    from pptx.util import Inches
+
+    path = os.path.join(work_dir, "media_deck.pptx")
+    pres = Presentation()
+    for i in range(30):
+        slide = pres.slides.add_slide(pres.slide_layouts[1])
+        slide.shapes.title.text = f"Slide {i} title"
+        if i < 6:
+            image_path = os.path.join(work_dir, f"noise_{i}.png")
+            Image.frombytes("RGB", (1200, 1200), os.urandom(1200 * 1200 * 3)).save(image_path)
+            slide.shapes.add_picture(image_path, Inches(5), Inches(2), Inches(3))
+    pres.save(path)
+
+    client.call("open_presentation", file_path=path, id="bench_incremental")
+    samples = []
+    for i in range(max(3, int(10 * scale))):
+        client.call("populate_placeholder", slide_index=i % 30, placeholder_idx=0, text=f"Edited {i}",
+                    presentation_id="bench_incremental")
+        samples.append(client.timed("save_presentation", file_path=path, incremental=True,
+                                    presentation_id="bench_incremental"))
+    return {"samples_ms": samples, "output_bytes": os.path.getsize(path)}
+
+
+def bench_merge_presentations(client, scale: float, work_dir: str) -> Dict:
+    """Merge 40 team decks of 10 slides sharing a logo into one file."""
+    from PIL import Image
+    from pptx import Presentation
+    from pptx.util import Inches
+
+    logo = os.path.join(work_dir, "logo.png")
+    Image.frombytes("RGB", (400, 400), os.urandom(400 * 400 * 3)).save(logo)
+    sources = []
+    for team in range(40):
+        path = os.path.join(work_dir, f"team_{team}.pptx")
+        pres = Presentation()
+        for i in range(10):
+            slide = pres.slides.add_slide(pres.slide_layouts[1])
+            slide.shapes.title.text = f"Team {team} slide {i}"
+            slide.placeholders[1].text = "\n".join(f"Update {j}" for j in range(4))
+            slide.shapes.add_picture(logo, Inches(8), Inches(0.2), Inches(1))
+        pres.save(path)
+        sources.append({"file_path": path})
+
+    target = os.path.join(work_dir, "merged.pptx")
+    samples = [
+        client.timed("merge_presentations", sources=sources, id=f"bench_merge_{i}", output_path=target)
+        for i in range(max(2, int(5 * scale)))
+    ]
+    return {"samples_ms": samples, "output_bytes": os.path.getsize(target)}
+
+
+def bench_split_presentation(client, scale: float, work_dir: str) -> Dict:
+    """Split a 500-slide deck into 10 files of 50 slides."""
+    source = os.path.join(work_dir, "split_source.pptx")
+    build_text_deck(source, 500)
+    slide_ranges = [f"{start}-{start + 49}" for start in range(0, 500, 50)]
+    output_dir = os.path.join(work_dir, "split")
+    samples = [
+        client.timed("split_presentation", output_dir=output_dir, file_path=source, slide_ranges=slide_ranges)
+        for _ in range(max(2, int(5 * scale)))
+    ]
+    return {"samples_ms": samples, "output_bytes": os.path.getsize(os.path.join(output_dir, "split_source_01.pptx"))}
+
+
+BENCHMARKS: Dict[str, Callable] = {
+    "startup": bench_startup,
+    "create_presentation": bench_create_presentation,
+    "slide_templates": bench_slide_templates,
+    "gradient_backgrounds": bench_gradient_backgrounds,
+    "table_5x5": make_table_benchmark(5, 5),
+    "table_20x10": make_table_benchmark(20, 10),
+    "table_50x20": make_table_benchmark(50, 20),
+    "chart_column_12x3": make_chart_benchmark("column", 12, 3),
+    "chart_line_1000x5": make_chart_benchmark("line", 1000, 5),
+    "chart_bar_500x10": make_chart_benchmark("bar", 500, 10),
+    "text_extraction_500_slides": bench_text_extraction,
+    "save_open_roundtrip_100_slides": bench_save_open_roundtrip,
+    "incremental_save_media_deck": bench_incremental_save,
+    "merge_40_decks": bench_merge_presentations,
+    "split_500_slides_10_ways": bench_split_presentation,
+}
+
+# Groups accepted by --only in addition to benchmark names
+BENCHMARK_GROUPS = {
+    "tables": [name for name in BENCHMARKS if name.startswith("table_")],
+    "charts": [name for name in BENCHMARKS if name.startswith("chart_")],
+}
+
+
+# ---- Running ----
+
+def run_case(name: str, scale: float, output_path: str) -> None:
+    """Run one benchmark in this process and write its result to output_path."""
+    with tempfile.TemporaryDirectory() as work_dir:
+        client = None if name == "startup" else ToolClient()
+        result = BENCHMARKS[name](client, scale, work_dir)
+
+    samples = result.pop("samples_ms")
+    record = {"description": BENCHMARKS[name].__doc__, **summarize(samples)}
+    record["peak_rss_mb"] = result.pop("peak_rss_mb", None) or peak_rss_mb()
+    record["output_bytes"] = result.pop("output_bytes", None)
+    record.update(result)
+    with open(output_path, "w", encoding="utf-8") as f:
+        json.dump(record, f)
+
+
+def run_in_subprocess(name: str, scale: float) -> Dict:
+    """Run one benchmark in a fresh interpreter and return its result."""
+    with tempfile.TemporaryDirectory() as tmp:
+        output_path = os.path.join(tmp, "result.json")
+        completed = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--run-case", name,
+             "--scale", str(scale), "--case-output", output_path],
+            cwd=ROOT_DIR, capture_output=True, text=True
+        )
+        if completed.returncode != 0:
+            return {"error": completed.stderr.strip().splitlines()[-1] if completed.stderr.strip() else
+                    f"exit status {completed.returncode}"}
+        with open(output_path, encoding="utf-8") as f:
+            return json.load(f)
+
+
+def compare(results: Dict, baseline: Dict, threshold: float) -> List[Dict]:
+    """Metrics that grew by more than threshold (a fraction) relative to the baseline."""
+    regressions = []
+    for name, result in results.items():
+        previous = baseline.get(name)
+        if previous is None or "error" in result or "error" in previous:
+            continue
+        for metric in COMPARED_METRICS:
+            old, new = previous.get(metric), result.get(metric)
+            if not old or new is None:
+                continue
+            ratio = new / old
+            if ratio > 1 + threshold:
+                regressions.append({
+                    "benchmark": name, "metric": metric, "baseline": old, "current": new,
+                    "change_percent": round((ratio - 1) * 100, 1)
+                })
+    return regressions
+
+
+def select_benchmarks(only: Optional[str]) -> List[str]:
+    """Benchmark names selected by a comma-separated list of names and groups."""
+    if not only:
+        return list(BENCHMARKS)
+    selected = []
+    for item in (part.strip() for part in only.split(",") if part.strip()):
+        names = BENCHMARK_GROUPS.get(item, [item])
+        for name in names:
+            if name not in BENCHMARKS:
+                raise SystemExit(f"Unknown benchmark: {name}. Available: {', '.join(BENCHMARKS)}")
+            if name not in selected:
+                selected.append(name)
+    return selected
+
+
+def describe_machine() -> Dict:
+    """CPU and memory of this machine, recorded with the results since baselines only compare on like hardware."""
+    cpu_model = platform.processor() or platform.machine()
+    memory_mb = None
+    try:
+        with open("/proc/cpuinfo", encoding="utf-8") as f:
+            cpu_model = next((line.split(":", 1)[1].strip() for line in f if line.startswith("model name")), cpu_model)
+        with open("/proc/meminfo", encoding="utf-8") as f:
+            memory_mb = next((int(line.split()[1]) // 1024 for line in f if line.startswith("MemTotal")), None)
+    except OSError:  # Not Linux
+        pass
+    return {"cpu_model": cpu_model, "cpu_count": os.cpu_count(), "memory_mb": memory_mb}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the server benchmark suite")
+    parser.add_argument("--only", help="Comma-separated benchmark names or groups (tables, charts)")
+    parser.add_argument("--quick", action="store_true", help="Run fewer iterations")
+    parser.add_argument("--output", help="Write results as JSON to this file (default: stdout)")
+    parser.add_argument("--baseline", help="Compare against results previously saved with --save-baseline")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="Relative increase counted as a regression (default: 0.25)")
+    parser.add_argument("--save-baseline", help="Also write the results to this file as the new baseline")
+    parser.add_argument("--list", action="store_true", help="List the benchmarks and exit")
+    # Internal: run a single benchmark in this process
+    parser.add_argument("--run-case", help=argparse.SUPPRESS)
+    parser.add_argument("--case-output", help=argparse.SUPPRESS)
+    parser.add_argument("--scale", type=float, default=1.0, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.run_case:
+        run_case(args.run_case, args.scale, args.case_output)
+        return
+
+    if args.list:
+        for name, bench in BENCHMARKS.items():
+            print(f"{name:32s} {bench.__doc__}")
+        return
+
+    scale = 0.3 if args.quick else 1.0
+    results = {}
+    for name in select_benchmarks(args.only):
+        print(f"running {name} ...", file=sys.stderr)
+        results[name] = run_in_subprocess(name, scale)
+        if "error" in results[name]:
+            print(f"  error: {results[name]['error']}", file=sys.stderr)
+        else:
+            print(f"  p50 {results[name]['p50_ms']:.1f} ms, p90 {results[name]['p90_ms']:.1f} ms, "
+                  f"peak RSS {results[name]['peak_rss_mb']} MB", file=sys.stderr)
+
+    report = {
+        "metadata": {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "machine": describe_machine(),
+            "quick": args.quick
+        },
+        "benchmarks": results
+    }
+
+    exit_status = 1 if any("error" in result for result in results.values()) else 0
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+        baseline_machine = baseline.get("metadata", {}).get("machine")
+        if baseline_machine != report["metadata"]["machine"]:
+            print(f"warning: the baseline was recorded on different hardware ({baseline_machine}); "
+                  f"latencies may not be comparable", file=sys.stderr)
+        regressions = compare(results, baseline.get("benchmarks", {}), args.threshold)
+        report["comparison"] = {
+            "baseline": args.baseline,
+            "threshold": args.threshold,
+            "regressions": regressions
+        }
+        for regression in regressions:
+            print(f"REGRESSION {regression['benchmark']} {regression['metric']}: {regression['baseline']} -> "
+                  f"{regression['current']} (+{regression['change_percent']}%)", file=sys.stderr)
+        if regressions:
+            exit_status = 1
+
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    if args.save_baseline:
+        with open(args.save_baseline, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+
+    sys.exit(exit_status)
+
+
+if __name__ == "__main__":
+    main()
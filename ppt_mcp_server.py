@@ -4,11 +4,28 @@ MCP Server for PowerPoint manipulation using python-pptx.
 Consolidated version with 20 tools organized into multiple modules.
 """
 
+import time
+
+# Reference point for --profile-startup; taken before any heavy import
+_startup_time = time.perf_counter()
+_startup_phases = []
+
+
+def _mark_startup_phase(name: str) -> None:
+    """Record the end of a startup phase for --profile-startup."""
+    _startup_phases.append((name, time.perf_counter()))
+
+
 import os
+import sys
 import argparse
+import functools
+import inspect
 from typing import Dict, Any
 from mcp.server.fastmcp import FastMCP
 
+_mark_startup_phase("import mcp")
+
 # import utils  # Currently unused
 from tools import (
     register_presentation_tools,
@@ -21,7 +38,20 @@ from tools import (
     register_connector_tools,
     register_master_tools,
     register_transition_tools,
+    register_search_tools,
+    register_validation_tools,
+    register_transfer_tools,
+    register_snapshot_tools,
 )
+from utils.address_utils import PresentationAddressIndex
+from utils.change_utils import ChangeTracker
+from utils.journal_utils import DEFAULT_CHECKPOINT_INTERVAL, OperationJournal
+from utils.presentation_utils import TemplateCatalog, TemplatePool
+from utils.search_utils import PresentationSearchIndex
+from utils.snapshot_utils import SnapshotHistory
+from utils.transfer_utils import DownloadStore, UploadStore
+
+_mark_startup_phase("import tool and utility modules")
 
 # Initialize the FastMCP server
 app = FastMCP(name="ppt-mcp-server")
@@ -228,6 +258,193 @@ class PresentationManager:
         return pres_id
 
 
+# ---- Mutation Tracking ----
+
+# Tools that change a loaded presentation, with the scope of the change they make:
+# "shape" (the shape_index in the result or arguments), "slide" (slide_index),
+# "slides" (slides added), "all_slides" or "document" (no slide content).
+MUTATING_TOOLS = {
+    "set_core_properties": "document",
+    "add_slide": "slides",
+    "populate_placeholder": "slide",
+    "add_bullet_points": "slide",
+    "manage_text": "shape",
+    "manage_image": "shape",
+    "add_table": "shape",
+    "format_table_cell": "shape",
+    "add_shape": "shape",
+    "add_chart": "shape",
+    "update_chart_data": "shape",
+    "manage_hyperlinks": "shape",
+    "add_connector": "shape",
+    "manage_slide_masters": "document",
+    "manage_slide_transitions": "slide",
+    "apply_professional_design": "all_slides",
+    "apply_picture_effects": "shape",
+    "apply_slide_template": "slide",
+    "create_slide_from_template": "slides",
+    "create_presentation_from_templates": "slides",
+    "auto_generate_presentation": "slides",
+}
+
+# Operations whose scope differs from their tool's; None means the operation is
+# read-only or records its own changes
+MUTATION_SCOPE_OVERRIDES = {
+    ("manage_text", "validate"): None,
+    ("manage_hyperlinks", "list"): None,
+    ("manage_slide_masters", "list"): None,
+    ("manage_slide_masters", "get_layouts"): None,
+    ("manage_slide_masters", "get_info"): None,
+    ("manage_slide_transitions", "get"): None,
+    ("apply_professional_design", "get_schemes"): None,
+    ("apply_professional_design", "professional_slide"): "slides",
+    ("apply_professional_design", "enhance"): "slide",
+}
+
+# Version log of all mutations; consumers collect what changed since they last looked
+change_tracker = ChangeTracker(presentations)
+
+# Slide id, shape id and shape name lookup, kept current from the change tracker
+address_index = PresentationAddressIndex(presentations, change_tracker)
+
+
+def create_operation_journal():
+    """
+    Journal of the edits to the store, so that a restart can recover it.
+
+    Enabled by setting PPT_JOURNAL_DIR to a directory that survives restarts.
+    PPT_JOURNAL_CHECKPOINT_INTERVAL sets how many calls are journaled between
+    checkpoints, and PPT_JOURNAL_SYNC=1 fsyncs every write.
+    """
+    journal_dir = os.environ.get("PPT_JOURNAL_DIR")
+    if not journal_dir:
+        return None
+    checkpoint_interval = int(os.environ.get("PPT_JOURNAL_CHECKPOINT_INTERVAL", DEFAULT_CHECKPOINT_INTERVAL))
+    sync = os.environ.get("PPT_JOURNAL_SYNC", "").lower() in ("1", "true", "yes")
+    return OperationJournal(journal_dir, presentations, change_tracker, MUTATING_TOOLS, checkpoint_interval, sync)
+
+
+# Journal of mutating tool calls and checkpoints, or None if PPT_JOURNAL_DIR is not set
+operation_journal = create_operation_journal()
+
+# Tool name -> registered function, for replaying the journal and counting the tools
+tool_functions = {}
+
+# Category get_server_info lists the tools of each module under; other modules are "Specialized Features"
+TOOL_CATEGORIES = {
+    "tools.presentation_tools": "Presentation Management",
+    "tools.content_tools": "Content Management",
+    "tools.template_tools": "Template Operations",
+    "tools.structural_tools": "Structural Elements",
+    "tools.professional_tools": "Professional Design",
+    "tools.search_tools": "Search and Validation",
+    "tools.validation_tools": "Search and Validation",
+    "tools.transfer_tools": "File Transfer",
+    "tools.snapshot_tools": "Snapshots",
+    __name__: "Server and Journal",
+}
+
+
+def record_tool_mutation(tool_name: str, arguments: Dict, result: Any) -> None:
+    """Record the change a mutating tool call made in the change tracker."""
+    scope = MUTATING_TOOLS[tool_name]
+    operation = arguments.get("operation")
+    if (tool_name, operation) in MUTATION_SCOPE_OVERRIDES:
+        scope = MUTATION_SCOPE_OVERRIDES[(tool_name, operation)]
+    if scope is None:
+        return
+
+    pres_id = arguments.get("presentation_id") or get_current_presentation_id()
+    slide_index = arguments.get("slide_index")
+    shape_index = None
+    if scope == "shape":
+        if isinstance(result, dict) and isinstance(result.get("shape_index"), int):
+            shape_index = result["shape_index"]
+        else:
+            shape_index = arguments.get("shape_index")
+
+    # Translate id and name addressing back to positions; if that fails the
+    # tracker widens the scope of the change
+    addressed_shape = scope == "shape" and shape_index is None and (
+        arguments.get("shape_id") is not None or arguments.get("shape_name") is not None
+    )
+    if pres_id in presentations and (arguments.get("slide_id") is not None or addressed_shape):
+        try:
+            slide_index, slide = address_index.resolve_slide(pres_id, slide_index, arguments.get("slide_id"))
+            if addressed_shape:
+                shape_index, _ = address_index.resolve_shape(
+                    pres_id, slide, shape_id=arguments.get("shape_id"), shape_name=arguments.get("shape_name")
+                )
+        except ValueError:
+            pass
+    change_tracker.record(pres_id, scope, slide_index, shape_index)
+
+
+def journal_tool_call(tool_name: str, arguments: Dict, result: Any) -> None:
+    """Append a tool call to the operation journal, or checkpoint what it changed."""
+    pres_id = arguments.get("presentation_id") or get_current_presentation_id()
+    try:
+        operation_journal.after_call(tool_name, arguments, pres_id, result)
+    except Exception as e:
+        # The call itself succeeded; report that it may not survive a restart
+        if isinstance(result, dict):
+            result["journal_error"] = f"Failed to journal the call: {str(e)}"
+
+
+def track_mutations(tool_decorator):
+    """Wrap app.tool so that tools in MUTATING_TOOLS record their changes after running,
+    and every tool call is journaled if the operation journal is enabled."""
+
+    def decorator(*args, **kwargs):
+        register = tool_decorator(*args, **kwargs)
+
+        def wrap(fn):
+            if fn.__name__ not in MUTATING_TOOLS and operation_journal is None:
+                tool_functions[fn.__name__] = fn
+                return register(fn)
+
+            def after_call(fn_kwargs, result):
+                # A call that raised or was rejected changed nothing worth recording
+                if isinstance(result, dict) and "error" in result:
+                    return
+                if fn.__name__ in MUTATING_TOOLS:
+                    record_tool_mutation(fn.__name__, fn_kwargs, result)
+                if operation_journal is not None:
+                    journal_tool_call(fn.__name__, fn_kwargs, result)
+
+            if inspect.iscoroutinefunction(fn):
+                @functools.wraps(fn)
+                async def wrapper(*fn_args, **fn_kwargs):
+                    result = await fn(*fn_args, **fn_kwargs)
+                    after_call(fn_kwargs, result)
+                    return result
+            else:
+                @functools.wraps(fn)
+                def wrapper(*fn_args, **fn_kwargs):
+                    result = fn(*fn_args, **fn_kwargs)
+                    after_call(fn_kwargs, result)
+                    return result
+
+            tool_functions[fn.__name__] = wrapper
+            return register(wrapper)
+
+        return wrap
+
+    return decorator
+
+
+app.tool = track_mutations(app.tool)
+
+# Full-text index over all loaded presentations, kept current from the change tracker
+search_index = PresentationSearchIndex(presentations, change_tracker)
+
+# Parsed templates for create_presentation_from_template
+template_pool = TemplatePool()
+
+# Template files in the template search directories, rescanned when a directory changes
+template_catalog = TemplateCatalog(get_template_search_directories)
+
+
 # ---- Register Tools ----
 
 # Create presentation manager wrapper
@@ -260,8 +477,11 @@ def open_presentation_wrapper(original_func):
 
 
 # Register all tool modules
+# Files uploaded in chunks; their upload:// handles are accepted wherever a path is
+upload_store = UploadStore()
+
 register_presentation_tools(
-    app, presentations, get_current_presentation_id, get_template_search_directories
+    app, presentations, get_current_presentation_id, template_catalog, template_pool, change_tracker, upload_store
 )
 
 register_content_tools(
@@ -273,6 +493,9 @@ register_content_tools(
     is_non_negative,
     is_in_range,
     is_valid_rgb,
+    change_tracker,
+    address_index,
+    upload_store,
 )
 
 register_structural_tools(
@@ -285,11 +508,12 @@ register_structural_tools(
     is_in_range,
     is_valid_rgb,
     add_shape_direct,
+    address_index,
 )
 
-register_professional_tools(app, presentations, get_current_presentation_id)
+register_professional_tools(app, presentations, get_current_presentation_id, address_index, upload_store)
 
-register_template_tools(app, presentations, get_current_presentation_id)
+register_template_tools(app, presentations, get_current_presentation_id, change_tracker, upload_store)
 
 register_hyperlink_tools(
     app,
@@ -300,6 +524,7 @@ register_hyperlink_tools(
     is_non_negative,
     is_in_range,
     is_valid_rgb,
+    address_index,
 )
 
 register_chart_tools(
@@ -311,6 +536,7 @@ register_chart_tools(
     is_non_negative,
     is_in_range,
     is_valid_rgb,
+    address_index,
 )
 
 
@@ -323,6 +549,7 @@ register_connector_tools(
     is_non_negative,
     is_in_range,
     is_valid_rgb,
+    address_index,
 )
 
 register_master_tools(
@@ -347,6 +574,22 @@ register_transition_tools(
     is_valid_rgb,
 )
 
+register_search_tools(app, presentations, search_index)
+
+register_validation_tools(app, presentations, get_current_presentation_id, change_tracker)
+
+# Presentations serialized in memory, waiting to be downloaded by the client
+download_store = DownloadStore()
+
+register_transfer_tools(app, presentations, get_current_presentation_id, download_store, upload_store)
+
+# Bounded undo history of every loaded presentation
+snapshot_history = SnapshotHistory(presentations, change_tracker)
+
+register_snapshot_tools(app, presentations, get_current_presentation_id, snapshot_history)
+
+_mark_startup_phase("register tools")
+
 
 # ---- Additional Utility Tools ----
 
@@ -387,26 +630,27 @@ def switch_presentation(presentation_id: str) -> Dict:
     }
 
 
+def count_tools_by_category() -> Dict[str, int]:
+    """Number of registered tools in each TOOL_CATEGORIES category, in registration order."""
+    counts: Dict[str, int] = {}
+    for fn in tool_functions.values():
+        category = TOOL_CATEGORIES.get(fn.__module__, "Specialized Features")
+        counts[category] = counts.get(category, 0) + 1
+    return counts
+
+
 @app.tool()
 def get_server_info() -> Dict:
     """Get information about the MCP server."""
     return {
         "name": "PowerPoint MCP Server - Enhanced Edition",
         "version": "2.1.0",
-        "total_tools": 32,  # Organized into 11 specialized modules
+        "total_tools": len(tool_functions),
         "loaded_presentations": len(presentations),
         "current_presentation": current_presentation_id,
-        "features": [
-            "Presentation Management (7 tools)",
-            "Content Management (6 tools)",
-            "Template Operations (7 tools)",
-            "Structural Elements (4 tools)",
-            "Professional Design (3 tools)",
-            "Specialized Features (5 tools)",
-        ],
+        "features": [f"{category} ({count} tools)" for category, count in count_tools_by_category().items()],
         "improvements": [
-            "32 specialized tools organized into 11 focused modules",
-            "68+ utility functions across 7 organized utility modules",
+            f"{len(tool_functions)} specialized tools organized into focused modules",
             "Enhanced parameter handling and validation",
             "Unified operation interfaces with comprehensive coverage",
             "Advanced template system with auto-generation capabilities",
@@ -429,8 +673,82 @@ def get_server_info() -> Dict:
     }
 
 
+@app.tool()
+def get_journal_status() -> Dict:
+    """Get the state of the operation journal that lets presentations survive a server restart."""
+    if operation_journal is None:
+        return {
+            "enabled": False,
+            "message": "The operation journal is disabled; set PPT_JOURNAL_DIR to enable it"
+        }
+    return {
+        "enabled": True,
+        **operation_journal.get_stats(),
+        "last_recovery": journal_recovery
+    }
+
+
+# ---- Crash Recovery ----
+
+
+def replay_tool_call(tool_name: str, arguments: Dict) -> Any:
+    """Run a journaled tool call again while recovering the store."""
+    return tool_functions[tool_name](**arguments)
+
+
+# Presentations rebuilt from the journal at startup
+journal_recovery = None
+
+
+def recover_journal() -> None:
+    """
+    Rebuild the store from the operation journal before serving, once.
+
+    Called from main() rather than at import: worker processes started by
+    the forkserver or spawn method import this module again, and must not
+    replay the journal or write checkpoints.
+    """
+    global journal_recovery
+    if operation_journal is None or journal_recovery is not None:
+        return
+    journal_recovery = operation_journal.recover(replay_tool_call)
+    recovered_ids = [entry["presentation_id"] for entry in journal_recovery["presentations"] if "error" not in entry]
+    if recovered_ids:
+        set_current_presentation_id(recovered_ids[-1])
+    _mark_startup_phase("recover journal")
+
+
+# ---- Startup Profiling ----
+
+# Dependencies that are imported on first use rather than at startup
+DEFERRED_MODULES = ["fontTools.ttLib", "fontTools.subset", "PIL.ImageEnhance", "pptx.chart.data"]
+
+
+def print_startup_profile() -> None:
+    """Print where startup time went to stderr (stdout carries the stdio transport)."""
+    import asyncio
+    
+    # The first request a client sends after initializing is the tool listing
+    start = time.perf_counter()
+    tool_count = len(asyncio.run(app.list_tools()))
+    first_response = time.perf_counter() - start
+    
+    lines = ["Startup profile:"]
+    previous = _startup_time
+    for name, timestamp in _startup_phases:
+        lines.append(f"  {name:<36}{(timestamp - previous) * 1000:9.1f} ms")
+        previous = timestamp
+    lines.append(f"  {'list tools (' + str(tool_count) + ' tools)':<36}{first_response * 1000:9.1f} ms")
+    lines.append(f"  {'time to first response':<36}{(previous - _startup_time + first_response) * 1000:9.1f} ms")
+    for module in DEFERRED_MODULES:
+        state = "loaded" if module in sys.modules else "deferred"
+        lines.append(f"  {module:<36}{state:>12}")
+    print("\n".join(lines), file=sys.stderr)
+
+
 # ---- Main Function ----
 def main(transport: str = "stdio", port: int = 8000, host: str = "127.0.0.1"):
+    recover_journal()
     if transport == "http":
         import asyncio
 
@@ -485,5 +803,14 @@ if __name__ == "__main__":
         help="Host to bind the server to (default: 127.0.0.1)",
     )
 
+    parser.add_argument(
+        "--profile-startup",
+        action="store_true",
+        help="Print a breakdown of startup time to stderr before serving",
+    )
+
     args = parser.parse_args()
+    recover_journal()
+    if args.profile_startup:
+        print_startup_profile()
     main(args.transport, args.port, args.host)
@@ -13,6 +13,10 @@ from .chart_tools import register_chart_tools
 from .connector_tools import register_connector_tools
 from .master_tools import register_master_tools
 from .transition_tools import register_transition_tools
+from .search_tools import register_search_tools
+from .validation_tools import register_validation_tools
+from .transfer_tools import register_transfer_tools
+from .snapshot_tools import register_snapshot_tools
 
 __all__ = [
     "register_presentation_tools",
@@ -24,5 +28,9 @@ __all__ = [
     "register_chart_tools",
     "register_connector_tools",
     "register_master_tools",
-    "register_transition_tools"
+    "register_transition_tools",
+    "register_search_tools",
+    "register_validation_tools",
+    "register_transfer_tools",
+    "register_snapshot_tools"
 ]
\ No newline at end of file
@@ -4,18 +4,21 @@ Implements advanced chart data manipulation capabilities.
 """
 
 from typing import Dict, List, Optional, Any
-from pptx.chart.data import ChartData
 
 def register_chart_tools(app, presentations, get_current_presentation_id, validate_parameters, 
-                          is_positive, is_non_negative, is_in_range, is_valid_rgb):
+                          is_positive, is_non_negative, is_in_range, is_valid_rgb, address_index):
     """Register chart data management tools with the FastMCP app."""
     
     @app.tool()
     def update_chart_data(
-        slide_index: int,
-        shape_index: int,
+        slide_index: Optional[int] = None,
+        shape_index: Optional[int] = None,
+        *,
         categories: List[str],
         series_data: List[Dict],
+        slide_id: Optional[int] = None,
+        shape_id: Optional[int] = None,
+        shape_name: Optional[str] = None,
         presentation_id: str = None
     ) -> Dict:
         """
@@ -26,6 +29,9 @@ def register_chart_tools(app, presentations, get_current_presentation_id, valida
             shape_index: Index of the chart shape (0-based)
             categories: List of category names
             series_data: List of dictionaries with 'name' and 'values' keys
+            slide_id: Stable slide id, instead of slide_index
+            shape_id: Stable shape id, instead of shape_index
+            shape_name: Unique shape name on the slide, instead of shape_index
             presentation_id: Optional presentation ID (uses current if not provided)
             
         Returns:
@@ -37,19 +43,12 @@ def register_chart_tools(app, presentations, get_current_presentation_id, valida
             if pres_id not in presentations:
                 return {"error": "Presentation not found"}
             
-            pres = presentations[pres_id]
-            
-            # Validate slide index
-            if not (0 <= slide_index < len(pres.slides)):
-                return {"error": f"Slide index {slide_index} out of range"}
-            
-            slide = pres.slides[slide_index]
-            
-            # Validate shape index
-            if not (0 <= shape_index < len(slide.shapes)):
-                return {"error": f"Shape index {shape_index} out of range"}
-            
-            shape = slide.shapes[shape_index]
+            # Resolve slide and shape
+            try:
+                slide_index, slide = address_index.resolve_slide(pres_id, slide_index, slide_id)
+                shape_index, shape = address_index.resolve_shape(pres_id, slide, shape_index, shape_id, shape_name)
+            except ValueError as e:
+                return {"error": str(e)}
             
             # Check if shape is a chart
             if not hasattr(shape, 'has_chart') or not shape.has_chart:
@@ -57,6 +56,8 @@ def register_chart_tools(app, presentations, get_current_presentation_id, valida
             
             chart = shape.chart
             
+            from pptx.chart.data import ChartData
+            
             # Create new ChartData
             chart_data = ChartData()
             chart_data.categories = categories
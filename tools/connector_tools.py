@@ -9,12 +9,13 @@ from pptx.enum.shapes import MSO_CONNECTOR
 from pptx.dml.color import RGBColor
 
 def register_connector_tools(app, presentations, get_current_presentation_id, validate_parameters, 
-                          is_positive, is_non_negative, is_in_range, is_valid_rgb):
+                          is_positive, is_non_negative, is_in_range, is_valid_rgb, address_index):
     """Register connector tools with the FastMCP app."""
     
     @app.tool()
     def add_connector(
-        slide_index: int,
+        slide_index: Optional[int] = None,
+        *,
         connector_type: str,
         start_x: float,
         start_y: float,
@@ -22,6 +23,7 @@ def register_connector_tools(app, presentations, get_current_presentation_id, va
         end_y: float,
         line_width: float = 1.0,
         color: List[int] = None,
+        slide_id: Optional[int] = None,
         presentation_id: str = None
     ) -> Dict:
         """
@@ -36,6 +38,7 @@ def register_connector_tools(app, presentations, get_current_presentation_id, va
             end_y: Ending Y coordinate in inches
             line_width: Width of the connector line in points
             color: RGB color as [r, g, b] list
+            slide_id: Stable slide id, instead of slide_index
             presentation_id: Optional presentation ID (uses current if not provided)
             
         Returns:
@@ -47,13 +50,11 @@ def register_connector_tools(app, presentations, get_current_presentation_id, va
             if pres_id not in presentations:
                 return {"error": "Presentation not found"}
             
-            pres = presentations[pres_id]
-            
-            # Validate slide index
-            if not (0 <= slide_index < len(pres.slides)):
-                return {"error": f"Slide index {slide_index} out of range"}
-            
-            slide = pres.slides[slide_index]
+            # Resolve slide
+            try:
+                slide_index, slide = address_index.resolve_slide(pres_id, slide_index, slide_id)
+            except ValueError as e:
+                return {"error": str(e)}
             
             # Map connector types
             connector_map = {
@@ -84,7 +85,8 @@ def register_connector_tools(app, presentations, get_current_presentation_id, va
                 "connector_type": connector_type,
                 "start_point": [start_x, start_y],
                 "end_point": [end_x, end_y],
-                "shape_index": len(slide.shapes) - 1
+                "shape_index": len(slide.shapes) - 1,
+                "shape_id": slide.shapes[-1].shape_id
             }
             
         except Exception as e:
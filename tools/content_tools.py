@@ -3,14 +3,18 @@ Content management tools for PowerPoint MCP Server.
 Handles slides, text, images, and content manipulation.
 """
 from typing import Dict, List, Optional, Any, Union
-from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp import Context, FastMCP
 import utils as ppt_utils
+from utils.change_utils import changed_shape_indexes
+from utils.transfer_utils import UPLOAD_SCHEME
+import anyio
 import tempfile
 import base64
+import glob
 import os
 
 
-def register_content_tools(app: FastMCP, presentations: Dict, get_current_presentation_id, validate_parameters, is_positive, is_non_negative, is_in_range, is_valid_rgb):
+def register_content_tools(app: FastMCP, presentations: Dict, get_current_presentation_id, validate_parameters, is_positive, is_non_negative, is_in_range, is_valid_rgb, change_tracker, address_index, upload_store):
     """Register content management tools with the FastMCP app"""
     
     @app.tool()
@@ -61,6 +65,7 @@ def register_content_tools(app: FastMCP, presentations: Dict, get_current_presen
             return {
                 "message": f"Added slide {slide_index} with layout {layout_index}",
                 "slide_index": slide_index,
+                "slide_id": slide.slide_id,
                 "layout_name": layout.name if hasattr(layout, 'name') else f"Layout {layout_index}"
             }
         except Exception as e:
@@ -69,7 +74,11 @@ def register_content_tools(app: FastMCP, presentations: Dict, get_current_presen
             }
 
     @app.tool()
-    def get_slide_info(slide_index: int, presentation_id: Optional[str] = None) -> Dict:
+    def get_slide_info(
+        slide_index: Optional[int] = None,
+        slide_id: Optional[int] = None,
+        presentation_id: Optional[str] = None
+    ) -> Dict:
         """Get information about a specific slide."""
         pres_id = presentation_id if presentation_id is not None else get_current_presentation_id()
         
@@ -78,14 +87,10 @@ def register_content_tools(app: FastMCP, presentations: Dict, get_current_presen
                 "error": "No presentation is currently loaded or the specified ID is invalid"
             }
         
-        pres = presentations[pres_id]
-        
-        if slide_index < 0 or slide_index >= len(pres.slides):
-            return {
-                "error": f"Invalid slide index: {slide_index}. Available slides: 0-{len(pres.slides) - 1}"
-            }
-        
-        slide = pres.slides[slide_index]
+        try:
+            slide_index, slide = address_index.resolve_slide(pres_id, slide_index, slide_id)
+        except ValueError as e:
+            return {"error": str(e)}
         
         try:
             return ppt_utils.get_slide_info(slide, slide_index)
@@ -95,7 +100,11 @@ def register_content_tools(app: FastMCP, presentations: Dict, get_current_presen
             }
 
     @app.tool()
-    def extract_slide_text(slide_index: int, presentation_id: Optional[str] = None) -> Dict:
+    def extract_slide_text(
+        slide_index: Optional[int] = None,
+        slide_id: Optional[int] = None,
+        presentation_id: Optional[str] = None
+    ) -> Dict:
         """Extract all text content from a specific slide."""
         pres_id = presentation_id if presentation_id is not None else get_current_presentation_id()
         
@@ -104,17 +113,13 @@ def register_content_tools(app: FastMCP, presentations: Dict, get_current_presen
                 "error": "No presentation is currently loaded or the specified ID is invalid"
             }
         
-        pres = presentations[pres_id]
-        
-        if slide_index < 0 or slide_index >= len(pres.slides):
-            return {
-                "error": f"Invalid slide index: {slide_index}. Available slides: 0-{len(pres.slides) - 1}"
-            }
-        
-        slide = pres.slides[slide_index]
+        try:
+            slide_index, slide = address_index.resolve_slide(pres_id, slide_index, slide_id)
+        except ValueError as e:
+            return {"error": str(e)}
         
         try:
-            result = ppt_utils.extract_slide_text_content(slide)
+            result = ppt_utils.extract_slide_text_content_xml(slide._element)
             result["slide_index"] = slide_index
             return result
         except Exception as e:
@@ -141,9 +146,7 @@ def register_content_tools(app: FastMCP, presentations: Dict, get_current_presen
             slides_with_titles = 0
             all_presentation_text = []
             
-            for slide_index, slide in enumerate(pres.slides):
-                slide_text_result = ppt_utils.extract_slide_text_content(slide)
-                
+            for slide_index, slide, slide_text_result in ppt_utils.iter_slide_text_content(pres):
                 if slide_text_result["success"]:
                     slide_data = {
                         "slide_index": slide_index,
@@ -196,13 +199,15 @@ def register_content_tools(app: FastMCP, presentations: Dict, get_current_presen
             }
 
     @app.tool()
-    def populate_placeholder(
-        slide_index: int,
-        placeholder_idx: int,
-        text: str,
+    def extract_presentation_text_page(
+        offset: int = 0,
+        limit: int = 20,
+        fields: str = "all",  # "all", "titles", "text", "tables"
+        include_slide_info: bool = False,
+        max_chars: Optional[int] = None,
         presentation_id: Optional[str] = None
     ) -> Dict:
-        """Populate a placeholder with text."""
+        """Extract text from a page of slides. Use next_offset to continue reading large presentations."""
         pres_id = presentation_id if presentation_id is not None else get_current_presentation_id()
         
         if pres_id is None or pres_id not in presentations:
@@ -211,13 +216,128 @@ def register_content_tools(app: FastMCP, presentations: Dict, get_current_presen
             }
         
         pres = presentations[pres_id]
+        total_slides = len(pres.slides)
         
-        if slide_index < 0 or slide_index >= len(pres.slides):
+        if offset < 0 or (offset >= total_slides and total_slides > 0):
             return {
-                "error": f"Invalid slide index: {slide_index}. Available slides: 0-{len(pres.slides) - 1}"
+                "error": f"Invalid offset: {offset}. Available slides: 0-{total_slides - 1}"
+            }
+        if limit < 1:
+            return {"error": "Parameter 'limit': must be a positive integer"}
+        if fields not in ppt_utils.TEXT_EXTRACTION_FIELDS:
+            return {
+                "error": f"Invalid fields: {fields}. Must be one of: {', '.join(ppt_utils.TEXT_EXTRACTION_FIELDS)}"
             }
         
-        slide = pres.slides[slide_index]
+        try:
+            slides_text = []
+            chars_used = 0
+            next_offset = offset
+            
+            for record in ppt_utils.iter_presentation_text(
+                pres, start=offset, stop=offset + limit,
+                fields=fields, include_slide_info=include_slide_info
+            ):
+                # Stop early once the character budget is spent, but always return at least one slide
+                record_chars = len(str(record)) if max_chars is not None else 0
+                if max_chars is not None and slides_text and chars_used + record_chars > max_chars:
+                    break
+                chars_used += record_chars
+                
+                slides_text.append(record)
+                next_offset = record["slide_index"] + 1
+            
+            has_more = next_offset < total_slides
+            return {
+                "success": True,
+                "presentation_id": pres_id,
+                "total_slides": total_slides,
+                "offset": offset,
+                "returned_slides": len(slides_text),
+                "fields": fields,
+                "slides_text": slides_text,
+                "has_more": has_more,
+                "next_offset": next_offset if has_more else None
+            }
+        except Exception as e:
+            return {
+                "error": f"Failed to extract presentation text: {str(e)}"
+            }
+
+    @app.tool()
+    def extract_text_from_files(
+        file_paths: Optional[List[str]] = None,
+        pattern: Optional[str] = None,  # glob, e.g. "archive/**/*.pptx"
+        fields: str = "all",  # "all", "titles", "text", "tables"
+        include_slide_info: bool = False,
+        max_workers: Optional[int] = None
+    ) -> Dict:
+        """Extract slide text from .pptx files on disk in parallel without loading them as presentations."""
+        paths = list(file_paths or [])
+        if pattern:
+            paths.extend(sorted(glob.glob(pattern, recursive=True)))
+        
+        try:
+            paths = [upload_store.resolve_path(path) for path in paths]
+        except (KeyError, ValueError) as e:
+            return {"error": str(e.args[0])}
+        
+        if not paths:
+            return {
+                "error": "No files to extract. Provide file_paths or a pattern that matches files"
+            }
+        
+        if max_workers is not None and max_workers < 1:
+            return {"error": "Parameter 'max_workers': must be a positive integer"}
+        if fields not in ppt_utils.TEXT_EXTRACTION_FIELDS:
+            return {
+                "error": f"Invalid fields: {fields}. Must be one of: {', '.join(ppt_utils.TEXT_EXTRACTION_FIELDS)}"
+            }
+        
+        try:
+            # Results arrive in completion order
+            results = list(ppt_utils.extract_text_from_files(
+                paths,
+                fields=fields,
+                include_slide_info=include_slide_info,
+                max_workers=max_workers
+            ))
+        except Exception as e:
+            return {
+                "error": f"Failed to extract text from files: {str(e)}"
+            }
+        
+        succeeded = sum(1 for r in results if r["success"])
+        return {
+            "message": f"Extracted text from {succeeded} of {len(paths)} files",
+            "fields": fields,
+            "total_files": len(paths),
+            "succeeded": succeeded,
+            "failed": len(results) - succeeded,
+            "results": results
+        }
+
+    @app.tool()
+    def populate_placeholder(
+        slide_index: Optional[int] = None,
+        *,
+        placeholder_idx: int,
+        text: str,
+        slide_id: Optional[int] = None,
+        presentation_id: Optional[str] = None
+    ) -> Dict:
+        """Populate a placeholder with text."""
+        pres_id = presentation_id if presentation_id is not None else get_current_presentation_id()
+        
+        if pres_id is None or pres_id not in presentations:
+            return {
+                "error": "No presentation is currently loaded or the specified ID is invalid"
+            }
+        
+        try:
+            slide_index, slide = address_index.resolve_slide(pres_id, slide_index, slide_id)
+        except ValueError as e:
+            return {"error": str(e)}
         
         try:
             ppt_utils.populate_placeholder(slide, placeholder_idx, text)
@@ -231,9 +351,11 @@ def register_content_tools(app: FastMCP, presentations: Dict, get_current_presen
 
     @app.tool()
     def add_bullet_points(
-        slide_index: int,
+        slide_index: Optional[int] = None,
+        *,
         placeholder_idx: int,
         bullet_points: List[str],
+        slide_id: Optional[int] = None,
         presentation_id: Optional[str] = None
     ) -> Dict:
         """Add bullet points to a placeholder."""
@@ -244,14 +366,10 @@ def register_content_tools(app: FastMCP, presentations: Dict, get_current_presen
                 "error": "No presentation is currently loaded or the specified ID is invalid"
             }
         
-        pres = presentations[pres_id]
-        
-        if slide_index < 0 or slide_index >= len(pres.slides):
-            return {
-                "error": f"Invalid slide index: {slide_index}. Available slides: 0-{len(pres.slides) - 1}"
-            }
-        
-        slide = pres.slides[slide_index]
+        try:
+            slide_index, slide = address_index.resolve_slide(pres_id, slide_index, slide_id)
+        except ValueError as e:
+            return {"error": str(e)}
         
         try:
             placeholder = slide.placeholders[placeholder_idx]
@@ -266,7 +384,8 @@ def register_content_tools(app: FastMCP, presentations: Dict, get_current_presen
 
     @app.tool()
     def manage_text(
-        slide_index: int,
+        slide_index: Optional[int] = None,
+        *,
         operation: str,  # "add", "format", "validate", "format_runs"
         left: float = 1.0,
         top: float = 1.0,
@@ -290,6 +409,9 @@ def register_content_tools(app: FastMCP, presentations: Dict, get_current_presen
         validation_only: bool = False,
         min_font_size: int = 8,
         max_font_size: int = 72,
+        slide_id: Optional[int] = None,
+        shape_id: Optional[int] = None,
+        shape_name: Optional[str] = None,
         presentation_id: Optional[str] = None
     ) -> Dict:
         """Unified text management tool for adding, formatting, validating text, and formatting multiple text runs."""
@@ -300,14 +422,10 @@ def register_content_tools(app: FastMCP, presentations: Dict, get_current_presen
                 "error": "No presentation is currently loaded or the specified ID is invalid"
             }
         
-        pres = presentations[pres_id]
-        
-        if slide_index < 0 or slide_index >= len(pres.slides):
-            return {
-                "error": f"Invalid slide index: {slide_index}. Available slides: 0-{len(pres.slides) - 1}"
-            }
-        
-        slide = pres.slides[slide_index]
+        try:
+            slide_index, slide = address_index.resolve_slide(pres_id, slide_index, slide_id)
+        except ValueError as e:
+            return {"error": str(e)}
         
         # Validate parameters
         validations = {}
@@ -342,17 +460,17 @@ def register_content_tools(app: FastMCP, presentations: Dict, get_current_presen
                 return {
                     "message": f"Added text box to slide {slide_index}",
                     "shape_index": len(slide.shapes) - 1,
+                    "shape_id": slide.shapes[-1].shape_id,
                     "text": text
                 }
             
             elif operation == "format":
                 # Format existing text shape
-                if shape_index is None or shape_index < 0 or shape_index >= len(slide.shapes):
-                    return {
-                        "error": f"Invalid shape index for formatting: {shape_index}. Available shapes: 0-{len(slide.shapes) - 1}"
-                    }
+                try:
+                    shape_index, shape = address_index.resolve_shape(pres_id, slide, shape_index, shape_id, shape_name)
+                except ValueError as e:
+                    return {"error": str(e)}
                 
-                shape = slide.shapes[shape_index]
                 ppt_utils.format_text_advanced(
                     shape,
                     font_size=font_size,
@@ -371,41 +489,51 @@ def register_content_tools(app: FastMCP, presentations: Dict, get_current_presen
             
             elif operation == "validate":
                 # Validate text fit
-                if shape_index is None or shape_index < 0 or shape_index >= len(slide.shapes):
-                    return {
-                        "error": f"Invalid shape index for validation: {shape_index}. Available shapes: 0-{len(slide.shapes) - 1}"
-                    }
+                try:
+                    shape_index, shape = address_index.resolve_shape(pres_id, slide, shape_index, shape_id, shape_name)
+                except ValueError as e:
+                    return {"error": str(e)}
                 
                 validation_result = ppt_utils.validate_text_fit(
-                    slide.shapes[shape_index],
+                    shape,
                     text_content=text or None,
                     font_size=font_size or 12
                 )
                 
                 if not validation_only and validation_result.get("needs_optimization"):
-                    # Apply automatic fixes
+                    # Apply automatic fixes, skipping shapes unchanged since the last fix
+                    # of this slide with the same font range
+                    consumer = ("validate_slide", slide.slide_id, min_font_size, max_font_size)
+                    shape_indexes = changed_shape_indexes(
+                        slide, change_tracker.collect(consumer, pres_id), slide.slide_id
+                    )
                     fix_result = ppt_utils.validate_and_fix_slide(
                         slide,
                         auto_fix=True,
                         min_font_size=min_font_size,
-                        max_font_size=max_font_size
+                        max_font_size=max_font_size,
+                        shape_indexes=shape_indexes
                     )
+                    if shape_indexes is not None:
+                        fix_result["shapes_skipped_unchanged"] = len(slide.shapes) - len(shape_indexes)
+                    for fixed_index in fix_result["fixed_shape_indexes"]:
+                        change_tracker.record(pres_id, "shape", slide_index, fixed_index)
+                    # The fixes are this consumer's own; don't revisit them next time
+                    change_tracker.collect(consumer, pres_id)
                     validation_result.update(fix_result)
                 
                 return validation_result
             
             elif operation == "format_runs":
                 # Format multiple text runs with different formatting
-                if shape_index is None or shape_index < 0 or shape_index >= len(slide.shapes):
-                    return {
-                        "error": f"Invalid shape index for format_runs: {shape_index}. Available shapes: 0-{len(slide.shapes) - 1}"
-                    }
+                try:
+                    shape_index, shape = address_index.resolve_shape(pres_id, slide, shape_index, shape_id, shape_name)
+                except ValueError as e:
+                    return {"error": str(e)}
                 
                 if not text_runs:
                     return {"error": "text_runs parameter is required for format_runs operation"}
                 
-                shape = slide.shapes[shape_index]
-                
                 # Check if shape has text
                 if not hasattr(shape, 'text_frame') or not shape.text_frame:
                     return {"error": "Shape does not contain text"}
@@ -473,9 +601,10 @@ def register_content_tools(app: FastMCP, presentations: Dict, get_current_presen
 
     @app.tool()
     def manage_image(
-        slide_index: int,
+        slide_index: Optional[int] = None,
+        *,
         operation: str,  # "add", "enhance"
-        image_source: str,  # file path or base64 string
+        image_source: str,  # file path, upload:// handle or base64 string
         source_type: str = "file",  # "file" or "base64"
         left: float = 1.0,
         top: float = 1.0,
@@ -490,6 +619,7 @@ def register_content_tools(app: FastMCP, presentations: Dict, get_current_presen
         blur_radius: float = 0,
         filter_type: Optional[str] = None,
         output_path: Optional[str] = None,
+        slide_id: Optional[int] = None,
         presentation_id: Optional[str] = None
     ) -> Dict:
         """Unified image management tool for adding and enhancing images."""
@@ -500,14 +630,16 @@ def register_content_tools(app: FastMCP, presentations: Dict, get_current_presen
                 "error": "No presentation is currently loaded or the specified ID is invalid"
             }
         
-        pres = presentations[pres_id]
-        
-        if slide_index < 0 or slide_index >= len(pres.slides):
-            return {
-                "error": f"Invalid slide index: {slide_index}. Available slides: 0-{len(pres.slides) - 1}"
-            }
+        try:
+            slide_index, slide = address_index.resolve_slide(pres_id, slide_index, slide_id)
+        except ValueError as e:
+            return {"error": str(e)}
         
-        slide = pres.slides[slide_index]
+        if source_type != "base64":
+            try:
+                image_source = upload_store.resolve_path(image_source)
+            except (KeyError, ValueError) as e:
+                return {"error": str(e.args[0])}
         
         try:
             if operation == "add":
@@ -527,7 +659,8 @@ def register_content_tools(app: FastMCP, presentations: Dict, get_current_presen
                         
                         return {
                             "message": f"Added image from base64 to slide {slide_index}",
-                            "shape_index": len(slide.shapes) - 1
+                            "shape_index": len(slide.shapes) - 1,
+                            "shape_id": slide.shapes[-1].shape_id
                         }
                     except Exception as e:
                         return {
@@ -544,6 +677,7 @@ def register_content_tools(app: FastMCP, presentations: Dict, get_current_presen
                     return {
                         "message": f"Added image to slide {slide_index}",
                         "shape_index": len(slide.shapes) - 1,
+                        "shape_id": slide.shapes[-1].shape_id,
                         "image_path": image_source
                     }
             
@@ -590,4 +724,90 @@ def register_content_tools(app: FastMCP, presentations: Dict, get_current_presen
         except Exception as e:
             return {
                 "error": f"Failed to {operation} image: {str(e)}"
-            }
\ No newline at end of file
+            }
+
+    @app.tool()
+    async def enhance_images_batch(
+        ctx: Context,
+        image_paths: Optional[List[str]] = None,
+        pattern: Optional[str] = None,  # glob, e.g. "shots/**/*.jpg"
+        style: str = "presentation",  # "presentation", "bright", "soft"
+        output_dir: Optional[str] = None,
+        max_workers: Optional[int] = None,
+        timeout_per_file: Optional[float] = None
+    ) -> Dict:
+        """Enhance many image files in parallel using a professional enhancement preset.
+        Progress is reported as each file finishes."""
+        paths = list(image_paths or [])
+        try:
+            # Uploads are named after the file the client sent, not their spool file
+            names = [
+                os.path.basename(upload_store.get_file_name(path) if path.startswith(UPLOAD_SCHEME) else path)
+                for path in paths
+            ]
+            paths = [upload_store.resolve_path(path) for path in paths]
+        except (KeyError, ValueError) as e:
+            return {"error": str(e.args[0])}
+        if pattern:
+            # Matches keep their directories below the pattern's root, so a/x.jpg and b/x.jpg stay apart
+            root = pattern
+            while glob.has_magic(root):
+                root = os.path.dirname(root)
+            matches = sorted(glob.glob(pattern, recursive=True))
+            paths.extend(matches)
+            names.extend(os.path.relpath(match, root or os.curdir) for match in matches)
+        
+        if not paths:
+            return {
+                "error": "No images to enhance. Provide image_paths or a pattern that matches files"
+            }
+        
+        if max_workers is not None and max_workers < 1:
+            return {"error": "Parameter 'max_workers': must be a positive integer"}
+        if timeout_per_file is not None and timeout_per_file <= 0:
+            return {"error": "Parameter 'timeout_per_file': must be a positive number"}
+        
+        results = []
+        batch = ppt_utils.enhance_images_batch(
+            paths,
+            style=style,
+            output_dir=output_dir,
+            max_workers=max_workers,
+            timeout_per_file=timeout_per_file,
+            output_names=names
+        )
+        try:
+            # Results arrive in completion order; each is awaited in a thread so the event loop keeps serving
+            while True:
+                result = await anyio.to_thread.run_sync(next, batch, None)
+                if result is None:
+                    break
+                results.append(result)
+                if result["success"]:
+                    level, message = "info", f"Enhanced {result['image_path']} -> {result['enhanced_path']}"
+                else:
+                    level, message = "warning", f"Failed to enhance {result['image_path']}: {result['error']}"
+                try:
+                    await ctx.report_progress(len(results), len(paths), message)
+                    await ctx.log(level, message)
+                except Exception:
+                    # Progress is best effort, e.g. there is no client session outside a request
+                    pass
+        except Exception as e:
+            return {
+                "error": f"Failed to enhance images: {str(e)}"
+            }
+        finally:
+            # Stops the worker processes, also when the call is cancelled
+            with anyio.CancelScope(shield=True):
+                await anyio.to_thread.run_sync(batch.close)
+        
+        succeeded = sum(1 for r in results if r["success"])
+        return {
+            "message": f"Enhanced {succeeded} of {len(paths)} images with '{style}' style",
+            "style": style,
+            "total_images": len(paths),
+            "succeeded": succeeded,
+            "failed": len(results) - succeeded,
+            "results": results
+        }
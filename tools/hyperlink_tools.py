@@ -6,17 +6,20 @@ Implements hyperlink operations for text shapes and runs.
 from typing import Dict, List, Optional, Any
 
 def register_hyperlink_tools(app, presentations, get_current_presentation_id, validate_parameters, 
-                          is_positive, is_non_negative, is_in_range, is_valid_rgb):
+                          is_positive, is_non_negative, is_in_range, is_valid_rgb, address_index):
     """Register hyperlink management tools with the FastMCP app."""
     
     @app.tool()
     def manage_hyperlinks(
         operation: str,
-        slide_index: int,
+        slide_index: Optional[int] = None,
         shape_index: int = None,
         text: str = None, 
         url: str = None,
         run_index: int = 0,
+        slide_id: Optional[int] = None,
+        shape_id: Optional[int] = None,
+        shape_name: Optional[str] = None,
         presentation_id: str = None
     ) -> Dict:
         """
@@ -29,6 +32,9 @@ def register_hyperlink_tools(app, presentations, get_current_presentation_id, va
             text: Text to make into hyperlink (for "add" operation)
             url: URL for the hyperlink
             run_index: Index of text run within the shape (0-based)
+            slide_id: Stable slide id, instead of slide_index
+            shape_id: Stable shape id, instead of shape_index
+            shape_name: Unique shape name on the slide, instead of shape_index
             presentation_id: Optional presentation ID (uses current if not provided)
             
         Returns:
@@ -40,13 +46,11 @@ def register_hyperlink_tools(app, presentations, get_current_presentation_id, va
             if pres_id not in presentations:
                 return {"error": "Presentation not found"}
             
-            pres = presentations[pres_id]
-            
-            # Validate slide index
-            if not (0 <= slide_index < len(pres.slides)):
-                return {"error": f"Slide index {slide_index} out of range"}
-            
-            slide = pres.slides[slide_index]
+            # Resolve slide
+            try:
+                slide_index, slide = address_index.resolve_slide(pres_id, slide_index, slide_id)
+            except ValueError as e:
+                return {"error": str(e)}
             
             if operation == "list":
                 # List all hyperlinks in the slide
@@ -69,11 +73,11 @@ def register_hyperlink_tools(app, presentations, get_current_presentation_id, va
                     "hyperlinks": hyperlinks
                 }
             
-            # For other operations, validate shape index
-            if shape_index is None or not (0 <= shape_index < len(slide.shapes)):
-                return {"error": f"Shape index {shape_index} out of range"}
-            
-            shape = slide.shapes[shape_index]
+            # For other operations, resolve the shape
+            try:
+                shape_index, shape = address_index.resolve_shape(pres_id, slide, shape_index, shape_id, shape_name)
+            except ValueError as e:
+                return {"error": str(e)}
             
             # Check if shape has text
             if not hasattr(shape, 'text_frame') or not shape.text_frame:
@@ -4,11 +4,42 @@ Handles presentation creation, opening, saving, and core properties.
 """
 from typing import Dict, List, Optional, Any
 import os
+import re
 from mcp.server.fastmcp import FastMCP
 import utils as ppt_utils
 
 
-def register_presentation_tools(app: FastMCP, presentations: Dict, get_current_presentation_id, get_template_search_directories):
+# Change tracker consumer that collects the edits made since the last open or save
+INCREMENTAL_SAVE_CONSUMER = "incremental_save"
+
+
+def _parse_slide_selection(slide_indices: Optional[List[int]], slide_range: Optional[str]) -> Optional[List[int]]:
+    """
+    Combine a list of slide indices and an inclusive "first-last" range.
+
+    Returns:
+        The indices in order (range last), or None if neither is given
+
+    Raises:
+        ValueError: If the range is malformed
+    """
+    if slide_range is None:
+        return None if slide_indices is None else list(slide_indices)
+    try:
+        start, end = (int(bound) for bound in slide_range.split("-"))
+    except ValueError:
+        raise ValueError(f"Invalid slide range: '{slide_range}'. Use 'first-last', e.g. '120-130'")
+    if start > end:
+        raise ValueError(f"Invalid slide range: '{slide_range}'. The first index must not exceed the last")
+    return list(slide_indices or []) + list(range(start, end + 1))
+
+
+def _file_name_slug(name: Optional[str]) -> str:
+    """A section name reduced to characters that are safe in a file name."""
+    return re.sub(r"[^\w-]+", "_", name or "").strip("_") or "section"
+
+
+def register_presentation_tools(app: FastMCP, presentations: Dict, get_current_presentation_id, template_catalog, template_pool, change_tracker, upload_store):
     """Register presentation management tools with the FastMCP app"""
     
     @app.tool()
@@ -33,27 +64,25 @@ def register_presentation_tools(app: FastMCP, presentations: Dict, get_current_p
 
     @app.tool()
     def create_presentation_from_template(template_path: str, id: Optional[str] = None) -> Dict:
-        """Create a new PowerPoint presentation from a template file."""
-        # Check if template file exists
-        if not os.path.exists(template_path):
-            # Try to find the template by searching in configured directories
-            search_dirs = get_template_search_directories()
-            template_name = os.path.basename(template_path)
-            
-            for directory in search_dirs:
-                potential_path = os.path.join(directory, template_name)
-                if os.path.exists(potential_path):
-                    template_path = potential_path
-                    break
-            else:
-                env_path_info = f" (PPT_TEMPLATE_PATH: {os.environ.get('PPT_TEMPLATE_PATH', 'not set')})" if os.environ.get('PPT_TEMPLATE_PATH') else ""
-                return {
-                    "error": f"Template file not found: {template_path}. Searched in {', '.join(search_dirs)}{env_path_info}"
-                }
+        """Create a new PowerPoint presentation from a template file or upload:// handle."""
+        try:
+            template_path = upload_store.resolve_path(template_path)
+        except (KeyError, ValueError) as e:
+            return {"error": str(e.args[0])}
+
+        # Look the template up in the configured directories if the path does not exist
+        found_path = template_catalog.find(template_path)
+        if found_path is None:
+            search_dirs = template_catalog.directories
+            env_path_info = f" (PPT_TEMPLATE_PATH: {os.environ.get('PPT_TEMPLATE_PATH', 'not set')})" if os.environ.get('PPT_TEMPLATE_PATH') else ""
+            return {
+                "error": f"Template file not found: {template_path}. Searched in {', '.join(search_dirs)}{env_path_info}"
+            }
+        template_path = found_path
         
-        # Create presentation from template
+        # Create presentation from template; the pool parses each template file only once
         try:
-            pres = ppt_utils.create_presentation_from_template(template_path)
+            pres = template_pool.get(template_path)
         except Exception as e:
             return {
                 "error": f"Failed to create presentation from template: {str(e)}"
@@ -75,8 +104,49 @@ def register_presentation_tools(app: FastMCP, presentations: Dict, get_current_p
         }
 
     @app.tool()
-    def open_presentation(file_path: str, id: Optional[str] = None) -> Dict:
-        """Open an existing PowerPoint presentation from a file."""
+    def list_template_files(include_layouts: bool = True) -> Dict:
+        """List the template files found in the template search directories (PPT_TEMPLATE_PATH)."""
+        try:
+            templates = template_catalog.list_templates(include_layouts=include_layouts)
+        except Exception as e:
+            return {
+                "error": f"Failed to list template files: {str(e)}"
+            }
+        
+        return {
+            "templates": templates,
+            "template_count": len(templates),
+            "search_directories": template_catalog.directories
+        }
+
+    @app.tool()
+    def get_template_pool_stats() -> Dict:
+        """Get cache size, hit rate and load times of the parsed template pool."""
+        return template_pool.get_stats()
+
+    @app.tool()
+    def open_presentation(
+        file_path: str,
+        id: Optional[str] = None,
+        lazy_media: bool = False,
+        slide_indices: Optional[List[int]] = None,
+        slide_range: Optional[str] = None  # e.g. "120-130", inclusive
+    ) -> Dict:
+        """Open an existing PowerPoint presentation from a file or upload:// handle.
+        lazy_media=True keeps large images and media in the file until they are needed,
+        which makes editing very large decks cheap in memory. slide_indices or slide_range
+        load only those slides; the others stay in the file, are loaded if accessed,
+        and are saved unchanged."""
+        try:
+            file_path = upload_store.resolve_path(file_path)
+        except (KeyError, ValueError) as e:
+            return {"error": str(e.args[0])}
+
+        try:
+            slide_indices = _parse_slide_selection(slide_indices, slide_range)
+        except ValueError as e:
+            return {"error": str(e)}
+
         # Check if file exists
         if not os.path.exists(file_path):
             return {
@@ -85,7 +155,7 @@ def register_presentation_tools(app: FastMCP, presentations: Dict, get_current_p
         
         # Open the presentation
         try:
-            pres = ppt_utils.open_presentation(file_path)
+            pres = ppt_utils.open_presentation(file_path, lazy_media=lazy_media, slide_indices=slide_indices)
         except Exception as e:
             return {
                 "error": f"Failed to open presentation: {str(e)}"
@@ -97,16 +167,230 @@ def register_presentation_tools(app: FastMCP, presentations: Dict, get_current_p
         
         # Store the presentation
         presentations[id] = pres
+        # Incremental saves only need the changes made after this point
+        change_tracker.collect(INCREMENTAL_SAVE_CONSUMER, id)
         
-        return {
+        result = {
             "presentation_id": id,
             "message": f"Opened presentation from {file_path} with ID: {id}",
             "slide_count": len(pres.slides)
         }
+        if slide_indices is not None:
+            result["loaded_slide_indices"] = sorted(set(slide_indices))
+        return result
+
+    @app.tool()
+    def clone_presentation(presentation_id: Optional[str] = None, id: Optional[str] = None) -> Dict:
+        """Duplicate a loaded presentation in memory and register the copy under a new ID."""
+        pres_id = presentation_id if presentation_id is not None else get_current_presentation_id()
+        
+        if pres_id is None or pres_id not in presentations:
+            return {
+                "error": "No presentation is currently loaded or the specified ID is invalid"
+            }
+        
+        try:
+            pres = ppt_utils.clone_presentation(presentations[pres_id])
+        except Exception as e:
+            return {
+                "error": f"Failed to clone presentation: {str(e)}"
+            }
+        
+        # Generate an ID if not provided
+        if id is None:
+            id = f"presentation_{len(presentations) + 1}"
+        
+        # Store the presentation
+        presentations[id] = pres
+        
+        return {
+            "presentation_id": id,
+            "message": f"Cloned presentation {pres_id} with ID: {id}",
+            "source_presentation_id": pres_id,
+            "slide_count": len(pres.slides)
+        }
+
+    @app.tool()
+    def merge_presentations(
+        sources: List[Dict[str, Any]],
+        presentation_id: Optional[str] = None,
+        id: Optional[str] = None,
+        output_path: Optional[str] = None
+    ) -> Dict:
+        """Combine slides from several decks in one call.
+        Each source is {"file_path": ... or "presentation_id": ..., optional "slide_indices": [...]
+        and/or "slide_range": "first-last"}; without a selection all slides are taken, in the given order.
+        Slides are appended to presentation_id if given; otherwise a new presentation is created from
+        the first source, whose masters the other slides are mapped onto by layout name.
+        Identical images and media are stored once. Files are read only as far as the selected
+        slides need; output_path saves the result right away."""
+        if not sources:
+            return {"error": "No sources given"}
+        if presentation_id is not None and presentation_id not in presentations:
+            return {"error": f"Presentation not found: {presentation_id}"}
+
+        loaded = []
+        for number, source in enumerate(sources):
+            try:
+                slide_indices = _parse_slide_selection(source.get("slide_indices"), source.get("slide_range"))
+            except ValueError as e:
+                return {"error": f"Source {number}: {str(e)}"}
+
+            if source.get("presentation_id") is not None:
+                if source["presentation_id"] not in presentations:
+                    return {"error": f"Source {number}: presentation not found: {source['presentation_id']}"}
+                loaded.append((presentations[source["presentation_id"]], slide_indices, False))
+                continue
+
+            if source.get("file_path") is None:
+                return {"error": f"Source {number}: give either 'file_path' or 'presentation_id'"}
+            try:
+                file_path = upload_store.resolve_path(source["file_path"])
+            except (KeyError, ValueError) as e:
+                return {"error": f"Source {number}: {str(e.args[0])}"}
+            if not os.path.exists(file_path):
+                return {"error": f"Source {number}: file not found: {source['file_path']}"}
+            try:
+                pres = ppt_utils.open_presentation(file_path, lazy_media=True, slide_indices=slide_indices)
+            except Exception as e:
+                return {"error": f"Source {number}: failed to open presentation: {str(e)}"}
+            loaded.append((pres, slide_indices, True))
+
+        try:
+            if presentation_id is not None:
+                target = presentations[presentation_id]
+                stats = ppt_utils.merge_presentations(target, [(pres, indices) for pres, indices, _ in loaded])
+                change_tracker.record(presentation_id, "slides")
+            else:
+                # A file source was opened for this call and can become the result itself
+                first, first_indices, private = loaded[0]
+                target = first if private else ppt_utils.clone_presentation(first)
+                if first_indices is not None:
+                    ppt_utils.keep_slides(target, first_indices)
+                stats = ppt_utils.merge_presentations(target, [(pres, indices) for pres, indices, _ in loaded[1:]])
+                stats["slides_added"] = len(target.slides)
+        except ValueError as e:
+            return {"error": str(e)}
+        except Exception as e:
+            return {
+                "error": f"Failed to merge presentations: {str(e)}"
+            }
+
+        if presentation_id is None:
+            if id is None:
+                id = f"presentation_{len(presentations) + 1}"
+            presentations[id] = target
+            pres_id = id
+        else:
+            pres_id = presentation_id
+
+        result = {
+            "presentation_id": pres_id,
+            "message": f"Merged {stats['slides_added']} slides from {len(sources)} sources into {pres_id}",
+            "slide_count": len(target.slides),
+            **stats
+        }
+        if output_path is not None:
+            try:
+                result["file_path"] = ppt_utils.save_presentation(target, output_path)
+            except Exception as e:
+                result["error"] = f"Merged, but failed to save to {output_path}: {str(e)}"
+        return result
+
+    @app.tool()
+    def split_presentation(
+        output_dir: str,
+        file_path: Optional[str] = None,
+        presentation_id: Optional[str] = None,
+        slide_ranges: Optional[List[str]] = None,  # e.g. ["0-9", "10-24"], inclusive
+        by_sections: bool = False,
+        file_name_prefix: Optional[str] = None,
+        compression: Optional[str] = None,
+        max_workers: Optional[int] = None
+    ) -> Dict:
+        """Split a deck into several files in one pass, one per slide range or, with by_sections=True,
+        one per section. The source is a file or upload:// handle, or a loaded presentation.
+        Each file keeps only the masters, layouts and media its slides use; they are copied
+        without recompression and the files are written in parallel."""
+        if (slide_ranges is None) == (not by_sections):
+            return {"error": "Give either slide_ranges or by_sections=True"}
+
+        if file_path is not None:
+            try:
+                source = upload_store.resolve_path(file_path)
+            except (KeyError, ValueError) as e:
+                return {"error": str(e.args[0])}
+            if not os.path.exists(source):
+                return {"error": f"File not found: {file_path}"}
+            prefix = file_name_prefix or os.path.splitext(os.path.basename(source))[0]
+        else:
+            pres_id = presentation_id if presentation_id is not None else get_current_presentation_id()
+            if pres_id is None or pres_id not in presentations:
+                return {
+                    "error": "No presentation is currently loaded or the specified ID is invalid"
+                }
+            try:
+                source = ppt_utils.save_presentation_to_bytes(presentations[pres_id]).getvalue()
+            except Exception as e:
+                return {
+                    "error": f"Failed to serialize presentation: {str(e)}"
+                }
+            prefix = file_name_prefix or pres_id
+
+        policy = None
+        if compression is not None:
+            try:
+                policy = ppt_utils.ZipCompressionPolicy.from_preset(compression)
+            except ValueError as e:
+                return {"error": str(e)}
+
+        try:
+            if by_sections:
+                sections = [section for section in ppt_utils.read_package_sections(source) if section["slide_indices"]]
+                if not sections:
+                    return {"error": "The presentation has no sections with slides"}
+                slide_groups = [section["slide_indices"] for section in sections]
+                file_names = [
+                    f"{prefix}_{number + 1:02d}_{_file_name_slug(section['name'])}.pptx"
+                    for number, section in enumerate(sections)
+                ]
+            else:
+                slide_groups = [_parse_slide_selection(None, slide_range) for slide_range in slide_ranges]
+                file_names = [f"{prefix}_{number + 1:02d}.pptx" for number in range(len(slide_ranges))]
+            if not slide_groups:
+                return {"error": "No slide ranges given"}
+
+            os.makedirs(output_dir, exist_ok=True)
+            outputs = ppt_utils.split_package(
+                source, slide_groups, [os.path.join(output_dir, name) for name in file_names], policy, max_workers
+            )
+        except ValueError as e:
+            return {"error": str(e)}
+        except Exception as e:
+            return {
+                "error": f"Failed to split presentation: {str(e)}"
+            }
+
+        if by_sections:
+            for output, section in zip(outputs, sections):
+                output["section"] = section["name"]
+        return {
+            "message": f"Split into {len(outputs)} files in {output_dir}",
+            "outputs": outputs
+        }
 
     @app.tool()
-    def save_presentation(file_path: str, presentation_id: Optional[str] = None) -> Dict:
-        """Save a presentation to a file."""
+    def save_presentation(
+        file_path: str,
+        presentation_id: Optional[str] = None,
+        incremental: bool = False,
+        compression: Optional[str] = None,
+        compression_level: Optional[int] = None
+    ) -> Dict:
+        """Save a presentation to a file.
+        With incremental=True, parts unchanged since the last open or save are copied from that file.
+        compression: 'fast', 'balanced' or 'smallest'; the first two store already-compressed media
+        and deflate large parts in parallel. compression_level (0-9) overrides the XML deflate level."""
         # Use the specified presentation or the current one
         pres_id = presentation_id if presentation_id is not None else get_current_presentation_id()
         
@@ -115,12 +399,29 @@ def register_presentation_tools(app: FastMCP, presentations: Dict, get_current_p
                 "error": "No presentation is currently loaded or the specified ID is invalid"
             }
         
+        policy = None
+        if compression is not None or compression_level is not None:
+            try:
+                policy = ppt_utils.ZipCompressionPolicy.from_preset(compression or "balanced", compression_level)
+            except ValueError as e:
+                return {"error": str(e)}
+        
         # Save the presentation
         try:
-            saved_path = ppt_utils.save_presentation(presentations[pres_id], file_path)
+            # Only mark the changes as saved once the file is written; a failed
+            # save must leave them for the next incremental save
+            changes = change_tracker.collect(INCREMENTAL_SAVE_CONSUMER, pres_id, advance=False)
+            if incremental:
+                result = ppt_utils.save_presentation_incremental(presentations[pres_id], file_path, changes, policy)
+                saved_path = result.pop("file_path")
+            else:
+                saved_path = ppt_utils.save_presentation(presentations[pres_id], file_path, policy)
+                result = {}
+            change_tracker.collect(INCREMENTAL_SAVE_CONSUMER, pres_id)
             return {
                 "message": f"Presentation saved to {saved_path}",
-                "file_path": saved_path
+                "file_path": saved_path,
+                **result
             }
         except Exception as e:
             return {
@@ -151,24 +452,20 @@ def register_presentation_tools(app: FastMCP, presentations: Dict, get_current_p
     @app.tool()
     def get_template_file_info(template_path: str) -> Dict:
         """Get information about a template file including layouts and properties."""
-        # Check if template file exists
-        if not os.path.exists(template_path):
-            # Try to find the template by searching in configured directories
-            search_dirs = get_template_search_directories()
-            template_name = os.path.basename(template_path)
-            
-            for directory in search_dirs:
-                potential_path = os.path.join(directory, template_name)
-                if os.path.exists(potential_path):
-                    template_path = potential_path
-                    break
-            else:
-                return {
-                    "error": f"Template file not found: {template_path}. Searched in {', '.join(search_dirs)}"
-                }
+        try:
+            template_path = upload_store.resolve_path(template_path)
+        except (KeyError, ValueError) as e:
+            return {"error": str(e.args[0])}
+
+        # Look the template up in the configured directories if the path does not exist
+        found_path = template_catalog.find(template_path)
+        if found_path is None:
+            return {
+                "error": f"Template file not found: {template_path}. Searched in {', '.join(template_catalog.directories)}"
+            }
         
         try:
-            return ppt_utils.get_template_info(template_path)
+            return ppt_utils.get_template_info(found_path)
         except Exception as e:
             return {
                 "error": f"Failed to get template info: {str(e)}"
@@ -7,7 +7,7 @@ from mcp.server.fastmcp import FastMCP
 import utils as ppt_utils
 
 
-def register_professional_tools(app: FastMCP, presentations: Dict, get_current_presentation_id):
+def register_professional_tools(app: FastMCP, presentations: Dict, get_current_presentation_id, address_index, upload_store):
     """Register professional design tools with the FastMCP app"""
     
     @app.tool()
@@ -23,6 +23,7 @@ def register_professional_tools(app: FastMCP, presentations: Dict, get_current_p
         enhance_content: bool = True,
         enhance_shapes: bool = True,
         enhance_charts: bool = True,
+        slide_id: Optional[int] = None,
         presentation_id: Optional[str] = None
     ) -> Dict:
         """Unified professional design tool for themes, slides, and visual enhancements.
@@ -59,6 +60,7 @@ def register_professional_tools(app: FastMCP, presentations: Dict, get_current_p
                 return {
                     "message": f"Added professional {slide_type} slide",
                     "slide_index": len(pres.slides) - 1,
+                    "slide_id": pres.slides[-1].slide_id,
                     "color_scheme": color_scheme,
                     "slide_type": slide_type
                 }
@@ -79,17 +81,15 @@ def register_professional_tools(app: FastMCP, presentations: Dict, get_current_p
             
             elif operation == "enhance":
                 # Enhance existing slide
-                if slide_index is None:
+                if slide_index is None and slide_id is None:
                     return {
-                        "error": "slide_index is required for enhance operation"
+                        "error": "slide_index or slide_id is required for enhance operation"
                     }
                 
-                if slide_index < 0 or slide_index >= len(pres.slides):
-                    return {
-                        "error": f"Invalid slide index: {slide_index}. Available slides: 0-{len(pres.slides) - 1}"
-                    }
-                
-                slide = pres.slides[slide_index]
+                try:
+                    slide_index, slide = address_index.resolve_slide(pres_id, slide_index, slide_id)
+                except ValueError as e:
+                    return {"error": str(e)}
                 result = ppt_utils.enhance_existing_slide(
                     slide,
                     color_scheme=color_scheme,
@@ -118,9 +118,13 @@ def register_professional_tools(app: FastMCP, presentations: Dict, get_current_p
 
     @app.tool()
     def apply_picture_effects(
-        slide_index: int,
-        shape_index: int,
+        slide_index: Optional[int] = None,
+        shape_index: Optional[int] = None,
+        *,
         effects: Dict[str, Dict],  # {"shadow": {"blur_radius": 4.0, ...}, "glow": {...}}
+        slide_id: Optional[int] = None,
+        shape_id: Optional[int] = None,
+        shape_name: Optional[str] = None,
         presentation_id: Optional[str] = None
     ) -> Dict:
         """Apply multiple picture effects in combination."""
@@ -131,21 +135,11 @@ def register_professional_tools(app: FastMCP, presentations: Dict, get_current_p
                 "error": "No presentation is currently loaded or the specified ID is invalid"
             }
         
-        pres = presentations[pres_id]
-        
-        if slide_index < 0 or slide_index >= len(pres.slides):
-            return {
-                "error": f"Invalid slide index: {slide_index}. Available slides: 0-{len(pres.slides) - 1}"
-            }
-        
-        slide = pres.slides[slide_index]
-        
-        if shape_index < 0 or shape_index >= len(slide.shapes):
-            return {
-                "error": f"Invalid shape index: {shape_index}. Available shapes: 0-{len(slide.shapes) - 1}"
-            }
-        
-        shape = slide.shapes[shape_index]
+        try:
+            slide_index, slide = address_index.resolve_slide(pres_id, slide_index, slide_id)
+            shape_index, shape = address_index.resolve_shape(pres_id, slide, shape_index, shape_id, shape_name)
+        except ValueError as e:
+            return {"error": str(e)}
         
         try:
             applied_effects = []
@@ -252,7 +246,13 @@ def register_professional_tools(app: FastMCP, presentations: Dict, get_current_p
         presentation_type: str = "business",
         text_content: Optional[str] = None
     ) -> Dict:
-        """Unified font management tool for analysis, optimization, and recommendations."""
+        """Unified font management tool for analysis, optimization, and recommendations.
+        font_path may be an upload:// handle."""
+        try:
+            font_path = upload_store.resolve_path(font_path)
+        except (KeyError, ValueError) as e:
+            return {"error": str(e.args[0])}
+
         try:
             if operation == "analyze":
                 # Analyze font file
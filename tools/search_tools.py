@@ -0,0 +1,51 @@
+"""
+Search tools for PowerPoint MCP Server.
+Full-text search across all loaded presentations backed by an inverted index.
+"""
+from typing import Dict, List, Optional
+from mcp.server.fastmcp import FastMCP
+
+
+def register_search_tools(app: FastMCP, presentations: Dict, search_index):
+    """Register search tools with the FastMCP app"""
+
+    @app.tool()
+    def search_presentations(
+        query: str,
+        presentation_ids: Optional[List[str]] = None,
+        limit: int = 50
+    ) -> Dict:
+        """Search the text of all loaded presentations.
+        All words must occur in the same shape; use "quoted phrases" for exact phrases and word* for prefixes."""
+        if limit <= 0:
+            return {
+                "error": f"limit must be a positive integer, got {limit}"
+            }
+
+        if presentation_ids is not None:
+            unknown = [pres_id for pres_id in presentation_ids if pres_id not in presentations]
+            if unknown:
+                return {
+                    "error": f"Presentations not found: {unknown}. Available presentations: {list(presentations.keys())}"
+                }
+
+        try:
+            return search_index.search(query, presentation_ids=presentation_ids, limit=limit)
+        except ValueError as e:
+            return {
+                "error": str(e)
+            }
+        except Exception as e:
+            return {
+                "error": f"Failed to search presentations: {str(e)}"
+            }
+
+    @app.tool()
+    def get_search_index_stats() -> Dict:
+        """Get the size of the full-text search index."""
+        try:
+            return search_index.get_stats()
+        except Exception as e:
+            return {
+                "error": f"Failed to get search index stats: {str(e)}"
+            }
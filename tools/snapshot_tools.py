@@ -0,0 +1,78 @@
+"""
+Snapshot tools for PowerPoint MCP Server.
+Takes and restores snapshots of loaded presentations so that edits can be undone.
+"""
+from typing import Dict, Optional
+from mcp.server.fastmcp import FastMCP
+
+
+def register_snapshot_tools(app: FastMCP, presentations: Dict, get_current_presentation_id, snapshot_history):
+    """Register snapshot tools with the FastMCP app"""
+
+    @app.tool()
+    def snapshot_presentation(presentation_id: Optional[str] = None, label: Optional[str] = None) -> Dict:
+        """Snapshot a presentation before a risky edit so it can be undone with restore_snapshot.
+        Unchanged parts are shared with earlier snapshots, so a snapshot costs about as much as the edits since the last one."""
+        pres_id = presentation_id if presentation_id is not None else get_current_presentation_id()
+
+        if pres_id is None or pres_id not in presentations:
+            return {
+                "error": "No presentation is currently loaded or the specified ID is invalid"
+            }
+
+        try:
+            result = snapshot_history.take(pres_id, label)
+        except Exception as e:
+            return {
+                "error": f"Failed to snapshot presentation: {str(e)}"
+            }
+
+        result["presentation_id"] = pres_id
+        result["message"] = f"Took {result['snapshot_id']} of presentation {pres_id}"
+        return result
+
+    @app.tool()
+    def restore_snapshot(
+        presentation_id: Optional[str] = None,
+        snapshot_id: Optional[str] = None,
+        drop_newer: bool = False
+    ) -> Dict:
+        """Undo edits by restoring a presentation to a snapshot (the most recent one by default).
+        drop_newer=True also discards the snapshots taken after it."""
+        pres_id = presentation_id if presentation_id is not None else get_current_presentation_id()
+
+        if pres_id is None or pres_id not in presentations:
+            return {
+                "error": "No presentation is currently loaded or the specified ID is invalid"
+            }
+
+        try:
+            result = snapshot_history.restore(pres_id, snapshot_id, drop_newer)
+        except KeyError as e:
+            return {"error": str(e.args[0])}
+        except Exception as e:
+            return {
+                "error": f"Failed to restore snapshot: {str(e)}"
+            }
+
+        result["presentation_id"] = pres_id
+        result["message"] = f"Restored presentation {pres_id} to {result['snapshot_id']}"
+        return result
+
+    @app.tool()
+    def list_snapshots(presentation_id: Optional[str] = None) -> Dict:
+        """List the snapshots kept for a presentation, oldest first."""
+        pres_id = presentation_id if presentation_id is not None else get_current_presentation_id()
+
+        if pres_id is None or pres_id not in presentations:
+            return {
+                "error": "No presentation is currently loaded or the specified ID is invalid"
+            }
+
+        snapshots = snapshot_history.list(pres_id)
+        return {
+            "presentation_id": pres_id,
+            "snapshots": snapshots,
+            "max_snapshots": snapshot_history.max_snapshots,
+            "retained_bytes": snapshot_history.retained_bytes(pres_id)
+        }
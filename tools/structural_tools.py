@@ -7,12 +7,13 @@ from mcp.server.fastmcp import FastMCP
 import utils as ppt_utils
 
 
-def register_structural_tools(app: FastMCP, presentations: Dict, get_current_presentation_id, validate_parameters, is_positive, is_non_negative, is_in_range, is_valid_rgb, add_shape_direct):
+def register_structural_tools(app: FastMCP, presentations: Dict, get_current_presentation_id, validate_parameters, is_positive, is_non_negative, is_in_range, is_valid_rgb, add_shape_direct, address_index):
     """Register structural element tools with the FastMCP app"""
     
     @app.tool()
     def add_table(
-        slide_index: int,
+        slide_index: Optional[int] = None,
+        *,
         rows: int,
         cols: int,
         left: float,
@@ -26,6 +27,7 @@ def register_structural_tools(app: FastMCP, presentations: Dict, get_current_pre
         header_bg_color: Optional[List[int]] = None,
         body_bg_color: Optional[List[int]] = None,
         border_color: Optional[List[int]] = None,
+        slide_id: Optional[int] = None,
         presentation_id: Optional[str] = None
     ) -> Dict:
         """Add a table to a slide with enhanced formatting options."""
@@ -36,14 +38,10 @@ def register_structural_tools(app: FastMCP, presentations: Dict, get_current_pre
                 "error": "No presentation is currently loaded or the specified ID is invalid"
             }
         
-        pres = presentations[pres_id]
-        
-        if slide_index < 0 or slide_index >= len(pres.slides):
-            return {
-                "error": f"Invalid slide index: {slide_index}. Available slides: 0-{len(pres.slides) - 1}"
-            }
-        
-        slide = pres.slides[slide_index]
+        try:
+            slide_index, slide = address_index.resolve_slide(pres_id, slide_index, slide_id)
+        except ValueError as e:
+            return {"error": str(e)}
         
         # Validate parameters
         validations = {
@@ -115,6 +113,7 @@ def register_structural_tools(app: FastMCP, presentations: Dict, get_current_pre
             return {
                 "message": f"Added {rows}x{cols} table to slide {slide_index}",
                 "shape_index": len(slide.shapes) - 1,
+                "shape_id": slide.shapes[-1].shape_id,
                 "rows": rows,
                 "cols": cols
             }
@@ -125,8 +124,9 @@ def register_structural_tools(app: FastMCP, presentations: Dict, get_current_pre
 
     @app.tool()
     def format_table_cell(
-        slide_index: int,
-        shape_index: int,
+        slide_index: Optional[int] = None,
+        shape_index: Optional[int] = None,
+        *,
         row: int,
         col: int,
         font_size: Optional[int] = None,
@@ -137,6 +137,9 @@ def register_structural_tools(app: FastMCP, presentations: Dict, get_current_pre
         bg_color: Optional[List[int]] = None,
         alignment: Optional[str] = None,
         vertical_alignment: Optional[str] = None,
+        slide_id: Optional[int] = None,
+        shape_id: Optional[int] = None,
+        shape_name: Optional[str] = None,
         presentation_id: Optional[str] = None
     ) -> Dict:
         """Format a specific table cell."""
@@ -147,21 +150,11 @@ def register_structural_tools(app: FastMCP, presentations: Dict, get_current_pre
                 "error": "No presentation is currently loaded or the specified ID is invalid"
             }
         
-        pres = presentations[pres_id]
-        
-        if slide_index < 0 or slide_index >= len(pres.slides):
-            return {
-                "error": f"Invalid slide index: {slide_index}. Available slides: 0-{len(pres.slides) - 1}"
-            }
-        
-        slide = pres.slides[slide_index]
-        
-        if shape_index < 0 or shape_index >= len(slide.shapes):
-            return {
-                "error": f"Invalid shape index: {shape_index}. Available shapes: 0-{len(slide.shapes) - 1}"
-            }
-        
-        shape = slide.shapes[shape_index]
+        try:
+            slide_index, slide = address_index.resolve_slide(pres_id, slide_index, slide_id)
+            shape_index, shape = address_index.resolve_shape(pres_id, slide, shape_index, shape_id, shape_name)
+        except ValueError as e:
+            return {"error": str(e)}
         
         try:
             if not hasattr(shape, 'table'):
@@ -205,7 +198,8 @@ def register_structural_tools(app: FastMCP, presentations: Dict, get_current_pre
 
     @app.tool()
     def add_shape(
-        slide_index: int,
+        slide_index: Optional[int] = None,
+        *,
         shape_type: str,
         left: float,
         top: float,
@@ -217,6 +211,7 @@ def register_structural_tools(app: FastMCP, presentations: Dict, get_current_pre
         text: Optional[str] = None,  # Add text to shape
         font_size: Optional[int] = None,
         font_color: Optional[List[int]] = None,
+        slide_id: Optional[int] = None,
         presentation_id: Optional[str] = None
     ) -> Dict:
         """Add an auto shape to a slide with enhanced options."""
@@ -227,14 +222,10 @@ def register_structural_tools(app: FastMCP, presentations: Dict, get_current_pre
                 "error": "No presentation is currently loaded or the specified ID is invalid"
             }
         
-        pres = presentations[pres_id]
-        
-        if slide_index < 0 or slide_index >= len(pres.slides):
-            return {
-                "error": f"Invalid slide index: {slide_index}. Available slides: 0-{len(pres.slides) - 1}"
-            }
-        
-        slide = pres.slides[slide_index]
+        try:
+            slide_index, slide = address_index.resolve_slide(pres_id, slide_index, slide_id)
+        except ValueError as e:
+            return {"error": str(e)}
         
         try:
             # Use the direct implementation that bypasses the enum issues
@@ -261,7 +252,8 @@ def register_structural_tools(app: FastMCP, presentations: Dict, get_current_pre
             
             return {
                 "message": f"Added {shape_type} shape to slide {slide_index}",
-                "shape_index": len(slide.shapes) - 1
+                "shape_index": len(slide.shapes) - 1,
+                "shape_id": slide.shapes[-1].shape_id
             }
         except ValueError as e:
             return {
@@ -274,7 +266,8 @@ def register_structural_tools(app: FastMCP, presentations: Dict, get_current_pre
 
     @app.tool()
     def add_chart(
-        slide_index: int,
+        slide_index: Optional[int] = None,
+        *,
         chart_type: str,
         left: float,
         top: float,
@@ -290,6 +283,7 @@ def register_structural_tools(app: FastMCP, presentations: Dict, get_current_pre
         x_axis_title: Optional[str] = None,
         y_axis_title: Optional[str] = None,
         color_scheme: Optional[str] = None,
+        slide_id: Optional[int] = None,
         presentation_id: Optional[str] = None
     ) -> Dict:
         """Add a chart to a slide with comprehensive formatting options."""
@@ -300,14 +294,10 @@ def register_structural_tools(app: FastMCP, presentations: Dict, get_current_pre
                 "error": "No presentation is currently loaded or the specified ID is invalid"
             }
         
-        pres = presentations[pres_id]
-        
-        if slide_index < 0 or slide_index >= len(pres.slides):
-            return {
-                "error": f"Invalid slide index: {slide_index}. Available slides: 0-{len(pres.slides) - 1}"
-            }
-        
-        slide = pres.slides[slide_index]
+        try:
+            slide_index, slide = address_index.resolve_slide(pres_id, slide_index, slide_id)
+        except ValueError as e:
+            return {"error": str(e)}
         
         # Validate chart type
         valid_chart_types = [
@@ -363,6 +353,7 @@ def register_structural_tools(app: FastMCP, presentations: Dict, get_current_pre
             return {
                 "message": f"Added {chart_type} chart to slide {slide_index}",
                 "shape_index": len(slide.shapes) - 1,
+                "shape_id": slide.shapes[-1].shape_id,
                 "chart_type": chart_type,
                 "series_count": len(series_names),
                 "categories_count": len(categories)
@@ -6,11 +6,18 @@ and advanced features like dynamic sizing, auto-wrapping, and visual effects.
 from typing import Dict, List, Optional, Any
 from mcp.server.fastmcp import FastMCP
 import utils.template_utils as template_utils
+from utils.change_utils import changed_shape_indexes
 
 
-def register_template_tools(app: FastMCP, presentations: Dict, get_current_presentation_id):
+def register_template_tools(app: FastMCP, presentations: Dict, get_current_presentation_id, change_tracker=None, upload_store=None):
     """Register template-based tools with the FastMCP app"""
     
+    def resolve_image_paths(image_paths: Optional[Dict[str, str]]) -> Dict[str, str]:
+        """Map upload:// handles among the image paths to their spool files."""
+        if not image_paths or upload_store is None:
+            return image_paths or {}
+        return {role: upload_store.resolve_path(path) for role, path in image_paths.items()}
+    
     @app.tool()
     def list_slide_templates() -> Dict:
         """List all available slide layout templates."""
@@ -47,7 +54,7 @@ def register_template_tools(app: FastMCP, presentations: Dict, get_current_prese
             template_id: ID of the template to apply (e.g., 'title_slide', 'text_with_image')
             color_scheme: Color scheme to use ('modern_blue', 'corporate_gray', 'elegant_green', 'warm_red')
             content_mapping: Dictionary mapping element roles to custom content
-            image_paths: Dictionary mapping image element roles to file paths
+            image_paths: Dictionary mapping image element roles to file paths or upload:// handles
             presentation_id: Presentation ID (uses current if None)
         """
         pres_id = presentation_id if presentation_id is not None else get_current_presentation_id()
@@ -66,10 +73,15 @@ def register_template_tools(app: FastMCP, presentations: Dict, get_current_prese
         
         slide = pres.slides[slide_index]
         
+        try:
+            image_paths = resolve_image_paths(image_paths)
+        except (KeyError, ValueError) as e:
+            return {"error": str(e.args[0])}
+        
         try:
             result = template_utils.apply_slide_template(
                 slide, template_id, color_scheme, 
-                content_mapping or {}, image_paths or {}
+                content_mapping or {}, image_paths
             )
             
             if result['success']:
@@ -104,7 +116,7 @@ def register_template_tools(app: FastMCP, presentations: Dict, get_current_prese
             template_id: ID of the template to use (e.g., 'title_slide', 'text_with_image')
             color_scheme: Color scheme to use ('modern_blue', 'corporate_gray', 'elegant_green', 'warm_red')
             content_mapping: Dictionary mapping element roles to custom content
-            image_paths: Dictionary mapping image element roles to file paths
+            image_paths: Dictionary mapping image element roles to file paths or upload:// handles
             layout_index: PowerPoint layout index to use as base (default: 1)
             presentation_id: Presentation ID (uses current if None)
         """
@@ -123,6 +135,11 @@ def register_template_tools(app: FastMCP, presentations: Dict, get_current_prese
                 "error": f"Invalid layout index: {layout_index}. Available layouts: 0-{len(pres.slide_layouts) - 1}"
             }
         
+        try:
+            image_paths = resolve_image_paths(image_paths)
+        except (KeyError, ValueError) as e:
+            return {"error": str(e.args[0])}
+        
         try:
             # Add new slide
             layout = pres.slide_layouts[layout_index]
@@ -132,7 +149,7 @@ def register_template_tools(app: FastMCP, presentations: Dict, get_current_prese
             # Apply template
             result = template_utils.apply_slide_template(
                 slide, template_id, color_scheme,
-                content_mapping or {}, image_paths or {}
+                content_mapping or {}, image_paths
             )
             
             if result['success']:
@@ -442,8 +459,20 @@ def register_template_tools(app: FastMCP, presentations: Dict, get_current_prese
             optimizations_applied = []
             manager = template_utils.get_enhanced_template_manager()
             
+            # Only revisit shapes changed since the last run with the same settings
+            shape_indexes = None
+            if change_tracker is not None:
+                slide_id = pres.slides._sldIdLst[slide_index].id
+                consumer = ("optimize_slide_text", slide_id, auto_resize, auto_wrap,
+                            optimize_spacing, min_font_size, max_font_size)
+                shape_indexes = changed_shape_indexes(
+                    slide, change_tracker.collect(consumer, pres_id), slide_id
+                )
+            
             # Analyze each text shape on the slide
             for i, shape in enumerate(slide.shapes):
+                if shape_indexes is not None and i not in shape_indexes:
+                    continue
                 if hasattr(shape, 'text_frame') and shape.text_frame.text:
                     text = shape.text_frame.text
                     
@@ -503,10 +532,17 @@ def register_template_tools(app: FastMCP, presentations: Dict, get_current_prese
                             "optimizations": shape_optimizations
                         })
             
+            if change_tracker is not None:
+                for optimization in optimizations_applied:
+                    change_tracker.record(pres_id, "shape", slide_index, optimization["shape_index"])
+                # The optimizations are this consumer's own; don't revisit them next time
+                change_tracker.collect(consumer, pres_id)
+            
             return {
                 "message": f"Optimized {len(optimizations_applied)} text elements on slide {slide_index}",
                 "slide_index": slide_index,
                 "optimizations_applied": optimizations_applied,
+                "shapes_skipped_unchanged": 0 if shape_indexes is None else len(slide.shapes) - len(shape_indexes),
                 "settings": {
                     "auto_resize": auto_resize,
                     "auto_wrap": auto_wrap,
@@ -0,0 +1,170 @@
+"""
+Transfer tools for PowerPoint MCP Server.
+Moves files between the server and clients that cannot reach its filesystem:
+downloads as base64 chunks or an HTTP stream, uploads as base64 chunks or an
+HTTP PUT, both without holding a whole file in a single request.
+"""
+import anyio
+import base64
+import binascii
+from typing import Dict, Optional
+from mcp.server.fastmcp import FastMCP
+import utils as ppt_utils
+from utils.transfer_utils import DEFAULT_TRANSFER_CHUNK_SIZE, MAX_TRANSFER_CHUNK_SIZE, STREAM_CHUNK_SIZE
+
+
+PPTX_MEDIA_TYPE = "application/vnd.openxmlformats-officedocument.presentationml.presentation"
+
+
+def register_transfer_tools(app: FastMCP, presentations: Dict, get_current_presentation_id, download_store, upload_store):
+    """Register transfer tools and the download and upload routes with the FastMCP app"""
+
+    @app.tool()
+    def save_presentation_to_bytes(
+        presentation_id: Optional[str] = None,
+        file_name: Optional[str] = None,
+        inline: bool = False,
+        chunk_size: int = DEFAULT_TRANSFER_CHUNK_SIZE,
+        compression: Optional[str] = None,
+        compression_level: Optional[int] = None
+    ) -> Dict:
+        """Serialize a presentation in memory for download, without writing a file on the server.
+        Over HTTP, GET download_path streams the file; otherwise fetch it with read_presentation_bytes.
+        inline=True returns the whole file as base64 in 'data' when it fits in one chunk."""
+        pres_id = presentation_id if presentation_id is not None else get_current_presentation_id()
+
+        if pres_id is None or pres_id not in presentations:
+            return {
+                "error": "No presentation is currently loaded or the specified ID is invalid"
+            }
+
+        policy = None
+        if compression is not None or compression_level is not None:
+            try:
+                policy = ppt_utils.ZipCompressionPolicy.from_preset(compression or "balanced", compression_level)
+            except ValueError as e:
+                return {"error": str(e)}
+
+        try:
+            buffer = ppt_utils.save_presentation_to_bytes(presentations[pres_id], policy)
+            result = download_store.add(buffer, file_name or f"{pres_id}.pptx", chunk_size)
+        except ValueError as e:
+            return {"error": str(e)}
+        except Exception as e:
+            return {
+                "error": f"Failed to serialize presentation: {str(e)}"
+            }
+
+        result["presentation_id"] = pres_id
+        result["download_path"] = f"/downloads/{result['download_id']}"
+        if inline and result["chunk_count"] == 1:
+            result["data"] = download_store.read_chunk(result["download_id"], 0)["data"]
+            del result["download_path"]
+        return result
+
+    @app.tool()
+    def read_presentation_bytes(download_id: str, chunk_index: int = 0) -> Dict:
+        """Read one base64 chunk of a file prepared by save_presentation_to_bytes.
+        The download is released after its last chunk is read."""
+        try:
+            return download_store.read_chunk(download_id, chunk_index)
+        except (KeyError, ValueError) as e:
+            return {"error": str(e.args[0])}
+
+    @app.tool()
+    def begin_upload(file_name: str, size_bytes: Optional[int] = None) -> Dict:
+        """Start a chunked upload. The returned upload:// handle can be passed wherever a file path is accepted
+        once finish_upload succeeded. Over HTTP the raw file can be sent with PUT upload_path instead of chunks."""
+        try:
+            result = upload_store.begin(file_name, size_bytes)
+        except ValueError as e:
+            return {"error": str(e)}
+
+        result["upload_path"] = f"/uploads/{result['upload_id']}"
+        result["max_chunk_size"] = MAX_TRANSFER_CHUNK_SIZE
+        return result
+
+    @app.tool()
+    def append_chunk(upload_id: str, data: str, offset: Optional[int] = None) -> Dict:
+        """Append a base64 chunk to an upload. Pass offset (bytes sent before this chunk) to detect lost or repeated chunks."""
+        try:
+            chunk = base64.b64decode(data, validate=True)
+        except binascii.Error as e:
+            return {"error": f"Invalid base64 chunk: {str(e)}"}
+
+        if len(chunk) > MAX_TRANSFER_CHUNK_SIZE:
+            return {"error": f"Chunk of {len(chunk)} bytes exceeds the maximum of {MAX_TRANSFER_CHUNK_SIZE}"}
+
+        try:
+            return upload_store.append(upload_id, chunk, offset)
+        except (KeyError, ValueError) as e:
+            return {"error": str(e.args[0])}
+
+    @app.tool()
+    def finish_upload(upload_id: str, sha256: Optional[str] = None) -> Dict:
+        """Complete an upload, verifying its size and optional sha256, and return its upload:// handle."""
+        try:
+            return upload_store.finish(upload_id, sha256)
+        except (KeyError, ValueError) as e:
+            return {"error": str(e.args[0])}
+
+    @app.tool()
+    def release_upload(upload_id: str) -> Dict:
+        """Delete an upload's spooled file. Presentations already opened from it stay loaded."""
+        if not upload_store.release(upload_id):
+            return {"error": f"Unknown or expired upload id: {upload_id}"}
+        return {"message": f"Released upload {upload_id}"}
+
+    @app.tool()
+    def get_transfer_stats() -> Dict:
+        """Get the number and size of pending downloads and uploads."""
+        return {
+            "downloads": download_store.get_stats(),
+            "uploads": upload_store.get_stats()
+        }
+
+    # Custom routes exist only in newer FastMCP versions and are only served over HTTP/SSE
+    if not hasattr(app, "custom_route"):
+        return
+
+    from starlette.responses import JSONResponse, StreamingResponse
+
+    @app.custom_route("/downloads/{download_id}", methods=["GET"], include_in_schema=False)
+    async def download_presentation(request):
+        """Stream a prepared presentation with chunked transfer encoding."""
+        download_id = request.path_params["download_id"]
+        try:
+            file_name = download_store.get_file_name(download_id)
+            chunks = download_store.iter_stream(download_id)
+        except KeyError as e:
+            return JSONResponse({"error": str(e.args[0])}, status_code=404)
+
+        return StreamingResponse(
+            chunks,
+            media_type=PPTX_MEDIA_TYPE,
+            headers={"Content-Disposition": f'attachment; filename="{file_name}"'}
+        )
+
+    @app.custom_route("/uploads/{upload_id}", methods=["PUT"], include_in_schema=False)
+    async def upload_file(request):
+        """Spool a raw request body into an upload started with begin_upload and finish it."""
+        upload_id = request.path_params["upload_id"]
+        # Writing and hashing run in worker threads, a piece of up to STREAM_CHUNK_SIZE at a time,
+        # so that a large upload does not hold up the event loop
+        pending = bytearray()
+        try:
+            async for chunk in request.stream():
+                pending += chunk
+                if len(pending) >= STREAM_CHUNK_SIZE:
+                    await anyio.to_thread.run_sync(upload_store.append, upload_id, bytes(pending))
+                    pending.clear()
+            if pending:
+                await anyio.to_thread.run_sync(upload_store.append, upload_id, bytes(pending))
+            result = await anyio.to_thread.run_sync(
+                upload_store.finish, upload_id, request.headers.get("x-content-sha256")
+            )
+        except KeyError as e:
+            return JSONResponse({"error": str(e.args[0])}, status_code=404)
+        except ValueError as e:
+            return JSONResponse({"error": str(e.args[0])}, status_code=400)
+        return JSONResponse(result)
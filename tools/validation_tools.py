@@ -0,0 +1,66 @@
+"""
+Validation tools for PowerPoint MCP Server.
+Whole-presentation lint checks with optional automatic fixes.
+"""
+from typing import Dict, Optional
+from mcp.server.fastmcp import FastMCP
+import utils as ppt_utils
+
+
+def register_validation_tools(app: FastMCP, presentations: Dict, get_current_presentation_id, change_tracker):
+    """Register validation tools with the FastMCP app"""
+
+    @app.tool()
+    def validate_presentation(
+        auto_fix: bool = False,
+        incremental: bool = False,
+        min_font_size: int = 8,
+        max_font_size: int = 72,
+        max_workers: Optional[int] = None,
+        presentation_id: Optional[str] = None
+    ) -> Dict:
+        """Check every slide for text fit, overlap, spacing, empty paragraphs and shape count.
+        With incremental=True only slides changed since the last run are re-checked."""
+        pres_id = presentation_id if presentation_id is not None else get_current_presentation_id()
+
+        if pres_id is None or pres_id not in presentations:
+            return {
+                "error": "No presentation is currently loaded or the specified ID is invalid"
+            }
+
+        if max_workers is not None and max_workers < 1:
+            return {"error": "Parameter 'max_workers': must be a positive integer"}
+        if min_font_size < 1 or min_font_size > max_font_size:
+            return {
+                "error": f"Invalid font size range: {min_font_size}-{max_font_size}"
+            }
+
+        try:
+            # Always advance the cursor so a later incremental run starts from this one
+            consumer = ("validate_presentation", min_font_size, max_font_size)
+            changes = change_tracker.collect(consumer, pres_id)
+            changed_slide_ids = None
+            if incremental and not changes.full:
+                changed_slide_ids = changes.affected_slide_ids()
+            
+            result = ppt_utils.validate_presentation(
+                presentations[pres_id],
+                auto_fix=auto_fix,
+                changed_slide_ids=changed_slide_ids,
+                min_font_size=min_font_size,
+                max_font_size=max_font_size,
+                max_workers=max_workers
+            )
+            
+            for entry in result["slides"]:
+                for shape_index in entry.pop("fixed_shape_indexes", []):
+                    change_tracker.record(pres_id, "shape", entry["slide_index"], shape_index)
+            # The fixes are this consumer's own; don't re-check them next time
+            change_tracker.collect(consumer, pres_id)
+            
+            result["presentation_id"] = pres_id
+            return result
+        except Exception as e:
+            return {
+                "error": f"Failed to validate presentation: {str(e)}"
+            }
@@ -8,16 +8,28 @@ from .presentation_utils import *
 from .content_utils import *
 from .design_utils import *
 from .validation_utils import *
+from .package_utils import *
 
 __all__ = [
     # Core utilities
     "safe_operation",
     "try_multiple_approaches",
+    "get_worker_context",
     
     # Presentation utilities
     "create_presentation",
     "open_presentation", 
     "save_presentation",
+    "save_presentation_incremental",
+    "save_presentation_to_bytes",
+    "clone_presentation",
+    "keep_slides",
+    "merge_presentations",
+    "PresentationSnapshot",
+    "snapshot_presentation",
+    "restore_snapshot",
+    "TemplateCatalog",
+    "TemplatePool",
     "create_presentation_from_template",
     "get_presentation_info",
     "get_template_info",
@@ -38,6 +50,14 @@ __all__ = [
     "format_table_cell",
     "add_chart",
     "format_chart",
+    "extract_slide_text_content",
+    "extract_slide_text_content_xml",
+    "iter_shape_text_xml",
+    "get_shape_text_by_id_xml",
+    "iter_text_frame_paragraphs_xml",
+    "iter_slide_text_content",
+    "iter_presentation_text",
+    "build_text_record",
     
     # Design utilities
     "get_professional_color",
@@ -48,6 +68,7 @@ __all__ = [
     "enhance_existing_slide",
     "apply_professional_image_enhancement",
     "enhance_image_with_pillow",
+    "enhance_images_batch",
     "set_slide_gradient_background",
     "create_professional_gradient_background",
     "format_shape",
@@ -63,7 +84,19 @@ __all__ = [
     "optimize_font_for_presentation",
     "get_font_recommendations",
     
+    # Package utilities
+    "iter_slide_elements",
+    "copy_zip_member",
+    "ZipCompressionPolicy",
+    "PackageZipWriter",
+    "read_template_metadata",
+    "extract_text_from_file",
+    "extract_text_from_files",
+    "read_package_sections",
+    "split_package",
+    
     # Validation utilities
     "validate_text_fit",
-    "validate_and_fix_slide"
+    "validate_and_fix_slide",
+    "validate_presentation"
 ]
\ No newline at end of file
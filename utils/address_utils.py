@@ -0,0 +1,191 @@
+"""
+Addressing utilities for PowerPoint MCP Server.
+Resolves slides and shapes by position, by id or by name through a per-presentation index.
+"""
+from typing import Dict, List, Optional, Tuple
+from lxml import etree
+from pptx.shapes.shapetree import SlideShapeFactory
+
+
+_ADDRESS_NAMESPACES = {
+    'p': 'http://schemas.openxmlformats.org/presentationml/2006/main',
+}
+_XPATH_SHAPE_ELEMENTS = etree.XPath(
+    './p:cSld/p:spTree/*[self::p:sp or self::p:grpSp or self::p:graphicFrame'
+    ' or self::p:cxnSp or self::p:pic or self::p:contentPart]',
+    namespaces=_ADDRESS_NAMESPACES
+)
+_XPATH_CNVPR = etree.XPath('./*[1]/p:cNvPr', namespaces=_ADDRESS_NAMESPACES)
+
+
+class _SlideShapes:
+    """Shape lookup tables of one slide."""
+
+    __slots__ = ('by_id', 'by_name')
+
+    def __init__(self, slide_element):
+        # shape_id -> (shape_index, shape element)
+        self.by_id: Dict[int, Tuple[int, object]] = {}
+        # shape name -> shape ids with that name, in z-order
+        self.by_name: Dict[str, List[int]] = {}
+        for shape_index, element in enumerate(_XPATH_SHAPE_ELEMENTS(slide_element)):
+            c_nv_pr = _XPATH_CNVPR(element)
+            if not c_nv_pr:
+                continue
+            shape_id = int(c_nv_pr[0].get('id'))
+            self.by_id[shape_id] = (shape_index, element)
+            self.by_name.setdefault(c_nv_pr[0].get('name', ''), []).append(shape_id)
+
+
+class PresentationAddressIndex:
+    """
+    Index of slide ids, shape ids and shape names of the presentations in the store.
+
+    Slide ids and shape ids stay the same when other slides or shapes are
+    inserted, so they are a stable way to address content across edits.
+    Lookups are dictionary hits; the tables of a presentation or slide are
+    dropped when the change tracker reports that it changed and rebuilt on the
+    next lookup. Entries are also checked against the XML before use, so a
+    change made outside the tracked tools cannot return a deleted shape or a
+    shape from another slide.
+    """
+
+    # Consumer key used with the change tracker
+    CHANGE_CONSUMER = "address_index"
+
+    def __init__(self, presentations: Dict, change_tracker):
+        self.presentations = presentations
+        self.change_tracker = change_tracker
+        # presentation_id -> {slide_id: slide_index}
+        self._slides: Dict[str, Dict[int, int]] = {}
+        # (presentation_id, slide_id) -> shape tables
+        self._shapes: Dict[Tuple[str, int], _SlideShapes] = {}
+
+    def _sync(self, pres_id: str) -> None:
+        """Drop the tables of everything that changed since the last lookup."""
+        changes = self.change_tracker.collect(self.CHANGE_CONSUMER, pres_id)
+        if changes.is_empty:
+            return
+        if changes.full:
+            self._drop_presentation(pres_id)
+            return
+        if changes.structure_changed:
+            self._slides.pop(pres_id, None)
+        for slide_id in changes.affected_slide_ids():
+            self._shapes.pop((pres_id, slide_id), None)
+
+    def _drop_presentation(self, pres_id: str) -> None:
+        """Forget all tables of a presentation."""
+        self._slides.pop(pres_id, None)
+        for key in [key for key in self._shapes if key[0] == pres_id]:
+            del self._shapes[key]
+
+    def _slide_ids(self, pres_id: str, pres) -> Dict[int, int]:
+        """Slide id to slide index table of a presentation."""
+        slide_ids = self._slides.get(pres_id)
+        if slide_ids is None:
+            slide_ids = {sld_id.id: slide_index for slide_index, sld_id in enumerate(pres.slides._sldIdLst)}
+            self._slides[pres_id] = slide_ids
+        return slide_ids
+
+    def resolve_slide(self, pres_id: str, slide_index: Optional[int] = None,
+                      slide_id: Optional[int] = None) -> Tuple[int, object]:
+        """
+        Find a slide by index or by slide id.
+
+        Args:
+            pres_id: ID of a presentation in the store
+            slide_index: Position of the slide (0-based)
+            slide_id: Slide id (p:sldId/@id); takes precedence over slide_index
+
+        Returns:
+            Tuple of (slide_index, slide)
+
+        Raises:
+            ValueError: If neither is given or the slide does not exist
+        """
+        pres = self.presentations[pres_id]
+        sld_ids = pres.slides._sldIdLst
+
+        if slide_id is not None:
+            self._sync(pres_id)
+            slide_index = self._slide_ids(pres_id, pres).get(slide_id)
+            if slide_index is None or slide_index >= len(sld_ids) or sld_ids[slide_index].id != slide_id:
+                # Changed outside the tracked tools; rebuild once before giving up
+                self._slides.pop(pres_id, None)
+                slide_index = self._slide_ids(pres_id, pres).get(slide_id)
+            if slide_index is None:
+                raise ValueError(f"Invalid slide id: {slide_id}")
+        elif slide_index is None:
+            raise ValueError("Either slide_index or slide_id is required")
+        elif slide_index < 0 or slide_index >= len(sld_ids):
+            raise ValueError(f"Invalid slide index: {slide_index}. Available slides: 0-{len(sld_ids) - 1}")
+
+        return slide_index, pres.part.related_slide(sld_ids[slide_index].rId)
+
+    def _slide_shapes(self, pres_id: str, slide, rebuild: bool = False) -> _SlideShapes:
+        """Shape tables of a slide."""
+        key = (pres_id, slide.slide_id)
+        tables = None if rebuild else self._shapes.get(key)
+        if tables is None:
+            tables = self._shapes[key] = _SlideShapes(slide._element)
+        return tables
+
+    def _lookup_shape(self, tables: _SlideShapes, sp_tree, shape_id: Optional[int],
+                      shape_name: Optional[str]) -> Optional[Tuple[int, object]]:
+        """Look up a shape in the tables; None if missing or if the entry is stale."""
+        if shape_id is None:
+            shape_ids = tables.by_name.get(shape_name, ())
+            if len(shape_ids) > 1:
+                raise ValueError(
+                    f"Shape name '{shape_name}' is ambiguous; matching shape ids: {', '.join(map(str, shape_ids))}"
+                )
+            if not shape_ids:
+                return None
+            shape_id = shape_ids[0]
+
+        entry = tables.by_id.get(shape_id)
+        if entry is None or entry[1].getparent() is not sp_tree:
+            return None
+        return entry
+
+    def resolve_shape(self, pres_id: str, slide, shape_index: Optional[int] = None,
+                      shape_id: Optional[int] = None, shape_name: Optional[str] = None) -> Tuple[int, object]:
+        """
+        Find a shape on a slide by index, by shape id or by name.
+
+        Args:
+            pres_id: ID of the presentation the slide belongs to
+            slide: The slide object (from resolve_slide)
+            shape_index: Position of the shape in the slide's shape tree (0-based)
+            shape_id: Shape id (cNvPr/@id); takes precedence over the other forms
+            shape_name: Shape name (cNvPr/@name); must be unique on the slide
+
+        Returns:
+            Tuple of (shape_index, shape)
+
+        Raises:
+            ValueError: If no form is given, the shape does not exist, or the
+                name matches several shapes
+        """
+        if shape_id is None and shape_name is None:
+            if shape_index is None:
+                raise ValueError("Either shape_index, shape_id or shape_name is required")
+            shapes = slide.shapes
+            if shape_index < 0 or shape_index >= len(shapes):
+                raise ValueError(f"Invalid shape index: {shape_index}. Available shapes: 0-{len(shapes) - 1}")
+            return shape_index, shapes[shape_index]
+
+        self._sync(pres_id)
+        sp_tree = slide.shapes._spTree
+        entry = self._lookup_shape(self._slide_shapes(pres_id, slide), sp_tree, shape_id, shape_name)
+        if entry is None:
+            # Changed outside the tracked tools; rebuild once before giving up
+            entry = self._lookup_shape(self._slide_shapes(pres_id, slide, rebuild=True), sp_tree, shape_id, shape_name)
+        if entry is None:
+            if shape_id is not None:
+                raise ValueError(f"Invalid shape id: {shape_id} on slide {slide.slide_id}")
+            raise ValueError(f"No shape named '{shape_name}' on slide {slide.slide_id}")
+
+        shape_index, element = entry
+        return shape_index, SlideShapeFactory(element, slide.shapes)
@@ -0,0 +1,214 @@
+"""
+Change tracking utilities for PowerPoint MCP Server.
+Records which slides and shapes mutating tools touched, so that consumers such as
+search indexing and validation only reprocess what changed.
+"""
+from bisect import bisect_right
+from typing import Dict, Hashable, List, Optional, Set, Tuple
+
+
+# Scopes a change can be recorded with, from narrowest to widest
+CHANGE_SCOPES = ('shape', 'slide', 'slides', 'all_slides', 'document')
+
+# Number of log entries kept per presentation; consumers that fall further behind
+# are told to reprocess everything
+MAX_CHANGE_LOG_ENTRIES = 10000
+
+
+class ChangeSet:
+    """
+    Changes to one presentation since a consumer last collected them.
+
+    If 'full' is True the consumer has to reprocess the whole presentation
+    (first collection, presentation replaced, every slide touched, or the
+    consumer fell too far behind). Otherwise 'slide_ids' holds slides that
+    changed as a whole and 'shape_ids' maps slide ids to changed shape ids.
+    """
+
+    __slots__ = ('full', 'structure_changed', 'document_changed', 'slide_ids', 'shape_ids')
+
+    def __init__(self, full: bool = False):
+        self.full = full
+        self.structure_changed = full
+        self.document_changed = full
+        self.slide_ids: Set[int] = set()
+        self.shape_ids: Dict[int, Set[int]] = {}
+
+    @property
+    def is_empty(self) -> bool:
+        """True if nothing changed."""
+        return not (self.full or self.structure_changed or self.document_changed
+                    or self.slide_ids or self.shape_ids)
+
+    def changed_shapes(self, slide_id: int) -> Optional[Set[int]]:
+        """
+        Shape ids that changed on a slide.
+
+        Returns:
+            None if the whole slide has to be reprocessed, otherwise the set of
+            changed shape ids (empty if the slide is unchanged)
+        """
+        if self.full or slide_id in self.slide_ids:
+            return None
+        return self.shape_ids.get(slide_id, set())
+
+    def affected_slide_ids(self) -> Set[int]:
+        """Ids of all slides with any change (meaningless if 'full' is set)."""
+        return self.slide_ids | set(self.shape_ids)
+
+
+class _PresentationChanges:
+    """Change log of one presentation object."""
+
+    __slots__ = ('presentation', 'generation', 'sequences', 'entries', 'oldest_sequence')
+
+    def __init__(self, presentation, generation: int, sequence: int):
+        self.presentation = presentation
+        self.generation = generation
+        # Parallel lists: sequence numbers (for bisect) and (scope, slide_id, shape_id)
+        self.sequences: List[int] = []
+        self.entries: List[Tuple[str, Optional[int], Optional[int]]] = []
+        # Cursors older than this have missed entries that were dropped from the log
+        self.oldest_sequence = sequence
+
+
+class ChangeTracker:
+    """
+    Version log of mutations to the presentations in the store.
+
+    Mutations are recorded with a scope and addressed by slide id and shape id,
+    which stay stable when slides or shapes are inserted. Each consumer keeps
+    its own cursor per presentation and collects only the entries recorded
+    since its previous collection, so the cost depends on the number of
+    changes rather than on the size of the deck.
+    """
+
+    def __init__(self, presentations: Dict):
+        self.presentations = presentations
+        self._sequence = 0
+        self._generation = 0
+        self._changes: Dict[str, _PresentationChanges] = {}
+        # (consumer, presentation_id) -> (generation, sequence)
+        self._cursors: Dict[Tuple[Hashable, str], Tuple[int, int]] = {}
+
+    def _changes_for(self, presentation_id: str, presentation) -> _PresentationChanges:
+        """Change log of a presentation, starting a new one if the object was replaced."""
+        changes = self._changes.get(presentation_id)
+        if changes is None or changes.presentation is not presentation:
+            self._generation += 1
+            changes = _PresentationChanges(presentation, self._generation, self._sequence)
+            self._changes[presentation_id] = changes
+        return changes
+
+    def record(self, presentation_id: Optional[str], scope: str, slide_index: Optional[int] = None,
+               shape_index: Optional[int] = None) -> None:
+        """
+        Record a mutation.
+
+        Args:
+            presentation_id: ID of the changed presentation
+            scope: 'shape' (one shape), 'slide' (one slide), 'slides' (slides added
+                or removed), 'all_slides' (any slide may have changed) or
+                'document' (presentation-level data such as core properties)
+            slide_index: Index of the changed slide for 'shape' and 'slide'
+            shape_index: Index of the changed shape for 'shape'
+        """
+        if scope not in CHANGE_SCOPES:
+            raise ValueError(f"Invalid change scope: '{scope}'. Must be one of: {', '.join(CHANGE_SCOPES)}")
+
+        presentation = self.presentations.get(presentation_id)
+        if presentation is None:
+            return
+        changes = self._changes_for(presentation_id, presentation)
+
+        slide_id = shape_id = None
+        if scope in ('shape', 'slide'):
+            sld_ids = presentation.slides._sldIdLst
+            if not isinstance(slide_index, int) or not 0 <= slide_index < len(sld_ids):
+                # Unknown slide: let consumers re-check the slide list instead
+                scope = 'slides'
+            else:
+                slide_id = sld_ids[slide_index].id
+                if scope == 'shape':
+                    shape_id = self._shape_id(presentation, sld_ids[slide_index], shape_index)
+                    if shape_id is None:
+                        scope = 'slide'
+
+        self._sequence += 1
+        changes.sequences.append(self._sequence)
+        changes.entries.append((scope, slide_id, shape_id))
+
+        if len(changes.entries) > MAX_CHANGE_LOG_ENTRIES:
+            drop = len(changes.entries) // 2
+            changes.oldest_sequence = changes.sequences[drop - 1]
+            del changes.sequences[:drop]
+            del changes.entries[:drop]
+
+    @staticmethod
+    def _shape_id(presentation, sld_id, shape_index: Optional[int]) -> Optional[int]:
+        """Shape id of the shape at an index on a slide, or None if the index is invalid."""
+        if not isinstance(shape_index, int) or shape_index < 0:
+            return None
+        shapes = presentation.part.related_slide(sld_id.rId).shapes
+        if shape_index >= len(shapes):
+            return None
+        return shapes[shape_index].shape_id
+
+    def collect(self, consumer: Hashable, presentation_id: str, advance: bool = True) -> ChangeSet:
+        """
+        Return the changes a consumer has not seen yet.
+
+        Args:
+            consumer: Any hashable key identifying the consumer, e.g. "search"
+                or ("optimize_slide_text", slide_id)
+            presentation_id: ID of the presentation
+            advance: Whether to mark the returned changes as seen
+
+        Returns:
+            ChangeSet describing what changed since the previous collection
+        """
+        presentation = self.presentations.get(presentation_id)
+        if presentation is None:
+            self._cursors.pop((consumer, presentation_id), None)
+            return ChangeSet(full=True)
+
+        changes = self._changes_for(presentation_id, presentation)
+        cursor = self._cursors.get((consumer, presentation_id))
+        if advance:
+            self._cursors[(consumer, presentation_id)] = (changes.generation, self._sequence)
+
+        if cursor is None or cursor[0] != changes.generation or cursor[1] < changes.oldest_sequence:
+            return ChangeSet(full=True)
+
+        change_set = ChangeSet()
+        for scope, slide_id, shape_id in changes.entries[bisect_right(changes.sequences, cursor[1]):]:
+            if scope == 'all_slides':
+                return ChangeSet(full=True)
+            if scope == 'document':
+                change_set.document_changed = True
+            elif scope == 'slides':
+                change_set.structure_changed = True
+            elif scope == 'slide':
+                change_set.slide_ids.add(slide_id)
+            else:
+                change_set.shape_ids.setdefault(slide_id, set()).add(shape_id)
+        return change_set
+
+
+def changed_shape_indexes(slide, changes: ChangeSet, slide_id: int) -> Optional[Set[int]]:
+    """
+    Translate the changed shape ids of a slide into current shape indexes.
+
+    Args:
+        slide: The slide object
+        changes: ChangeSet returned by ChangeTracker.collect
+        slide_id: Id of the slide
+
+    Returns:
+        None if the whole slide has to be reprocessed, otherwise the indexes of
+        the changed shapes that still exist (empty if nothing changed)
+    """
+    shape_ids = changes.changed_shapes(slide_id)
+    if shape_ids is None or not shape_ids:
+        return shape_ids
+    return {index for index, shape in enumerate(slide.shapes) if shape.shape_id in shape_ids}
@@ -3,12 +3,13 @@ Content management utilities for PowerPoint MCP Server.
 Functions for slides, text, images, tables, charts, and shapes.
 """
 from pptx import Presentation
-from pptx.chart.data import CategoryChartData
 from pptx.enum.chart import XL_CHART_TYPE
 from pptx.enum.text import PP_ALIGN
 from pptx.util import Inches, Pt
 from pptx.dml.color import RGBColor
-from typing import Dict, List, Tuple, Optional, Any
+from pptx.enum.shapes import MSO_SHAPE_TYPE, PP_PLACEHOLDER
+from lxml import etree
+from typing import Dict, Iterator, List, Tuple, Optional, Any
 import tempfile
 import os
 import base64
@@ -410,6 +411,9 @@ def add_chart(slide, chart_type: str, left: float, top: float, width: float, hei
     
     xl_chart_type = chart_type_map.get(chart_type.lower(), XL_CHART_TYPE.COLUMN_CLUSTERED)
     
+    # The chart data/XML writer modules are only loaded once a chart is created
+    from pptx.chart.data import CategoryChartData
+    
     # Create chart data
     chart_data = CategoryChartData()
     chart_data.categories = categories
@@ -522,7 +526,7 @@ def extract_slide_text_content(slide) -> Dict:
                         all_texts.append(text)
                         
                         # Categorize by shape type
-                        if hasattr(shape, 'placeholder_format'):
+                        if shape.is_placeholder:
                             # This is a placeholder
                             placeholder_info = shape_text_info.copy()
                             placeholder_info["placeholder_type"] = str(shape.placeholder_format.type)
@@ -576,4 +580,350 @@ def extract_slide_text_content(slide) -> Dict:
             "success": False,
             "error": f"Failed to extract text content: {str(e)}",
             "text_content": None
-        }
\ No newline at end of file
+        }
+
+
+# Precompiled XPath expressions for extract_slide_text_content_xml
+_TEXT_NAMESPACES = {
+    'a': 'http://schemas.openxmlformats.org/drawingml/2006/main',
+    'p': 'http://schemas.openxmlformats.org/presentationml/2006/main',
+}
+_XPATH_SHAPE_ELEMENTS = etree.XPath(
+    './p:cSld/p:spTree/*[self::p:sp or self::p:grpSp or self::p:graphicFrame'
+    ' or self::p:cxnSp or self::p:pic or self::p:contentPart]',
+    namespaces=_TEXT_NAMESPACES
+)
+_XPATH_TEXT_PARAGRAPHS = etree.XPath(
+    './p:cSld/p:spTree/p:sp/p:txBody/a:p'
+    ' | ./p:cSld/p:spTree/p:graphicFrame/a:graphic/a:graphicData/a:tbl/a:tr/a:tc/a:txBody/a:p',
+    namespaces=_TEXT_NAMESPACES
+)
+_XPATH_PARAGRAPH_CONTENT = etree.XPath('./a:r/a:t | ./a:br | ./a:fld/a:t', namespaces=_TEXT_NAMESPACES)
+_XPATH_PLACEHOLDER = etree.XPath('./*[1]/p:nvPr/p:ph', namespaces=_TEXT_NAMESPACES)
+_XPATH_SHAPE_NAME = etree.XPath('string(./*[1]/p:cNvPr/@name)', namespaces=_TEXT_NAMESPACES)
+_XPATH_TABLE_ROWS = etree.XPath('./a:graphic/a:graphicData/a:tbl/a:tr', namespaces=_TEXT_NAMESPACES)
+_XPATH_CUSTOM_GEOMETRY = etree.XPath('./p:spPr/a:custGeom', namespaces=_TEXT_NAMESPACES)
+_XPATH_PRESET_GEOMETRY = etree.XPath('./p:spPr/a:prstGeom', namespaces=_TEXT_NAMESPACES)
+_XPATH_TEXTBOX_FLAG = etree.XPath('string(./p:nvSpPr/p:cNvSpPr/@txBox)', namespaces=_TEXT_NAMESPACES)
+
+_TAG_SP = '{%s}sp' % _TEXT_NAMESPACES['p']
+_TAG_GRAPHIC_FRAME = '{%s}graphicFrame' % _TEXT_NAMESPACES['p']
+_TAG_TC = '{%s}tc' % _TEXT_NAMESPACES['a']
+_TAG_BR = '{%s}br' % _TEXT_NAMESPACES['a']
+
+_placeholder_type_names = {}
+
+
+def _placeholder_type_name(ph_type: Optional[str]) -> str:
+    """Return str(PP_PLACEHOLDER member) for a p:ph type attribute, caching the lookup."""
+    name = _placeholder_type_names.get(ph_type)
+    if name is None:
+        member = PP_PLACEHOLDER.OBJECT if ph_type is None else PP_PLACEHOLDER.from_xml(ph_type)
+        name = _placeholder_type_names[ph_type] = str(member)
+    return name
+
+
+def _sp_shape_type_name(sp, is_placeholder: bool) -> str:
+    """Mirror python-pptx Shape.shape_type for a p:sp element without building a proxy."""
+    if is_placeholder:
+        return str(MSO_SHAPE_TYPE.PLACEHOLDER)
+    if _XPATH_CUSTOM_GEOMETRY(sp):
+        return str(MSO_SHAPE_TYPE.FREEFORM)
+    is_textbox = _XPATH_TEXTBOX_FLAG(sp) in ('1', 'true')
+    if _XPATH_PRESET_GEOMETRY(sp) and not is_textbox:
+        return str(MSO_SHAPE_TYPE.AUTO_SHAPE)
+    if is_textbox:
+        return str(MSO_SHAPE_TYPE.TEXT_BOX)
+    return str(None)
+
+
+def _paragraph_text(paragraph) -> str:
+    """Text of an a:p element, with a vertical tab for each a:br like python-pptx."""
+    return "".join(
+        "\v" if node.tag == _TAG_BR else (node.text or "")
+        for node in _XPATH_PARAGRAPH_CONTENT(paragraph)
+    )
+
+
+def extract_slide_text_content_xml(slide_element) -> Dict:
+    """
+    Extract all text content from a slide by running XPath over its XML.
+    
+    Produces the same result as extract_slide_text_content, but reads a:t nodes
+    directly instead of creating python-pptx proxies for every shape, paragraph,
+    run and cell. Placeholder and table membership are derived from the ancestors
+    of each paragraph.
+    
+    Args:
+        slide_element: The p:sld element of the slide (slide._element), or a
+            p:sld element parsed straight from the package XML
+        
+    Returns:
+        Dictionary containing all text content organized by source type
+    """
+    try:
+        text_content = {
+            "slide_title": "",
+            "placeholders": [],
+            "text_shapes": [],
+            "table_text": [],
+            "all_text_combined": ""
+        }
+        
+        shape_indexes = {elm: i for i, elm in enumerate(_XPATH_SHAPE_ELEMENTS(slide_element))}
+        
+        # Group paragraph text by owning shape (and by row/cell for tables), in document order
+        shape_paragraphs = {}
+        table_cells = {}
+        for paragraph in _XPATH_TEXT_PARAGRAPHS(slide_element):
+            container = paragraph.getparent().getparent()
+            if container.tag == _TAG_TC:
+                tr = container.getparent()
+                frame = tr.getparent().getparent().getparent().getparent()
+                rows = table_cells.setdefault(frame, {})
+                cells = rows.setdefault(tr, {})
+                cells.setdefault(container, []).append(_paragraph_text(paragraph))
+            else:
+                shape_paragraphs.setdefault(container, []).append(_paragraph_text(paragraph))
+        
+        all_texts = []
+        title_found = False
+        
+        for shape, i in shape_indexes.items():
+            ph_elms = _XPATH_PLACEHOLDER(shape)
+            ph = ph_elms[0] if ph_elms else None
+            is_sp = shape.tag == _TAG_SP
+            
+            # The title is the first placeholder with idx 0, as in SlideShapes.title
+            if ph is not None and not title_found and int(ph.get('idx', 0)) == 0:
+                title_found = True
+                if is_sp:
+                    title_text = "\n".join(shape_paragraphs.get(shape, [])).strip()
+                    if title_text:
+                        text_content["slide_title"] = title_text
+                        all_texts.insert(0, title_text)
+            
+            if is_sp:
+                text = "\n".join(shape_paragraphs.get(shape, [])).strip()
+                if not text:
+                    continue
+                all_texts.append(text)
+                
+                shape_text_info = {
+                    "shape_index": i,
+                    "shape_name": _XPATH_SHAPE_NAME(shape),
+                    "shape_type": _sp_shape_type_name(shape, ph is not None),
+                    "text": text
+                }
+                if ph is not None:
+                    shape_text_info["placeholder_type"] = _placeholder_type_name(ph.get('type'))
+                    shape_text_info["placeholder_idx"] = int(ph.get('idx', 0))
+                    text_content["placeholders"].append(shape_text_info)
+                else:
+                    text_content["text_shapes"].append(shape_text_info)
+            
+            elif shape.tag == _TAG_GRAPHIC_FRAME and _XPATH_TABLE_ROWS(shape):
+                rows = table_cells.get(shape, {})
+                table_texts = []
+                for row_idx, tr in enumerate(_XPATH_TABLE_ROWS(shape)):
+                    row_texts = []
+                    for cell_paragraphs in rows.get(tr, {}).values():
+                        cell_text = "\n".join(cell_paragraphs).strip()
+                        if cell_text:
+                            row_texts.append(cell_text)
+                            all_texts.append(cell_text)
+                    if row_texts:
+                        table_texts.append({
+                            "row": row_idx,
+                            "cells": row_texts
+                        })
+                
+                if table_texts:
+                    text_content["table_text"].append({
+                        "shape_index": i,
+                        "shape_name": _XPATH_SHAPE_NAME(shape),
+                        "table_content": table_texts
+                    })
+        
+        text_content["all_text_combined"] = "\n".join(all_texts)
+        
+        return {
+            "success": True,
+            "text_content": text_content,
+            "total_text_shapes": len(text_content["placeholders"]) + len(text_content["text_shapes"]),
+            "has_title": bool(text_content["slide_title"]),
+            "has_tables": len(text_content["table_text"]) > 0
+        }
+        
+    except Exception as e:
+        return {
+            "success": False,
+            "error": f"Failed to extract text content: {str(e)}",
+            "text_content": None
+        }
+
+
+_XPATH_SHAPE_PARAGRAPHS = etree.XPath('.//a:p', namespaces=_TEXT_NAMESPACES)
+_XPATH_SHAPE_ID = etree.XPath('string(./*[1]/p:cNvPr/@id)', namespaces=_TEXT_NAMESPACES)
+
+
+def iter_shape_text_xml(slide_element) -> Iterator[Tuple[int, str]]:
+    """
+    Yield the text of every top-level shape on a slide, read directly from its XML.
+    
+    Text inside group shapes and table cells is attributed to the top-level
+    shape that contains it, so shape indexes line up with slide.shapes.
+    
+    Args:
+        slide_element: The p:sld element of the slide (slide._element)
+        
+    Yields:
+        Tuples of (shape_index, text) for shapes that contain any text
+    """
+    for shape_index, shape in enumerate(_XPATH_SHAPE_ELEMENTS(slide_element)):
+        text = _shape_text(shape)
+        if text:
+            yield shape_index, text
+
+
+def get_shape_text_by_id_xml(slide_element, shape_ids) -> Dict[int, Tuple[int, str]]:
+    """
+    Read the text of specific shapes on a slide, addressed by shape id.
+    
+    Args:
+        slide_element: The p:sld element of the slide (slide._element)
+        shape_ids: Ids (cNvPr/@id) of the shapes to read
+        
+    Returns:
+        Dictionary mapping each shape id found to (shape_index, text); text is
+        empty for shapes without any
+    """
+    wanted = {str(shape_id): shape_id for shape_id in shape_ids}
+    found = {}
+    for shape_index, shape in enumerate(_XPATH_SHAPE_ELEMENTS(slide_element)):
+        shape_id = wanted.get(_XPATH_SHAPE_ID(shape))
+        if shape_id is not None:
+            found[shape_id] = (shape_index, _shape_text(shape))
+    return found
+
+
+def _shape_text(shape) -> str:
+    """All text in a shape element, including group members and table cells."""
+    return "\n".join(_paragraph_text(p) for p in _XPATH_SHAPE_PARAGRAPHS(shape)).strip()
+
+
+_XPATH_TEXT_FRAME_PARAGRAPHS = etree.XPath('./p:txBody/a:p', namespaces=_TEXT_NAMESPACES)
+
+
+def iter_text_frame_paragraphs_xml(slide_element) -> Iterator[Tuple[int, List[str]]]:
+    """
+    Yield the paragraph texts of every top-level shape that has a text frame.
+    
+    Only p:sp shapes carry a text frame, matching the shapes for which
+    python-pptx exposes shape.text_frame.
+    
+    Args:
+        slide_element: The p:sld element of the slide (slide._element)
+        
+    Yields:
+        Tuples of (shape_index, list of paragraph texts)
+    """
+    for shape_index, shape in enumerate(_XPATH_SHAPE_ELEMENTS(slide_element)):
+        if shape.tag == _TAG_SP:
+            paragraphs = _XPATH_TEXT_FRAME_PARAGRAPHS(shape)
+            if paragraphs:
+                yield shape_index, [_paragraph_text(p) for p in paragraphs]
+
+
+# Field selections supported by iter_presentation_text
+TEXT_EXTRACTION_FIELDS = ('all', 'titles', 'text', 'tables')
+
+
+def iter_slide_text_content(presentation: Presentation, start: int = 0,
+                            stop: Optional[int] = None) -> Iterator[Tuple[int, Any, Dict]]:
+    """
+    Lazily extract text content slide by slide.
+    
+    Only the slides in [start, stop) are visited, so callers can page through
+    large decks without holding the whole extraction in memory.
+    
+    Args:
+        presentation: The Presentation object
+        start: Index of the first slide to extract
+        stop: Index after the last slide to extract (defaults to the end of the deck)
+        
+    Yields:
+        Tuples of (slide_index, slide, extraction result from extract_slide_text_content)
+    """
+    slides = presentation.slides
+    slide_count = len(slides)
+    stop = slide_count if stop is None else min(stop, slide_count)
+    
+    for slide_index in range(max(start, 0), stop):
+        slide = slides[slide_index]
+        yield slide_index, slide, extract_slide_text_content_xml(slide._element)
+
+
+def build_text_record(slide_index: int, result: Dict, fields: str = 'all') -> Dict:
+    """
+    Build a per-slide text record from an extraction result.
+    
+    Args:
+        slide_index: Index of the slide the result belongs to
+        result: Result of extract_slide_text_content or extract_slide_text_content_xml
+        fields: 'all' (full text_content), 'titles' (slide titles only),
+                'text' (combined text only) or 'tables' (table text only)
+        
+    Returns:
+        Dictionary with 'slide_index' and the selected fields, or 'error'
+    """
+    record = {"slide_index": slide_index}
+    
+    if not result["success"]:
+        record["error"] = result.get("error", "Unknown error")
+        return record
+    
+    text_content = result["text_content"]
+    if fields == 'all':
+        record["text_content"] = text_content
+    elif fields == 'titles':
+        record["slide_title"] = text_content["slide_title"]
+    elif fields == 'text':
+        record["text"] = text_content["all_text_combined"]
+    else:
+        record["table_text"] = text_content["table_text"]
+    return record
+
+
+def iter_presentation_text(presentation: Presentation, start: int = 0, stop: Optional[int] = None,
+                           fields: str = 'all', include_slide_info: bool = False) -> Iterator[Dict]:
+    """
+    Generate one text record per slide, restricted to the selected fields.
+    
+    Args:
+        presentation: The Presentation object
+        start: Index of the first slide to extract
+        stop: Index after the last slide to extract (defaults to the end of the deck)
+        fields: 'all' (full text_content), 'titles' (slide titles only),
+                'text' (combined text only) or 'tables' (table text only)
+        include_slide_info: Whether to add layout name and shape statistics
+        
+    Yields:
+        Dictionary per slide with 'slide_index' and the selected fields
+    """
+    if fields not in TEXT_EXTRACTION_FIELDS:
+        raise ValueError(f"Invalid fields: '{fields}'. Must be one of: {', '.join(TEXT_EXTRACTION_FIELDS)}")
+    
+    for slide_index, slide, result in iter_slide_text_content(presentation, start, stop):
+        record = build_text_record(slide_index, result, fields)
+        if "error" in record:
+            yield record
+            continue
+        
+        if include_slide_info:
+            record["layout_name"] = slide.slide_layout.name
+            record["total_text_shapes"] = result["total_text_shapes"]
+            record["has_title"] = result["has_title"]
+            record["has_tables"] = result["has_tables"]
+        
+        yield record
@@ -2,6 +2,7 @@
 Core utility functions for PowerPoint MCP Server.
 Basic operations and error handling.
 """
+import multiprocessing
 from typing import Any, Callable, List, Tuple, Optional
 
 
@@ -52,4 +53,21 @@ def safe_operation(operation_name: str, operation_func: Callable, error_message:
         return None, error_msg
     except Exception as e:
         error_msg = error_message or f"Failed to execute {operation_name}: {str(e)}"
-        return None, error_msg
\ No newline at end of file
+        return None, error_msg
+
+
+def get_worker_context():
+    """
+    Multiprocessing context for worker processes started by the server.
+    
+    The server runs an event loop and worker threads, and a forked child
+    inherits every lock those threads held at the time, possibly forever.
+    Workers are therefore started by the forkserver, or spawned where it is
+    not available (Windows), instead of being forked from the server.
+    
+    Returns:
+        A multiprocessing context to create processes and pools from
+    """
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context("forkserver")
+    return multiprocessing.get_context("spawn")
@@ -5,12 +5,14 @@ Functions for themes, colors, fonts, backgrounds, and visual effects.
 from pptx import Presentation
 from pptx.util import Inches, Pt
 from pptx.dml.color import RGBColor
-from typing import Dict, List, Tuple, Optional, Any
-from PIL import Image, ImageEnhance, ImageFilter, ImageDraw
+from typing import Dict, Iterator, List, Tuple, Optional, Any
+from PIL import Image
+from collections import deque
+from multiprocessing.connection import wait
 import tempfile
+import time
 import os
-from fontTools.ttLib import TTFont
-from fontTools.subset import Subsetter
+from utils.core_utils import get_worker_context
 
 # Professional color schemes
 PROFESSIONAL_COLOR_SCHEMES = {
@@ -80,6 +82,29 @@ PROFESSIONAL_FONTS = {
     }
 }
 
+# Image enhancement presets used by apply_professional_image_enhancement
+IMAGE_ENHANCEMENT_PRESETS = {
+    'presentation': {
+        'brightness': 1.1,
+        'contrast': 1.15,
+        'saturation': 1.1,
+        'sharpness': 1.2
+    },
+    'bright': {
+        'brightness': 1.2,
+        'contrast': 1.1,
+        'saturation': 1.2,
+        'sharpness': 1.1
+    },
+    'soft': {
+        'brightness': 1.05,
+        'contrast': 0.95,
+        'saturation': 0.95,
+        'sharpness': 0.9,
+        'blur_radius': 0.5
+    }
+}
+
 
 def get_professional_color(scheme_name: str, color_type: str) -> Tuple[int, int, int]:
     """
@@ -340,6 +365,8 @@ def create_gradient_image(width: int, height: int, start_color: Tuple[int, int,
     Returns:
         PIL Image object with gradient
     """
+    from PIL import ImageDraw
+    
     img = Image.new('RGB', (width, height))
     draw = ImageDraw.Draw(img)
     
@@ -418,6 +445,8 @@ def enhance_image_with_pillow(image_path: str, brightness: float = 1.0, contrast
     if not os.path.exists(image_path):
         raise FileNotFoundError(f"Image file not found: {image_path}")
     
+    from PIL import ImageEnhance, ImageFilter
+    
     # Open image
     img = Image.open(image_path)
     
@@ -472,30 +501,206 @@ def apply_professional_image_enhancement(image_path: str, style: str = 'presenta
     Returns:
         Path to enhanced image
     """
-    enhancement_presets = {
-        'presentation': {
-            'brightness': 1.1,
-            'contrast': 1.15,
-            'saturation': 1.1,
-            'sharpness': 1.2
-        },
-        'bright': {
-            'brightness': 1.2,
-            'contrast': 1.1,
-            'saturation': 1.2,
-            'sharpness': 1.1
-        },
-        'soft': {
-            'brightness': 1.05,
-            'contrast': 0.95,
-            'saturation': 0.95,
-            'sharpness': 0.9,
-            'blur_radius': 0.5
-        }
+    preset = IMAGE_ENHANCEMENT_PRESETS.get(style, IMAGE_ENHANCEMENT_PRESETS['presentation'])
+    return enhance_image_with_pillow(image_path, output_path=output_path, **preset)
+
+
+def _enhance_image_worker(image_path: str, style: str, output_path: Optional[str]) -> Dict:
+    """Enhance a single image of a batch inside a worker process."""
+    enhanced_path = apply_professional_image_enhancement(image_path, style=style, output_path=output_path)
+    return {
+        'image_path': image_path,
+        'enhanced_path': enhanced_path
     }
+
+
+def _enhance_worker_loop(connection) -> None:
+    """Worker process entry point: run jobs received on connection until it closes or None arrives."""
+    while True:
+        try:
+            job = connection.recv()
+        except EOFError:
+            return
+        if job is None:
+            return
+        # Tell the parent the job was picked up, which starts its timeout
+        connection.send(('started', None))
+        try:
+            connection.send(('done', _enhance_image_worker(*job)))
+        except Exception as e:
+            connection.send(('error', str(e)))
+
+
+class _EnhanceWorker:
+    """A process enhancing one image at a time; terminated and replaced when a job times out."""
+
+    __slots__ = ('process', 'connection', 'image_path', 'started')
+
+    def __init__(self, context):
+        self.connection, child_connection = context.Pipe()
+        self.process = context.Process(target=_enhance_worker_loop, args=(child_connection,), daemon=True)
+        self.process.start()
+        child_connection.close()
+        # Image of the job in progress, or None when idle
+        self.image_path = None
+        # Monotonic time the job was picked up, or None until then
+        self.started = None
+
+    def submit(self, image_path: str, style: str, output_path: Optional[str]) -> None:
+        self.connection.send((image_path, style, output_path))
+        self.image_path = image_path
+        self.started = None
+
+    def stop(self, kill: bool = False) -> None:
+        """Stop the process: let an idle one exit, terminate a busy or stuck one."""
+        if not kill and self.image_path is None and self.process.is_alive():
+            try:
+                self.connection.send(None)
+                self.process.join(1)
+            except OSError:
+                pass
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join()
+        self.connection.close()
+
+
+def _batch_output_path(output_name: str, output_dir: Optional[str], taken: set) -> Optional[str]:
+    """
+    Build the output path for a batch job, or None to use a temporary file.
     
-    preset = enhancement_presets.get(style, enhancement_presets['presentation'])
-    return enhance_image_with_pillow(image_path, output_path=output_path, **preset)
+    '_enhanced' is added before the extension, and a counter when the name is
+    already used by another file of the batch or exists in output_dir.
+    """
+    if output_dir is None:
+        return None
+    # Keep the output inside output_dir whatever the name contains
+    parts = [part for part in os.path.normpath(os.path.splitdrive(output_name)[1]).split(os.sep) if part not in ('', os.curdir, os.pardir)]
+    stem, ext = os.path.splitext(os.path.join(*parts) if parts else 'image')
+    ext = ext or '.png'
+    output_path = os.path.join(output_dir, f"{stem}_enhanced{ext}")
+    counter = 2
+    while output_path in taken or os.path.exists(output_path):
+        output_path = os.path.join(output_dir, f"{stem}_enhanced_{counter}{ext}")
+        counter += 1
+    taken.add(output_path)
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    return output_path
+
+
+def enhance_images_batch(image_paths: List[str], style: str = 'presentation',
+                         output_dir: str = None, max_workers: int = None,
+                         timeout_per_file: float = None,
+                         output_names: Optional[List[str]] = None) -> Iterator[Dict]:
+    """
+    Enhance many images in parallel using worker processes.
+    
+    Results are yielded as soon as each file finishes, so callers can stream
+    them instead of waiting for the whole batch. A file's timeout runs from
+    the moment a worker picks it up; a worker that exceeds it is terminated
+    and replaced, so a hung file neither keeps running nor delays the rest.
+    
+    Args:
+        image_paths: Paths of the images to enhance
+        style: Enhancement preset name (see IMAGE_ENHANCEMENT_PRESETS)
+        output_dir: Directory for enhanced files (if None, generates temporary files)
+        max_workers: Maximum number of files processed concurrently (defaults to CPU count)
+        timeout_per_file: Seconds a single file may run before it is reported as timed out
+        output_names: Name of each image's output file relative to output_dir, e.g. its
+            path relative to a glob root (defaults to the image's base name)
+        
+    Yields:
+        Dictionary per file with 'image_path', 'success' and either 'enhanced_path' or 'error'
+    """
+    if style not in IMAGE_ENHANCEMENT_PRESETS:
+        raise ValueError(
+            f"Unknown enhancement style: '{style}'. Available styles: {', '.join(IMAGE_ENHANCEMENT_PRESETS)}"
+        )
+    
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = max(1, min(max_workers, len(image_paths) or 1))
+    
+    if output_dir is not None:
+        os.makedirs(output_dir, exist_ok=True)
+    
+    if output_names is None:
+        output_names = [os.path.basename(image_path) for image_path in image_paths]
+    elif len(output_names) != len(image_paths):
+        raise ValueError(f"Got {len(output_names)} output names for {len(image_paths)} images")
+    
+    context = get_worker_context()
+    pending_paths = deque(zip(image_paths, output_names))
+    taken_paths = set()
+    workers: List[_EnhanceWorker] = []
+    
+    try:
+        while True:
+            # Hand a file to every idle worker, starting workers up to max_workers
+            idle = [worker for worker in workers if worker.image_path is None]
+            while pending_paths and (idle or len(workers) < max_workers):
+                image_path, output_name = pending_paths.popleft()
+                if not os.path.exists(image_path):
+                    yield {'image_path': image_path, 'success': False,
+                           'error': f"Image file not found: {image_path}"}
+                    continue
+                if idle:
+                    worker = idle.pop()
+                else:
+                    worker = _EnhanceWorker(context)
+                    workers.append(worker)
+                worker.submit(image_path, style, _batch_output_path(output_name, output_dir, taken_paths))
+            
+            busy = [worker for worker in workers if worker.image_path is not None]
+            if not busy:
+                if pending_paths:
+                    continue
+                break
+            
+            wait_timeout = None
+            if timeout_per_file:
+                deadlines = [worker.started + timeout_per_file for worker in busy if worker.started is not None]
+                if deadlines:
+                    wait_timeout = max(0.0, min(deadlines) - time.monotonic())
+            wait([worker.connection for worker in busy] + [worker.process.sentinel for worker in busy],
+                 wait_timeout)
+            
+            for worker in busy:
+                image_path = worker.image_path
+                try:
+                    while worker.image_path is not None and worker.connection.poll():
+                        kind, payload = worker.connection.recv()
+                        if kind == 'started':
+                            worker.started = time.monotonic()
+                        else:
+                            worker.image_path = None
+                            if kind == 'done':
+                                payload['success'] = True
+                                yield payload
+                            else:
+                                yield {'image_path': image_path, 'success': False, 'error': payload}
+                    if worker.image_path is None or worker.process.is_alive():
+                        continue
+                except (EOFError, OSError):
+                    # The process died, possibly before its exit was visible
+                    pass
+                workers.remove(worker)
+                worker.stop(kill=True)
+                yield {'image_path': image_path, 'success': False,
+                       'error': f"Worker process exited with code {worker.process.exitcode}"}
+            
+            if timeout_per_file:
+                now = time.monotonic()
+                for worker in [worker for worker in workers if worker.started is not None
+                               and worker.image_path is not None and now - worker.started > timeout_per_file]:
+                    image_path = worker.image_path
+                    workers.remove(worker)
+                    worker.stop(kill=True)
+                    yield {'image_path': image_path, 'success': False,
+                           'error': f"Timed out after {timeout_per_file} seconds"}
+    finally:
+        for worker in workers:
+            worker.stop()
 
 
 # Picture effects functions (simplified implementations)
@@ -581,6 +786,9 @@ def analyze_font_file(font_path: str) -> Dict:
     Returns:
         Dictionary with font analysis results
     """
+    # fontTools is only needed by the font tools; importing it costs ~0.1s at startup
+    from fontTools.ttLib import TTFont
+    
     try:
         font = TTFont(font_path)
         
@@ -624,6 +832,9 @@ def optimize_font_for_presentation(font_path: str, output_path: str = None,
     Returns:
         Path to optimized font file
     """
+    from fontTools.ttLib import TTFont
+    from fontTools.subset import Subsetter
+    
     try:
         font = TTFont(font_path)
         
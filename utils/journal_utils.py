@@ -0,0 +1,332 @@
+"""
+Journal utilities for PowerPoint MCP Server.
+Keeps an append-only journal of the edits to each loaded presentation, with
+periodic checkpoints, so that the store can be rebuilt after a restart.
+"""
+import json
+import os
+import shutil
+import tempfile
+import time
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+from urllib.parse import quote
+from utils.package_utils import ZipCompressionPolicy
+from utils.presentation_utils import open_presentation, save_presentation_to_bytes
+from utils.transfer_utils import UPLOAD_SCHEME
+
+
+# Journal entries after which a presentation is checkpointed; recovery replays at most this many
+DEFAULT_CHECKPOINT_INTERVAL = 50
+
+# Arguments that name files a tool reads; a call whose file exists is checkpointed rather than journaled
+FILE_ARGUMENTS = frozenset({
+    "file_path", "file_paths", "template_path", "font_path", "image_path", "image_paths", "image_source", "sources"
+})
+
+JOURNAL_FILE_NAME = "journal.jsonl"
+CHECKPOINT_META_FILE_NAME = "checkpoint.json"
+_CHECKPOINT_PREFIX = "checkpoint-"
+
+
+class _JournalState:
+    """Journal of one presentation."""
+
+    __slots__ = ('presentation', 'directory', 'sequence', 'checkpoint_file', 'entries_since_checkpoint')
+
+    def __init__(self, presentation, directory: str, sequence: int = 0, checkpoint_file: Optional[str] = None):
+        # The object the journal describes; any other object under the same ID is checkpointed
+        self.presentation = presentation
+        self.directory = directory
+        # Sequence number of the last entry or checkpoint
+        self.sequence = sequence
+        self.checkpoint_file = checkpoint_file
+        self.entries_since_checkpoint = 0
+
+
+def _write_file_atomically(file_path: str, data: bytes, sync: bool) -> None:
+    """Write data to a temporary file next to file_path and move it into place."""
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(file_path), suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as temp_file:
+            temp_file.write(data)
+            if sync:
+                temp_file.flush()
+                os.fsync(temp_file.fileno())
+        os.replace(temp_path, file_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def _read_entries(journal_path: str) -> Iterator[Dict]:
+    """Entries of a journal file; a line cut short by a crash ends the journal."""
+    try:
+        journal_file = open(journal_path, encoding='utf-8')
+    except FileNotFoundError:
+        return
+    with journal_file:
+        for line in journal_file:
+            try:
+                yield json.loads(line)
+            except json.JSONDecodeError:
+                return
+
+
+def _reads_file(value: Any, is_path: bool) -> bool:
+    """
+    Whether an argument value, or any value nested in it (e.g. image_paths), names
+    an upload, or, for a file argument (is_path), a local file.
+    """
+    if isinstance(value, str):
+        return value.startswith(UPLOAD_SCHEME) or (is_path and os.path.isfile(value))
+    if isinstance(value, dict):
+        return any(_reads_file(item, is_path) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return any(_reads_file(item, is_path) for item in value)
+    return False
+
+
+class OperationJournal:
+    """
+    Durable record of the presentations in the store.
+
+    Each presentation has a directory holding its last checkpoint (a saved
+    .pptx) and a journal of the tool calls made since, one JSON line per call.
+    After every tool call the change tracker tells which presentations
+    changed: a call to a replayable tool that only changed the presentation
+    it addressed is appended to that journal, anything else (a new or
+    replaced presentation, a change by another tool, a call reading a file
+    that may not survive a restart) is checkpointed. Every checkpoint_interval
+    entries the presentation is checkpointed and its journal emptied, so
+    recovery loads one file and replays a bounded tail.
+    """
+
+    # Consumer key used with the change tracker
+    CHANGE_CONSUMER = "journal"
+
+    def __init__(self, directory: str, presentations: Dict, change_tracker, replayable_tools: Iterable[str],
+                 checkpoint_interval: int = DEFAULT_CHECKPOINT_INTERVAL, sync: bool = False):
+        if checkpoint_interval < 1:
+            raise ValueError(f"checkpoint_interval must be at least 1, got {checkpoint_interval}")
+        self.directory = directory
+        self.presentations = presentations
+        self.change_tracker = change_tracker
+        self.replayable_tools = frozenset(replayable_tools)
+        self.checkpoint_interval = checkpoint_interval
+        # Whether to fsync every write; without it writes survive a process crash but not a machine crash
+        self.sync = sync
+        # Checkpoints store already-compressed media and deflate in parallel
+        self.compression = ZipCompressionPolicy.from_preset("fast")
+        self._states: Dict[str, _JournalState] = {}
+        self._replaying = False
+        os.makedirs(directory, exist_ok=True)
+
+    def _presentation_directory(self, pres_id: str) -> str:
+        return os.path.join(self.directory, quote(pres_id, safe=''))
+
+    def _is_replayable(self, tool_name: str, arguments: Dict) -> bool:
+        """Whether a call can be replayed after a restart: a journaled tool reading no local file or upload."""
+        if tool_name not in self.replayable_tools:
+            return False
+        return not any(_reads_file(value, name in FILE_ARGUMENTS) for name, value in arguments.items())
+
+    def after_call(self, tool_name: str, arguments: Dict, pres_id: Optional[str], result: Any = None) -> None:
+        """
+        Journal what a tool call changed.
+
+        A call that returned an error is neither appended nor checkpointed:
+        replaying it would only fail again on recovery.
+
+        Args:
+            tool_name: Name of the tool that ran
+            arguments: Its arguments
+            pres_id: ID of the presentation it addressed, if any
+            result: What the tool returned
+        """
+        if self._replaying or (isinstance(result, dict) and "error" in result):
+            return
+
+        replayable = self._is_replayable(tool_name, arguments)
+        first_error = None
+        for presentation_id, presentation in list(self.presentations.items()):
+            changes = self.change_tracker.collect(self.CHANGE_CONSUMER, presentation_id)
+            state = self._states.get(presentation_id)
+            try:
+                if state is None or state.presentation is not presentation:
+                    self.checkpoint(presentation_id)
+                elif changes.is_empty:
+                    continue
+                elif replayable and presentation_id == pres_id:
+                    self._append(presentation_id, state, tool_name, {**arguments, "presentation_id": presentation_id})
+                else:
+                    self.checkpoint(presentation_id)
+            except Exception as e:
+                # The journal on disk lacks this change: checkpoint on the next call instead of appending to it
+                state = self._states.get(presentation_id)
+                if state is not None:
+                    state.presentation = None
+                if first_error is None:
+                    first_error = e
+
+        for stale_id in [stale_id for stale_id in self._states if stale_id not in self.presentations]:
+            self.discard(stale_id)
+
+        if first_error is not None:
+            raise first_error
+
+    def _append(self, pres_id: str, state: _JournalState, tool_name: str, arguments: Dict) -> None:
+        state.sequence += 1
+        entry = {"sequence": state.sequence, "time": time.time(), "tool": tool_name, "arguments": arguments}
+        with open(os.path.join(state.directory, JOURNAL_FILE_NAME), 'a', encoding='utf-8') as journal_file:
+            journal_file.write(json.dumps(entry, default=str) + "\n")
+            journal_file.flush()
+            if self.sync:
+                os.fsync(journal_file.fileno())
+
+        state.entries_since_checkpoint += 1
+        if state.entries_since_checkpoint >= self.checkpoint_interval:
+            self.checkpoint(pres_id)
+
+    def checkpoint(self, pres_id: str) -> Dict:
+        """
+        Save a presentation as its new checkpoint and empty its journal.
+
+        The checkpoint file is written under a new name and only then made
+        current in checkpoint.json, so a crash at any point leaves either the
+        old checkpoint and journal or the new checkpoint in effect.
+
+        Returns:
+            Dictionary with the checkpoint 'file_path' and its 'sequence'
+        """
+        presentation = self.presentations[pres_id]
+        state = self._states.get(pres_id)
+        if state is None:
+            state = _JournalState(presentation, self._presentation_directory(pres_id))
+            os.makedirs(state.directory, exist_ok=True)
+            meta = self._read_meta(state.directory)
+            if meta is not None:
+                state.sequence = meta["sequence"]
+            self._states[pres_id] = state
+
+        state.sequence += 1
+        checkpoint_file = f"{_CHECKPOINT_PREFIX}{state.sequence:010d}.pptx"
+        data = save_presentation_to_bytes(presentation, self.compression).getvalue()
+        _write_file_atomically(os.path.join(state.directory, checkpoint_file), data, self.sync)
+        meta = {"presentation_id": pres_id, "sequence": state.sequence, "file": checkpoint_file, "created": time.time()}
+        _write_file_atomically(
+            os.path.join(state.directory, CHECKPOINT_META_FILE_NAME), json.dumps(meta).encode('utf-8'), self.sync
+        )
+
+        # Entries up to the checkpoint's sequence are skipped on recovery even if this is cut short
+        open(os.path.join(state.directory, JOURNAL_FILE_NAME), 'w').close()
+        state.presentation = presentation
+        state.checkpoint_file = checkpoint_file
+        state.entries_since_checkpoint = 0
+        self._remove_old_checkpoints(state)
+        return {"file_path": os.path.join(state.directory, checkpoint_file), "sequence": state.sequence}
+
+    @staticmethod
+    def _remove_old_checkpoints(state: _JournalState) -> None:
+        for file_name in os.listdir(state.directory):
+            if file_name.startswith(_CHECKPOINT_PREFIX) and file_name != state.checkpoint_file:
+                try:
+                    os.remove(os.path.join(state.directory, file_name))
+                except OSError:
+                    # Still open elsewhere (e.g. by lazily loaded media on Windows); removed next time
+                    pass
+
+    @staticmethod
+    def _read_meta(directory: str) -> Optional[Dict]:
+        try:
+            with open(os.path.join(directory, CHECKPOINT_META_FILE_NAME), encoding='utf-8') as meta_file:
+                return json.load(meta_file)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+
+    def discard(self, pres_id: str) -> None:
+        """Delete the checkpoint and journal of a presentation no longer in the store."""
+        state = self._states.pop(pres_id, None)
+        directory = state.directory if state is not None else self._presentation_directory(pres_id)
+        shutil.rmtree(directory, ignore_errors=True)
+
+    def recover(self, replay: Callable[[str, Dict], Any]) -> Dict:
+        """
+        Rebuild the store from the checkpoints and journals on disk.
+
+        Each presentation is opened from its last checkpoint and the journal
+        entries written after it are replayed in order. A presentation with an
+        entry that fails to replay is checkpointed as recovered, so the
+        failure is not repeated on the next restart.
+
+        Args:
+            replay: Called with (tool name, arguments) for each entry; returns
+                the tool's result, a dictionary with 'error' on failure
+
+        Returns:
+            Dictionary with the recovered 'presentations' (ID, slide count,
+            entries replayed and failed) and the 'recovery_time_ms'
+        """
+        start_time = time.perf_counter()
+        recovered: List[Dict] = []
+        for directory_name in sorted(os.listdir(self.directory)):
+            directory = os.path.join(self.directory, directory_name)
+            meta = self._read_meta(directory) if os.path.isdir(directory) else None
+            if meta is None:
+                continue
+
+            pres_id = meta["presentation_id"]
+            try:
+                presentation = open_presentation(os.path.join(directory, meta["file"]), lazy_media=True)
+            except Exception as e:
+                recovered.append({"presentation_id": pres_id, "error": f"Failed to open checkpoint: {str(e)}"})
+                continue
+            self.presentations[pres_id] = presentation
+
+            state = _JournalState(presentation, directory, meta["sequence"], meta["file"])
+            self._states[pres_id] = state
+            replayed = failed = 0
+            self._replaying = True
+            try:
+                for entry in _read_entries(os.path.join(directory, JOURNAL_FILE_NAME)):
+                    if entry["sequence"] <= meta["sequence"]:
+                        continue
+                    try:
+                        result = replay(entry["tool"], entry["arguments"])
+                    except Exception as e:
+                        result = {"error": str(e)}
+                    if isinstance(result, dict) and "error" in result:
+                        failed += 1
+                    else:
+                        replayed += 1
+                    state.sequence = entry["sequence"]
+                    state.entries_since_checkpoint += 1
+            finally:
+                self._replaying = False
+
+            self.change_tracker.collect(self.CHANGE_CONSUMER, pres_id)
+            state.presentation = self.presentations[pres_id]
+            if failed:
+                self.checkpoint(pres_id)
+            recovered.append({
+                "presentation_id": pres_id,
+                "slide_count": len(self.presentations[pres_id].slides),
+                "replayed": replayed,
+                "failed": failed
+            })
+
+        return {
+            "presentations": recovered,
+            "recovery_time_ms": round((time.perf_counter() - start_time) * 1000, 3)
+        }
+
+    def get_stats(self) -> Dict:
+        """Journal directory, checkpoint interval and the journal length of each presentation."""
+        return {
+            "directory": self.directory,
+            "checkpoint_interval": self.checkpoint_interval,
+            "presentations": {
+                pres_id: {"sequence": state.sequence, "entries_since_checkpoint": state.entries_since_checkpoint}
+                for pres_id, state in self._states.items()
+            }
+        }
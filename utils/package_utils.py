@@ -0,0 +1,798 @@
+"""
+Package-level utilities for PowerPoint MCP Server.
+Reads slide XML straight out of .pptx zip archives without building a Presentation.
+"""
+import io
+import os
+import posixpath
+import struct
+import time
+import zipfile
+import zlib
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from typing import Dict, Iterator, List, Optional, Tuple
+from lxml import etree
+from pptx.oxml import parse_xml
+import utils.content_utils as content_utils
+from utils.core_utils import get_worker_context
+
+
+_PACKAGE_NAMESPACES = {
+    'p': 'http://schemas.openxmlformats.org/presentationml/2006/main',
+    'r': 'http://schemas.openxmlformats.org/officeDocument/2006/relationships',
+    'pr': 'http://schemas.openxmlformats.org/package/2006/relationships',
+    'ct': 'http://schemas.openxmlformats.org/package/2006/content-types',
+    'p14': 'http://schemas.microsoft.com/office/powerpoint/2010/main',
+}
+_RT_OFFICE_DOCUMENT = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument'
+_RT_SLIDE_LAYOUT = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships/slideLayout'
+_RT_CORE_PROPERTIES = 'http://schemas.openxmlformats.org/package/2006/relationships/metadata/core-properties'
+
+_XPATH_RELATIONSHIPS = etree.XPath('./pr:Relationship', namespaces=_PACKAGE_NAMESPACES)
+_XPATH_SLIDE_RIDS = etree.XPath('./p:sldIdLst/p:sldId/@r:id', namespaces=_PACKAGE_NAMESPACES)
+_XPATH_CSLD_NAME = etree.XPath('string(./p:cSld/@name)', namespaces=_PACKAGE_NAMESPACES)
+_XPATH_MASTER_RIDS = etree.XPath('./p:sldMasterIdLst/p:sldMasterId/@r:id', namespaces=_PACKAGE_NAMESPACES)
+_XPATH_LAYOUT_RIDS = etree.XPath('./p:sldLayoutIdLst/p:sldLayoutId/@r:id', namespaces=_PACKAGE_NAMESPACES)
+_XPATH_SLIDE_IDS = etree.XPath('./p:sldIdLst/p:sldId', namespaces=_PACKAGE_NAMESPACES)
+_XPATH_SECTIONS = etree.XPath('./p:extLst/p:ext/p14:sectionLst/p14:section', namespaces=_PACKAGE_NAMESPACES)
+_XPATH_SECTION_SLIDE_IDS = etree.XPath('./p14:sldIdLst/p14:sldId', namespaces=_PACKAGE_NAMESPACES)
+_XPATH_OVERRIDES = etree.XPath('./ct:Override', namespaces=_PACKAGE_NAMESPACES)
+_XPATH_PLACEHOLDER_COUNT = etree.XPath('count(./p:cSld/p:spTree/*/*[1]/p:nvPr/p:ph)', namespaces=_PACKAGE_NAMESPACES)
+
+# Same settings python-pptx uses for package XML: no entity expansion
+_XML_PARSER = etree.XMLParser(remove_blank_text=True, resolve_entities=False)
+
+
+def _rels_member_name(part_name: str) -> str:
+    """Zip member name of the relationships part belonging to a part."""
+    directory, filename = posixpath.split(part_name)
+    return posixpath.join(directory, '_rels', filename + '.rels')
+
+
+def _read_relationships(archive: zipfile.ZipFile, part_name: str) -> Dict[str, Tuple[str, str]]:
+    """
+    Read the internal relationships of a part.
+
+    Returns:
+        Dictionary mapping rId to (relationship type, target zip member name)
+    """
+    try:
+        rels_xml = archive.read(_rels_member_name(part_name))
+    except KeyError:
+        return {}
+
+    base_dir = posixpath.dirname(part_name)
+    relationships = {}
+    for rel in _XPATH_RELATIONSHIPS(etree.fromstring(rels_xml, _XML_PARSER)):
+        if rel.get('TargetMode') == 'External':
+            continue
+        target = rel.get('Target')
+        member = target.lstrip('/') if target.startswith('/') else posixpath.normpath(posixpath.join(base_dir, target))
+        relationships[rel.get('Id')] = (rel.get('Type'), member)
+    return relationships
+
+
+def _package_part_name(archive: zipfile.ZipFile, rel_type: str) -> Optional[str]:
+    """Zip member name of the package-level part with a relationship type, if any."""
+    return next(
+        (member for part_rel_type, member in _read_relationships(archive, '').values()
+         if part_rel_type == rel_type),
+        None
+    )
+
+
+def iter_slide_elements(archive: zipfile.ZipFile) -> Iterator[Tuple[int, str, object]]:
+    """
+    Parse the slides of an open .pptx archive one at a time, in presentation order.
+
+    Only presentation.xml, the relationship parts and the slide parts are read;
+    media, layouts and masters stay compressed in the archive.
+
+    Args:
+        archive: An open zipfile.ZipFile of a .pptx package
+
+    Yields:
+        Tuples of (slide_index, slide zip member name, p:sld element)
+    """
+    presentation_part = _package_part_name(archive, _RT_OFFICE_DOCUMENT)
+    if presentation_part is None:
+        raise ValueError("Package has no main presentation part")
+
+    presentation = etree.fromstring(archive.read(presentation_part), _XML_PARSER)
+    relationships = _read_relationships(archive, presentation_part)
+
+    for slide_index, r_id in enumerate(_XPATH_SLIDE_RIDS(presentation)):
+        slide_part = relationships[r_id][1]
+        yield slide_index, slide_part, etree.fromstring(archive.read(slide_part), _XML_PARSER)
+
+
+# Size of the fixed part of a zip local file header; name and extra field lengths are at offset 26
+_LOCAL_HEADER_SIZE = 30
+
+# Chunk size used when copying compressed member data between archives
+_COPY_CHUNK_SIZE = 1024 * 1024
+
+# Extensions of part formats that are already compressed; deflating them again
+# costs CPU for next to no size reduction
+COMPRESSED_MEDIA_EXTENSIONS = frozenset({
+    '.jpg', '.jpeg', '.png', '.gif', '.webp', '.jfif',
+    '.mp4', '.m4v', '.mov', '.wmv', '.avi', '.mpg', '.mpeg',
+    '.mp3', '.m4a', '.wma', '.aac', '.ogg',
+    '.xlsx', '.xlsm', '.docx', '.pptx', '.zip',
+})
+
+# Named compression policies accepted by save_presentation
+COMPRESSION_PRESETS = {
+    'fast': {'store_media': True, 'xml_level': 1},
+    'balanced': {'store_media': True, 'xml_level': 6},
+    'smallest': {'store_media': False, 'xml_level': 9},
+}
+
+
+class ZipCompressionPolicy:
+    """
+    How the members of a package are compressed when it is written.
+    
+    Members whose extension is in COMPRESSED_MEDIA_EXTENSIONS are stored
+    uncompressed if store_media is set; everything else is deflated at
+    xml_level. Members of at least parallel_threshold bytes are compressed in a
+    thread pool (zlib releases the GIL while compressing).
+    """
+    
+    def __init__(self, store_media: bool = True, xml_level: int = 6, max_workers: Optional[int] = None,
+                 parallel_threshold: int = 64 * 1024):
+        if not 0 <= xml_level <= 9:
+            raise ValueError(f"Invalid compression level: {xml_level}. Must be between 0 and 9")
+        self.store_media = store_media
+        self.xml_level = xml_level
+        self.max_workers = max(1, max_workers if max_workers is not None else (os.cpu_count() or 1))
+        self.parallel_threshold = parallel_threshold
+    
+    @classmethod
+    def from_preset(cls, name: str, xml_level: Optional[int] = None,
+                    max_workers: Optional[int] = None) -> 'ZipCompressionPolicy':
+        """Create a policy from a COMPRESSION_PRESETS name, optionally overriding its level."""
+        if name not in COMPRESSION_PRESETS:
+            raise ValueError(
+                f"Invalid compression policy: '{name}'. Must be one of: {', '.join(COMPRESSION_PRESETS)}"
+            )
+        settings = dict(COMPRESSION_PRESETS[name])
+        if xml_level is not None:
+            settings['xml_level'] = xml_level
+        return cls(max_workers=max_workers, **settings)
+    
+    def compression_for(self, name: str) -> Optional[int]:
+        """Deflate level for a member, or None to store it uncompressed."""
+        if self.store_media and posixpath.splitext(name)[1].lower() in COMPRESSED_MEDIA_EXTENSIONS:
+            return None
+        return self.xml_level
+
+
+def _write_precompressed(target: zipfile.ZipFile, info: zipfile.ZipInfo, chunks) -> None:
+    """Append a member whose CRC, sizes and compression type are already set in info."""
+    # Sizes and CRC go into the local header, so no data descriptor follows the data
+    info.flag_bits &= ~0x08
+    zip64 = info.file_size > zipfile.ZIP64_LIMIT or info.compress_size > zipfile.ZIP64_LIMIT
+    
+    # ZipFile has no public API for writing pre-compressed data; this mirrors
+    # what ZipFile.write does once the data is compressed
+    with target._lock:
+        target._writecheck(info)
+        target._didModify = True
+        info.header_offset = target.fp.tell()
+        target.fp.write(info.FileHeader(zip64))
+        for chunk in chunks:
+            target.fp.write(chunk)
+        target.filelist.append(info)
+        target.NameToInfo[info.filename] = info
+        target.start_dir = target.fp.tell()
+
+
+def _seek_member_data(source_file, info: zipfile.ZipInfo) -> None:
+    """Position source_file at the start of a member's compressed data."""
+    source_file.seek(info.header_offset)
+    header = source_file.read(_LOCAL_HEADER_SIZE)
+    if len(header) != _LOCAL_HEADER_SIZE or header[:4] != zipfile.stringFileHeader:
+        raise zipfile.BadZipFile(f"Bad local file header for member '{info.filename}'")
+    name_length, extra_length = struct.unpack('<HH', header[26:30])
+    source_file.seek(info.header_offset + _LOCAL_HEADER_SIZE + name_length + extra_length)
+
+
+def read_zip_member(source_file, info: zipfile.ZipInfo) -> bytes:
+    """
+    Read and decompress one member straight from the archive file.
+
+    Much cheaper than ZipFile.read for the many small members of a package,
+    which pays for opening a ZipExtFile on every call.
+
+    Args:
+        source_file: Binary file object of the archive, open for reading
+        info: ZipInfo of the member
+
+    Returns:
+        The member's uncompressed data
+    """
+    _seek_member_data(source_file, info)
+    data = source_file.read(info.compress_size)
+    if info.compress_type == zipfile.ZIP_DEFLATED:
+        data = zlib.decompress(data, -15)
+    elif info.compress_type != zipfile.ZIP_STORED:
+        raise zipfile.BadZipFile(f"Unsupported compression method {info.compress_type} for member '{info.filename}'")
+    if len(data) != info.file_size or zlib.crc32(data) != info.CRC:
+        raise zipfile.BadZipFile(f"Bad CRC or size for member '{info.filename}'")
+    return data
+
+
+def copy_zip_member(source_file, info: zipfile.ZipInfo, target: zipfile.ZipFile,
+                    name: Optional[str] = None) -> int:
+    """
+    Copy a member's compressed data from one zip archive into another without
+    decompressing or recompressing it.
+
+    Args:
+        source_file: Binary file object of the source archive, open for reading
+        info: ZipInfo of the member in the source archive
+        target: ZipFile open for writing ('w' mode on a seekable file)
+        name: Member name in the target archive (defaults to the source name)
+
+    Returns:
+        Number of compressed bytes copied
+    """
+    _seek_member_data(source_file, info)
+
+    copied = zipfile.ZipInfo(name or info.filename, info.date_time)
+    copied.compress_type = info.compress_type
+    copied.CRC = info.CRC
+    copied.compress_size = info.compress_size
+    copied.file_size = info.file_size
+    copied.external_attr = info.external_attr
+    copied.create_system = info.create_system
+    copied.flag_bits = info.flag_bits
+
+    def chunks():
+        remaining = info.compress_size
+        while remaining:
+            chunk = source_file.read(min(remaining, _COPY_CHUNK_SIZE))
+            if not chunk:
+                raise zipfile.BadZipFile(f"Truncated data for member '{info.filename}'")
+            yield chunk
+            remaining -= len(chunk)
+
+    _write_precompressed(target, copied, chunks())
+    return info.compress_size
+
+
+def _compress_member(name: str, data: bytes, level: Optional[int]) -> Tuple[zipfile.ZipInfo, bytes]:
+    """Compress one member's data; returns its ZipInfo and the compressed bytes."""
+    info = zipfile.ZipInfo(name, time.localtime(time.time())[:6])
+    info.external_attr = 0o600 << 16
+    info.CRC = zlib.crc32(data)
+    info.file_size = len(data)
+    if level is None:
+        info.compress_type = zipfile.ZIP_STORED
+        compressed = data
+    else:
+        info.compress_type = zipfile.ZIP_DEFLATED
+        compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+        compressed = compressor.compress(data) + compressor.flush()
+    info.compress_size = len(compressed)
+    return info, compressed
+
+
+class PackageZipWriter:
+    """
+    Writes package members to a zip archive in order, following a compression policy.
+    
+    Large members are compressed in a thread pool while earlier members are
+    being written; at most a few members per worker are held in memory. Members
+    copied from another archive with copy() keep their compressed data as-is.
+    Without a policy every member is deflated by ZipFile itself, as
+    python-pptx does.
+    """
+    
+    def __init__(self, file_obj, policy: Optional[ZipCompressionPolicy] = None):
+        self.policy = policy
+        self.zip_file = zipfile.ZipFile(file_obj, 'w', compression=zipfile.ZIP_DEFLATED, strict_timestamps=False)
+        self._executor = None
+        # Queued writes, oldest first: callables that write one member
+        self._pending = deque()
+        if policy is not None and policy.max_workers > 1:
+            self._executor = ThreadPoolExecutor(max_workers=policy.max_workers)
+    
+    def _queue(self, write) -> None:
+        """Queue a write and flush the oldest ones once enough are in flight."""
+        self._pending.append(write)
+        limit = 2 * self.policy.max_workers if self._executor is not None else 0
+        while len(self._pending) > limit:
+            self._pending.popleft()()
+    
+    def write(self, name: str, data: bytes) -> None:
+        """Add a member with the given uncompressed data."""
+        if self.policy is None:
+            self._queue(lambda: self.zip_file.writestr(name, data))
+            return
+        
+        level = self.policy.compression_for(name)
+        if self._executor is not None and level is not None and len(data) >= self.policy.parallel_threshold:
+            future = self._executor.submit(_compress_member, name, data, level)
+            self._queue(lambda: self._write_compressed(*future.result()))
+        else:
+            self._queue(lambda: self._write_compressed(*_compress_member(name, data, level)))
+    
+    def _write_compressed(self, info: zipfile.ZipInfo, compressed: bytes) -> None:
+        _write_precompressed(self.zip_file, info, (compressed,))
+    
+    def copy(self, source_file, info: zipfile.ZipInfo, name: Optional[str] = None, lock=None) -> None:
+        """
+        Add a member copied with its compressed data from another archive.
+        
+        Pass the lock that guards source_file if it is read from other threads as well.
+        """
+        if lock is None:
+            self._queue(lambda: copy_zip_member(source_file, info, self.zip_file, name))
+            return
+        
+        def copy_locked():
+            with lock:
+                copy_zip_member(source_file, info, self.zip_file, name)
+        
+        self._queue(copy_locked)
+    
+    def close(self) -> List[zipfile.ZipInfo]:
+        """Write the remaining members and the central directory; returns the member list."""
+        try:
+            while self._pending:
+                self._pending.popleft()()
+            infos = self.zip_file.infolist()
+        finally:
+            if self._executor is not None:
+                self._executor.shutdown(wait=True, cancel_futures=True)
+            self.zip_file.close()
+        return infos
+    
+    def __enter__(self) -> 'PackageZipWriter':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self._pending.clear()
+            if self._executor is not None:
+                self._executor.shutdown(wait=True, cancel_futures=True)
+            self.zip_file.close()
+
+
+def _slide_layout_name(archive: zipfile.ZipFile, slide_part: str, layout_names: Dict[str, str]) -> str:
+    """Name of the layout a slide uses, caching layouts already parsed."""
+    for rel_type, member in _read_relationships(archive, slide_part).values():
+        if rel_type == _RT_SLIDE_LAYOUT:
+            if member not in layout_names:
+                layout = etree.fromstring(archive.read(member), _XML_PARSER)
+                layout_names[member] = _XPATH_CSLD_NAME(layout)
+            return layout_names[member]
+    return ""
+
+
+def read_template_metadata(file_path: str) -> Dict:
+    """
+    Read slide count, slide layouts and core properties of a .pptx or .potx file.
+
+    Only presentation.xml, the first slide master, its layouts and
+    docProps/core.xml are parsed; slides and media are not read.
+
+    Args:
+        file_path: Path to the file
+
+    Returns:
+        Dictionary with 'slide_count', 'slide_layouts' (index, name and
+        placeholder_count of the layouts of the first slide master, as listed
+        by Presentation.slide_layouts) and 'core_properties'
+    """
+    with zipfile.ZipFile(file_path) as archive:
+        presentation_part = _package_part_name(archive, _RT_OFFICE_DOCUMENT)
+        if presentation_part is None:
+            raise ValueError("Package has no main presentation part")
+
+        presentation = etree.fromstring(archive.read(presentation_part), _XML_PARSER)
+        relationships = _read_relationships(archive, presentation_part)
+
+        layouts = []
+        master_rids = _XPATH_MASTER_RIDS(presentation)
+        if master_rids:
+            master_part = relationships[master_rids[0]][1]
+            master = etree.fromstring(archive.read(master_part), _XML_PARSER)
+            master_relationships = _read_relationships(archive, master_part)
+            for index, r_id in enumerate(_XPATH_LAYOUT_RIDS(master)):
+                layout = etree.fromstring(archive.read(master_relationships[r_id][1]), _XML_PARSER)
+                layouts.append({
+                    "index": index,
+                    "name": _XPATH_CSLD_NAME(layout),
+                    "placeholder_count": int(_XPATH_PLACEHOLDER_COUNT(layout))
+                })
+
+        # python-pptx's element class parses the W3CDTF dates the same way Presentation does
+        core_part = _package_part_name(archive, _RT_CORE_PROPERTIES)
+        core = parse_xml(archive.read(core_part)) if core_part is not None else None
+
+    core_properties = {
+        "title": None, "subject": None, "author": None, "keywords": None, "comments": None,
+        "created": None, "last_modified_by": None, "modified": None
+    }
+    if core is not None:
+        core_properties = {
+            "title": core.title_text,
+            "subject": core.subject_text,
+            "author": core.author_text,
+            "keywords": core.keywords_text,
+            "comments": core.comments_text,
+            "created": core.created_datetime.isoformat() if core.created_datetime else None,
+            "last_modified_by": core.lastModifiedBy_text,
+            "modified": core.modified_datetime.isoformat() if core.modified_datetime else None
+        }
+
+    return {
+        "slide_count": len(_XPATH_SLIDE_RIDS(presentation)),
+        "slide_layouts": layouts,
+        "core_properties": core_properties
+    }
+
+
+def extract_text_from_file(file_path: str, fields: str = 'all', include_slide_info: bool = False) -> Dict:
+    """
+    Extract the text of every slide in a .pptx file without opening it as a Presentation.
+
+    Args:
+        file_path: Path to the .pptx file
+        fields: 'all', 'titles', 'text' or 'tables' (see iter_presentation_text)
+        include_slide_info: Whether to add layout name and shape statistics
+
+    Returns:
+        Dictionary with 'file_path', 'success', and 'slide_count' plus 'slides_text',
+        or 'error' if the file could not be read
+    """
+    if fields not in content_utils.TEXT_EXTRACTION_FIELDS:
+        raise ValueError(
+            f"Invalid fields: '{fields}'. Must be one of: {', '.join(content_utils.TEXT_EXTRACTION_FIELDS)}"
+        )
+
+    try:
+        slides_text = []
+        layout_names = {}
+        with zipfile.ZipFile(file_path) as archive:
+            for slide_index, slide_part, slide_element in iter_slide_elements(archive):
+                result = content_utils.extract_slide_text_content_xml(slide_element)
+                record = content_utils.build_text_record(slide_index, result, fields)
+                if include_slide_info and "error" not in record:
+                    record["layout_name"] = _slide_layout_name(archive, slide_part, layout_names)
+                    record["total_text_shapes"] = result["total_text_shapes"]
+                    record["has_title"] = result["has_title"]
+                    record["has_tables"] = result["has_tables"]
+                slides_text.append(record)
+
+        return {
+            "file_path": file_path,
+            "success": True,
+            "slide_count": len(slides_text),
+            "slides_text": slides_text
+        }
+    except Exception as e:
+        return {
+            "file_path": file_path,
+            "success": False,
+            "error": f"Failed to extract text: {str(e)}"
+        }
+
+
+def extract_text_from_files(file_paths: List[str], fields: str = 'all', include_slide_info: bool = False,
+                            max_workers: Optional[int] = None) -> Iterator[Dict]:
+    """
+    Extract text from many .pptx files in parallel using a process pool.
+
+    Nothing is loaded into the presentation store; each worker reads its file's
+    slide XML straight from the zip archive. Results are yielded as soon as
+    each file finishes.
+
+    Args:
+        file_paths: Paths of the .pptx files
+        fields: 'all', 'titles', 'text' or 'tables' (see iter_presentation_text)
+        include_slide_info: Whether to add layout name and shape statistics
+        max_workers: Maximum number of files processed concurrently (defaults to CPU count)
+
+    Yields:
+        Dictionary per file, as returned by extract_text_from_file
+    """
+    if fields not in content_utils.TEXT_EXTRACTION_FIELDS:
+        raise ValueError(
+            f"Invalid fields: '{fields}'. Must be one of: {', '.join(content_utils.TEXT_EXTRACTION_FIELDS)}"
+        )
+
+    existing_paths = []
+    for file_path in file_paths:
+        if os.path.isfile(file_path):
+            existing_paths.append(file_path)
+        else:
+            yield {"file_path": file_path, "success": False, "error": f"File not found: {file_path}"}
+
+    if not existing_paths:
+        return
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = max(1, min(max_workers, len(existing_paths)))
+
+    # With a single worker a process pool only adds start-up and pickling cost
+    if max_workers == 1:
+        for file_path in existing_paths:
+            yield extract_text_from_file(file_path, fields, include_slide_info)
+        return
+
+    executor = ProcessPoolExecutor(max_workers=max_workers, mp_context=get_worker_context())
+    try:
+        futures = {
+            executor.submit(extract_text_from_file, file_path, fields, include_slide_info): file_path
+            for file_path in existing_paths
+        }
+        for future in as_completed(futures):
+            try:
+                yield future.result()
+            except Exception as e:
+                yield {"file_path": futures[future], "success": False, "error": str(e)}
+    finally:
+        # Drop queued files if the caller stops consuming results early
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+_CONTENT_TYPES_MEMBER = '[Content_Types].xml'
+_PACKAGE_RELS_MEMBER = '_rels/.rels'
+_R_NAMESPACE_PREFIX = '{%s}' % _PACKAGE_NAMESPACES['r']
+
+
+def _open_package_source(source):
+    """Binary file object for a package given as a path or as bytes."""
+    if isinstance(source, (bytes, bytearray)):
+        return io.BytesIO(source)
+    return open(source, 'rb')
+
+
+def _serialize_package_xml(element) -> bytes:
+    return etree.tostring(element, encoding='UTF-8', standalone=True)
+
+
+def _remove_relationship_references(element, r_ids) -> None:
+    """Remove every element under element with an r: attribute naming one of r_ids."""
+    doomed = [
+        child for child in element.iter()
+        if any(key.startswith(_R_NAMESPACE_PREFIX) and value in r_ids for key, value in child.attrib.items())
+    ]
+    for child in doomed:
+        parent = child.getparent()
+        if parent is not None:
+            parent.remove(child)
+
+
+class _PackageSplitter:
+    """
+    The part graph of a package, read once and shared by every output of a split.
+
+    Reads the central directory, [Content_Types].xml, presentation.xml and the
+    relationship parts reachable from the package root; slides, layouts,
+    masters and media are never decompressed.
+    """
+
+    def __init__(self, source):
+        self.source = source
+        with _open_package_source(source) as source_file, zipfile.ZipFile(source_file) as archive:
+            self.infos = archive.infolist()
+            self.info_by_name = {info.filename: info for info in self.infos}
+
+            self.presentation_part = _package_part_name(archive, _RT_OFFICE_DOCUMENT)
+            if self.presentation_part is None:
+                raise ValueError("Package has no main presentation part")
+            self.presentation_xml = archive.read(self.presentation_part)
+            self.content_types_xml = archive.read(_CONTENT_TYPES_MEMBER)
+
+            # part -> {rId: (type, member)} for every part reachable from the root
+            self.relationships = {}
+            pending = ['']
+            while pending:
+                part = pending.pop()
+                self.relationships[part] = _read_relationships(archive, part)
+                for _, member in self.relationships[part].values():
+                    if member not in self.relationships and member in self.info_by_name:
+                        self.relationships[member] = None
+                        pending.append(member)
+            self.rels_xml = {
+                part: archive.read(_rels_member_name(part)) for part in self.relationships
+                if _rels_member_name(part) in self.info_by_name
+            }
+
+        presentation = etree.fromstring(self.presentation_xml, _XML_PARSER)
+        presentation_relationships = self.relationships[self.presentation_part]
+        self.slide_parts = []
+        self.slide_ids = []
+        for slide_id in _XPATH_SLIDE_IDS(presentation):
+            self.slide_parts.append(presentation_relationships[slide_id.get(_R_NAMESPACE_PREFIX + 'id')][1])
+            self.slide_ids.append(slide_id.get('id'))
+
+        self.sections = []
+        index_by_id = {slide_id: index for index, slide_id in enumerate(self.slide_ids)}
+        for section in _XPATH_SECTIONS(presentation):
+            self.sections.append({
+                "name": section.get('name'),
+                "slide_indices": [
+                    index_by_id[slide_id.get('id')] for slide_id in _XPATH_SECTION_SLIDE_IDS(section)
+                    if slide_id.get('id') in index_by_id
+                ]
+            })
+
+    def check_slide_indices(self, slide_indices: List[int]) -> None:
+        if not slide_indices:
+            raise ValueError("Each output needs at least one slide")
+        for index in slide_indices:
+            if not 0 <= index < len(self.slide_parts):
+                raise ValueError(f"Invalid slide index: {index}. Available slides: 0-{len(self.slide_parts) - 1}")
+        if len(set(slide_indices)) != len(slide_indices):
+            raise ValueError(f"Slide indices must not repeat within an output: {slide_indices}")
+
+    def _reachable(self, slide_indices: List[int]) -> Tuple[set, Dict[str, set]]:
+        """Parts an output references, and per part the rIds that point at left-out slides."""
+        kept_slides = {self.slide_parts[index] for index in slide_indices}
+        left_out_slides = set(self.slide_parts) - kept_slides
+        parts = set()
+        dropped = {}
+        pending = ['']
+        while pending:
+            part = pending.pop()
+            for r_id, (_, member) in self.relationships.get(part, {}).items():
+                if member in left_out_slides:
+                    dropped.setdefault(part, set()).add(r_id)
+                elif member in self.info_by_name and member not in parts:
+                    parts.add(member)
+                    pending.append(member)
+        return parts, dropped
+
+    def _presentation_xml(self, slide_indices: List[int], dropped_r_ids: set) -> bytes:
+        """presentation.xml listing only the selected slides, in selection order."""
+        presentation = etree.fromstring(self.presentation_xml, _XML_PARSER)
+        slide_ids = _XPATH_SLIDE_IDS(presentation)
+        slide_id_list = slide_ids[0].getparent()
+        for slide_id in slide_ids:
+            slide_id_list.remove(slide_id)
+        for index in slide_indices:
+            slide_id_list.append(slide_ids[index])
+
+        # Custom shows and other references to left-out slides
+        _remove_relationship_references(presentation, dropped_r_ids)
+
+        kept_ids = {self.slide_ids[index] for index in slide_indices}
+        for section in _XPATH_SECTIONS(presentation):
+            for slide_id in _XPATH_SECTION_SLIDE_IDS(section):
+                if slide_id.get('id') not in kept_ids:
+                    slide_id.getparent().remove(slide_id)
+            if not len(_XPATH_SECTION_SLIDE_IDS(section)):
+                section.getparent().remove(section)
+        return _serialize_package_xml(presentation)
+
+    def _rels_xml(self, part: str, r_ids: set) -> bytes:
+        relationships = etree.fromstring(self.rels_xml[part], _XML_PARSER)
+        for rel in _XPATH_RELATIONSHIPS(relationships):
+            if rel.get('Id') in r_ids:
+                relationships.remove(rel)
+        return _serialize_package_xml(relationships)
+
+    def _content_types_xml(self, parts: set) -> bytes:
+        content_types = etree.fromstring(self.content_types_xml, _XML_PARSER)
+        for override in _XPATH_OVERRIDES(content_types):
+            if override.get('PartName').lstrip('/') not in parts:
+                content_types.remove(override)
+        return _serialize_package_xml(content_types)
+
+    def write(self, file_path: str, slide_indices: List[int], policy: Optional[ZipCompressionPolicy]) -> Dict:
+        """Write one output with its own handle on the source; safe to call from several threads."""
+        parts, dropped = self._reachable(slide_indices)
+        dropped.setdefault(self.presentation_part, set())
+        members = parts | {_CONTENT_TYPES_MEMBER, _PACKAGE_RELS_MEMBER}
+        members.update(_rels_member_name(part) for part in parts if part in self.rels_xml)
+
+        try:
+            with _open_package_source(self.source) as source_file, open(file_path, 'wb') as target_file:
+                with PackageZipWriter(target_file, policy) as writer:
+                    writer.write(_CONTENT_TYPES_MEMBER, self._content_types_xml(parts))
+                    for info in self.infos:
+                        name = info.filename
+                        if name not in members or name == _CONTENT_TYPES_MEMBER:
+                            continue
+                        if name == self.presentation_part:
+                            writer.write(name, self._presentation_xml(slide_indices, dropped[name]))
+                        elif name in dropped:
+                            # A part linking to a left-out slide, e.g. a hyperlink on a slide
+                            element = etree.fromstring(read_zip_member(source_file, info), _XML_PARSER)
+                            _remove_relationship_references(element, dropped[name])
+                            writer.write(name, _serialize_package_xml(element))
+                        elif name.endswith('.rels') and _rels_owner(name) in dropped:
+                            writer.write(name, self._rels_xml(_rels_owner(name), dropped[_rels_owner(name)]))
+                        else:
+                            writer.copy(source_file, info)
+        except BaseException:
+            if os.path.exists(file_path):
+                os.remove(file_path)
+            raise
+
+        return {
+            "file_path": file_path,
+            "slide_indices": list(slide_indices),
+            "slide_count": len(slide_indices),
+            "part_count": len(parts),
+            "size_bytes": os.path.getsize(file_path)
+        }
+
+
+def _rels_owner(rels_member: str) -> str:
+    """Part name a relationships member belongs to ('' for the package relationships)."""
+    directory, file_name = posixpath.split(rels_member)
+    return posixpath.join(posixpath.dirname(directory), file_name[:-len('.rels')])
+
+
+def read_package_sections(source) -> List[Dict]:
+    """
+    Read the sections of a .pptx package without opening it as a Presentation.
+
+    Args:
+        source: Path of the .pptx file, or its contents as bytes
+
+    Returns:
+        List of dictionaries with the section 'name' and its 'slide_indices';
+        empty if the presentation has no sections
+    """
+    return _PackageSplitter(source).sections
+
+
+def split_package(source, slide_groups: List[List[int]], output_paths: List[str],
+                  policy: Optional[ZipCompressionPolicy] = None, max_workers: Optional[int] = None) -> List[Dict]:
+    """
+    Split a .pptx package into several files in one pass over its part graph.
+
+    The relationship graph is read once; every output then keeps only the parts
+    reachable from its own slides. Masters, layouts, themes and media are copied
+    with their compressed data as-is, and only presentation.xml,
+    [Content_Types].xml and parts linking to left-out slides are rewritten.
+    Outputs are written concurrently, each worker with its own handle on the source.
+
+    Args:
+        source: Path of the .pptx file, or its contents as bytes
+        slide_groups: Slide indices of each output, in the order they should appear
+        output_paths: File path of each output
+        policy: Compression policy for rewritten members (copied members keep theirs)
+        max_workers: Maximum number of outputs written concurrently (defaults to CPU count)
+
+    Returns:
+        List of dictionaries, one per output, with 'file_path', 'slide_indices',
+        'slide_count', 'part_count' and 'size_bytes'
+    """
+    if len(slide_groups) != len(output_paths):
+        raise ValueError(f"Got {len(slide_groups)} slide groups but {len(output_paths)} output paths")
+    if len({os.path.abspath(path) for path in output_paths}) != len(output_paths):
+        raise ValueError("Output paths must be distinct")
+
+    splitter = _PackageSplitter(source)
+    for slide_indices in slide_groups:
+        splitter.check_slide_indices(slide_indices)
+
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    max_workers = max(1, min(max_workers, len(output_paths)))
+
+    if max_workers == 1:
+        return [
+            splitter.write(file_path, slide_indices, policy)
+            for file_path, slide_indices in zip(output_paths, slide_groups)
+        ]
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(splitter.write, file_path, slide_indices, policy)
+            for file_path, slide_indices in zip(output_paths, slide_groups)
+        ]
+        return [future.result() for future in futures]
@@ -3,8 +3,32 @@ Presentation management utilities for PowerPoint MCP Server.
 Functions for creating, opening, saving, and managing presentations.
 """
 from pptx import Presentation
-from typing import Dict, List, Optional
+from pptx.opc.constants import RELATIONSHIP_TARGET_MODE as RTM, RELATIONSHIP_TYPE as RT
+from pptx.opc.oxml import serialize_part_xml
+from pptx.opc.package import PartFactory, XmlPart, _PackageLoader, _Relationship
+from pptx.opc.packuri import CONTENT_TYPES_URI, PACKAGE_URI, PackURI
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import qn
+from pptx.opc.serialized import _ContentTypesItem
+from pptx.package import Package
+from pptx.parts.image import ImagePart
+from pptx.parts.media import MediaPart
+from pptx.parts.slide import SlidePart
+from pptx.util import lazyproperty
+from utils.package_utils import PackageZipWriter, ZipCompressionPolicy, read_template_metadata, read_zip_member
+from collections import OrderedDict
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+import copy
+import hashlib
+import io
 import os
+import re
+import shutil
+import tempfile
+import threading
+import time
+import weakref
+import zipfile
 
 
 def create_presentation() -> Presentation:
@@ -17,17 +41,276 @@ def create_presentation() -> Presentation:
     return Presentation()
 
 
-def open_presentation(file_path: str) -> Presentation:
+def open_presentation(file_path: str, lazy_media: bool = False,
+                      slide_indices: Optional[Iterable[int]] = None) -> Presentation:
     """
     Open an existing PowerPoint presentation.
     
     Args:
         file_path: Path to the PowerPoint file
+        lazy_media: Leave binary parts of at least LAZY_MEDIA_MIN_SIZE bytes
+            (images, video, embedded files) in the file and read them only when
+            needed; saving copies them from the file without loading them
+        slide_indices: 0-based indices of the slides to load, e.g. range(120, 131).
+            The other slides, and the parts only they use, are left in the file
+            and parsed only if they are accessed; saving copies untouched ones
+            as they are, so the whole deck is preserved
         
     Returns:
         A Presentation object
+        
+    Raises:
+        ValueError: If a slide index is out of range
+    """
+    if lazy_media or slide_indices is not None:
+        source = _LazyPackageSource(file_path)
+        package = Package(file_path)
+        pkg_xml_rels, parts = _LazyPackageLoader.load(source, package, lazy_media, slide_indices)
+        package._rels.load_from_xml(PACKAGE_URI, pkg_xml_rels, parts)
+        presentation = package.main_document_part.presentation
+        _record_package_snapshot(presentation, file_path, source.members)
+    else:
+        presentation = Presentation(file_path)
+        _record_package_snapshot(presentation, file_path)
+    return presentation
+
+
+# Binary parts at least this large stay in the source file when opening with lazy_media
+LAZY_MEDIA_MIN_SIZE = 64 * 1024
+
+
+class _LazyPackageSource:
+    """
+    A source .pptx file kept open for the parts that read their bytes from it.
+    
+    Holding the file open keeps its contents readable after a save replaces
+    the file at that path, since os.replace leaves the open file intact. The
+    file is closed once no part refers to it any more.
+    """
+    
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        self.file = open(file_path, 'rb')
+        weakref.finalize(self, self.file.close)
+        self.archive = zipfile.ZipFile(self.file)
+        self.members = {info.filename: info for info in self.archive.infolist()}
+        # Reads and raw copies share the file position
+        self.lock = threading.Lock()
+    
+    def read(self, member: str) -> bytes:
+        with self.lock:
+            return read_zip_member(self.file, self.members[member])
+    
+    def sha1(self, member: str) -> str:
+        """SHA-1 of a member's data, computed without holding all of it in memory."""
+        digest = hashlib.sha1()
+        with self.lock, self.archive.open(self.members[member]) as data:
+            for chunk in iter(lambda: data.read(1024 * 1024), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+
+class _LazyPartMixin:
+    """Part whose content is still in a _LazyPackageSource; _lazy_source is None once it is not."""
+    
+    _lazy_source = None
+    _lazy_member = None
+    # _rels_signature() when loaded; while it still matches, the source's relationships part is copied
+    _lazy_rels = None
+
+
+class _LazyBlobMixin(_LazyPartMixin):
     """
-    return Presentation(file_path)
+    Binary part whose bytes are read from a _LazyPackageSource on each access.
+    
+    Assigning a blob (as python-pptx does when a part's data is replaced)
+    detaches the part from its source.
+    """
+    
+    _lazy_sha1 = None
+    
+    @property
+    def _blob(self):
+        if self._lazy_source is not None:
+            return self._lazy_source.read(self._lazy_member)
+        return self._stored_blob
+    
+    @_blob.setter
+    def _blob(self, blob):
+        self._stored_blob = blob
+        self._lazy_source = None
+        self._lazy_sha1 = None
+    
+    @property
+    def sha1(self) -> str:
+        # Image and media deduplication hashes every part on each insert
+        if self._lazy_source is None:
+            return hashlib.sha1(self._stored_blob or b'').hexdigest()
+        if self._lazy_sha1 is None:
+            self._lazy_sha1 = self._lazy_source.sha1(self._lazy_member)
+        return self._lazy_sha1
+
+
+class _LazyXmlMixin(_LazyPartMixin):
+    """XML part that is parsed from a _LazyPackageSource the first time its element is used."""
+    
+    @property
+    def _element(self):
+        if self._lazy_source is not None:
+            self._parsed_element = parse_xml(self._lazy_source.read(self._lazy_member))
+            self._lazy_source = None
+        return self._parsed_element
+    
+    @_element.setter
+    def _element(self, element):
+        self._parsed_element = element
+        self._lazy_source = None
+
+
+# part class -> lazy subclass of it
+_lazy_part_classes = {}
+
+
+def _make_lazy_part(part_class, partname, content_type, package, source: _LazyPackageSource, member: str):
+    """Create a part of a lazy subclass of part_class that reads its content from source."""
+    lazy_class = part_class if issubclass(part_class, _LazyPartMixin) else _lazy_part_classes.get(part_class)
+    if lazy_class is None:
+        mixin = _LazyXmlMixin if issubclass(part_class, XmlPart) else _LazyBlobMixin
+        lazy_class = type(f"Lazy{part_class.__name__}", (mixin, part_class), {})
+        _lazy_part_classes[part_class] = lazy_class
+    part = lazy_class(partname, content_type, package, None)
+    part._lazy_source = source
+    part._lazy_member = member
+    return part
+
+
+def _is_lazy_part(part) -> bool:
+    """Whether a part's content is still only in its source file (and can be copied from there)."""
+    return isinstance(part, _LazyPartMixin) and part._lazy_source is not None
+
+
+def _rels_signature(part) -> tuple:
+    """What the relationships part of a part is generated from: its folder and each relationship's target."""
+    return part.partname.baseURI, tuple(
+        (r_id, rel.reltype, rel.target_ref if rel.is_external else rel.target_part.partname)
+        for r_id, rel in part.rels.items()
+    )
+
+
+class _LazyPackageReader:
+    """PackageReader replacement that reads zip members on request instead of all at once."""
+    
+    def __init__(self, source: _LazyPackageSource):
+        self._source = source
+    
+    def __contains__(self, pack_uri) -> bool:
+        return pack_uri.membername in self._source.members
+    
+    def __getitem__(self, pack_uri) -> bytes:
+        if pack_uri.membername not in self._source.members:
+            raise KeyError(f"no member '{pack_uri}' in package")
+        return self._source.read(pack_uri.membername)
+    
+    def rels_xml_for(self, partname) -> Optional[bytes]:
+        rels_uri = partname.rels_uri
+        return self[rels_uri] if rels_uri in self else None
+
+
+class _LazyPackageLoader(_PackageLoader):
+    """
+    Package loader that leaves parts in the source file: large binary parts
+    with lazy_media, and with slide_indices every part that is only reachable
+    through the slides not listed.
+    """
+    
+    def __init__(self, source: _LazyPackageSource, package: Package, lazy_media: bool = True,
+                 slide_indices: Optional[Iterable[int]] = None):
+        super().__init__(source.file_path, package)
+        self._source = source
+        self._lazy_media = lazy_media
+        self._slide_indices = None if slide_indices is None else set(slide_indices)
+    
+    @classmethod
+    def load(cls, source: _LazyPackageSource, package: Package, lazy_media: bool = True,
+             slide_indices: Optional[Iterable[int]] = None) -> tuple:
+        return cls(source, package, lazy_media, slide_indices)._load()
+    
+    @lazyproperty
+    def _package_reader(self) -> _LazyPackageReader:
+        return _LazyPackageReader(self._source)
+    
+    def _rel_targets(self, partname) -> Iterator[tuple]:
+        """(relationship type, target partname) of the internal relationships of a part."""
+        base_uri = partname.baseURI
+        for rel in self._xml_rels[partname].relationship_lst:
+            if rel.targetMode != RTM.EXTERNAL:
+                yield rel.reltype, PackURI.from_rel_ref(base_uri, rel.target_ref)
+    
+    @lazyproperty
+    def _deferred_partnames(self) -> set:
+        """Partnames reachable only through slides that are not in slide_indices."""
+        if self._slide_indices is None:
+            return set()
+        
+        presentation_partname = next(
+            target for reltype, target in self._rel_targets(PACKAGE_URI) if reltype == RT.OFFICE_DOCUMENT
+        )
+        slide_targets = {
+            rel.rId: PackURI.from_rel_ref(presentation_partname.baseURI, rel.target_ref)
+            for rel in self._xml_rels[presentation_partname].relationship_lst
+            if rel.reltype == RT.SLIDE
+        }
+        presentation_element = parse_xml(self._package_reader[presentation_partname])
+        sld_id_lst = presentation_element.sldIdLst
+        slide_partnames = [slide_targets[sld_id.rId] for sld_id in (sld_id_lst if sld_id_lst is not None else ())]
+        
+        invalid = sorted(i for i in self._slide_indices if not 0 <= i < len(slide_partnames))
+        if invalid:
+            raise ValueError(
+                f"Invalid slide index: {invalid[0]}. Available slides: 0-{len(slide_partnames) - 1}"
+            )
+        skipped = set(slide_partnames) - {slide_partnames[i] for i in self._slide_indices}
+        
+        # Everything reachable from the package without passing through a skipped slide is loaded
+        loaded = set()
+        pending = [PACKAGE_URI]
+        while pending:
+            partname = pending.pop()
+            for _, target in self._rel_targets(partname):
+                if target not in loaded and target not in skipped and target in self._xml_rels:
+                    loaded.add(target)
+                    pending.append(target)
+        return set(self._xml_rels) - loaded - {PACKAGE_URI}
+    
+    @lazyproperty
+    def _parts(self) -> dict:
+        content_types = self._content_types
+        package = self._package
+        source = self._source
+        deferred = self._deferred_partnames
+        
+        parts = {}
+        for partname in self._xml_rels:
+            if partname == "/" or partname not in self._package_reader:
+                continue
+            content_type = content_types[partname]
+            part_class = PartFactory._part_cls_for(content_type)
+            member = partname.membername
+            if partname in deferred or (
+                self._lazy_media and not issubclass(part_class, XmlPart)
+                and source.members[member].file_size >= LAZY_MEDIA_MIN_SIZE
+            ):
+                parts[partname] = _make_lazy_part(part_class, partname, content_type, package, source, member)
+            else:
+                parts[partname] = part_class.load(partname, content_type, package, source.read(member))
+        return parts
+    
+    def _load(self) -> tuple:
+        pkg_xml_rels, parts = super()._load()
+        for part in parts.values():
+            if _is_lazy_part(part):
+                part._lazy_rels = _rels_signature(part)
+        return pkg_xml_rels, parts
 
 
 def create_presentation_from_template(template_path: str) -> Presentation:
@@ -58,59 +341,1022 @@ def create_presentation_from_template(template_path: str) -> Presentation:
         raise Exception(f"Failed to load template file '{template_path}': {str(e)}")
 
 
-def save_presentation(presentation: Presentation, file_path: str) -> str:
+def clone_presentation(presentation: Presentation) -> Presentation:
+    """
+    Duplicate an in-memory presentation without serializing and re-parsing it.
+    
+    XML parts are deep-copied element trees, so nothing is parsed. Binary parts
+    (images, media, embedded workbooks) share their blob with the source, which
+    is safe because python-pptx replaces blobs rather than modifying them;
+    lazily loaded parts share their source file.
+    
+    Args:
+        presentation: The Presentation object to copy
+        
+    Returns:
+        A new, independent Presentation object
+    """
+    source_package = presentation.part.package
+    package = Package(None)
+    
+    clones = {}
+    for part in source_package.iter_parts():
+        if _is_lazy_part(part):
+            clone = _make_lazy_part(
+                type(part), part.partname, part.content_type, package,
+                part._lazy_source, part._lazy_member
+            )
+            clone._lazy_rels = part._lazy_rels
+        elif isinstance(part, XmlPart):
+            clone = type(part)(part.partname, part.content_type, package, copy.deepcopy(part._element))
+        elif isinstance(part, ImagePart):
+            clone = ImagePart(part.partname, part.content_type, package, part.blob, part._filename)
+        else:
+            clone = type(part).load(part.partname, part.content_type, package, part.blob)
+        clones[part] = clone
+    
+    def copy_relationships(source_rels, target_rels):
+        for r_id, rel in source_rels.items():
+            if rel.is_external:
+                target, target_mode = rel.target_ref, RTM.EXTERNAL
+            else:
+                target, target_mode = clones[rel.target_part], RTM.INTERNAL
+            target_rels._rels[r_id] = _Relationship(
+                target_rels._base_uri, r_id, rel.reltype, target_mode, target
+            )
+    
+    copy_relationships(source_package._rels, package._rels)
+    for part, clone in clones.items():
+        copy_relationships(part.rels, clone.rels)
+    
+    return package.main_document_part.presentation
+
+
+def keep_slides(presentation: Presentation, slide_indices: List[int]) -> int:
+    """
+    Remove every slide not listed and put the listed ones in the given order.
+    
+    Parts used only by removed slides are no longer reachable and are left
+    out when the presentation is saved; hyperlinks to removed slides are removed.
+    
+    Args:
+        presentation: The Presentation object
+        slide_indices: 0-based indices of the slides to keep, in their new order
+        
+    Returns:
+        Number of slides removed
+        
+    Raises:
+        ValueError: If an index is out of range or listed twice
+    """
+    sld_id_lst = presentation.part._element.get_or_add_sldIdLst()
+    sld_ids = list(sld_id_lst)
+    _check_slide_selection(slide_indices, len(sld_ids))
+    
+    kept = [sld_ids[i] for i in slide_indices]
+    kept_set = set(kept)
+    removed_parts = set()
+    for sld_id in sld_ids:
+        sld_id_lst.remove(sld_id)
+        if sld_id not in kept_set:
+            removed_parts.add(presentation.part.rels.pop(sld_id.rId).target_part)
+    for sld_id in kept:
+        sld_id_lst.append(sld_id)
+    
+    # A link would keep a removed slide in the package without a place in the slide list
+    for sld_id in kept:
+        slide_part = presentation.part.related_part(sld_id.rId)
+        for r_id, rel in list(slide_part.rels.items()):
+            if rel.reltype == RT.SLIDE and not rel.is_external and rel.target_part in removed_parts:
+                slide_part.rels.pop(r_id)
+                _drop_links(slide_part, r_id)
+    return len(sld_ids) - len(kept)
+
+
+def _drop_links(part, r_id: str) -> None:
+    """Remove the hyperlinks of an XML part that use a relationship."""
+    if not isinstance(part, XmlPart):
+        return
+    for link in list(part._element.iter(qn('a:hlinkClick'), qn('a:hlinkHover'))):
+        if link.get(qn('r:id')) == r_id:
+            link.getparent().remove(link)
+
+
+def _check_slide_selection(slide_indices: List[int], slide_count: int) -> None:
+    """Raise ValueError if a selection has an out-of-range or repeated index."""
+    seen = set()
+    for index in slide_indices:
+        if not 0 <= index < slide_count:
+            raise ValueError(f"Invalid slide index: {index}. Available slides: 0-{slide_count - 1}")
+        if index in seen:
+            raise ValueError(f"Slide index {index} is selected more than once")
+        seen.add(index)
+
+
+class _SlideCopier:
+    """
+    Copies slides between packages part by part, keeping relationship ids.
+    
+    Images and media with the same content type and SHA-1 are stored once in
+    the target; other binary parts, such as chart workbooks that are updated
+    in place, are always copied. Slide layouts are not copied; each slide is attached to a layout
+    of the target's masters instead.
+    """
+    
+    def __init__(self, target: Presentation):
+        self.target = target
+        self.package = target.part.package
+        self.used_partnames = {str(part.partname) for part in self.package.iter_parts()}
+        # (content type, sha1) -> target image or media part; built on first use
+        self._media_parts = None
+        # source part -> copy, for the source being copied
+        self._copies = {}
+        
+        self._layouts_by_name = {}
+        self._layouts_by_type = {}
+        self._default_layout = None
+        for master in target.slide_masters:
+            for layout in master.slide_layouts:
+                self._layouts_by_name.setdefault(layout.name, layout.part)
+                self._layouts_by_type.setdefault(layout.part._element.get('type'), layout.part)
+                if self._default_layout is None:
+                    self._default_layout = layout.part
+        
+        self.layout_mapping = {}
+        self.stats = {"slides_added": 0, "parts_copied": 0, "media_deduplicated": 0}
+    
+    def _next_partname(self, source_partname: str) -> PackURI:
+        """Free partname numbered like source_partname, e.g. /ppt/media/image7.png."""
+        template = re.sub(r'\d*(\.[^./]*)$', r'%d\1', source_partname.replace('%', '%%'))
+        number = 1
+        while template % number in self.used_partnames:
+            number += 1
+        partname = template % number
+        self.used_partnames.add(partname)
+        return PackURI(partname)
+    
+    def _layout_for(self, source_layout_part):
+        """Target layout with the source layout's name, else its type, else the first one."""
+        name = source_layout_part.slide_layout.name
+        layout_part = (
+            self._layouts_by_name.get(name)
+            or self._layouts_by_type.get(source_layout_part._element.get('type'))
+            or self._default_layout
+        )
+        self.layout_mapping.setdefault(name, layout_part.slide_layout.name)
+        return layout_part
+    
+    def _copy_part(self, part):
+        """Copy of a part in the target, creating it (and what it refers to) if needed."""
+        copied = self._copies.get(part)
+        if copied is not None:
+            return copied
+        
+        if isinstance(part, XmlPart):
+            copied = type(part)(self._next_partname(part.partname), part.content_type, self.package,
+                                copy.deepcopy(part._element))
+        else:
+            key = None
+            if isinstance(part, (ImagePart, MediaPart)):
+                if self._media_parts is None:
+                    self._media_parts = {
+                        (existing.content_type, existing.sha1): existing
+                        for existing in self.package.iter_parts() if isinstance(existing, (ImagePart, MediaPart))
+                    }
+                key = (part.content_type, part.sha1)
+                copied = self._media_parts.get(key)
+                if copied is not None:
+                    self.stats["media_deduplicated"] += 1
+                    self._copies[part] = copied
+                    return copied
+            partname = self._next_partname(part.partname)
+            if _is_lazy_part(part):
+                copied = _make_lazy_part(type(part), partname, part.content_type, self.package,
+                                         part._lazy_source, part._lazy_member)
+                copied._lazy_sha1 = part._lazy_sha1
+            else:
+                copied = type(part)(partname, part.content_type, self.package, part.blob)
+            if key is not None:
+                self._media_parts[key] = copied
+        
+        self._copies[part] = copied
+        self.stats["parts_copied"] += 1
+        self._copy_relationships(part, copied)
+        return copied
+    
+    def _copy_relationships(self, part, copied) -> None:
+        target_rels = copied.rels
+        for r_id, rel in part.rels.items():
+            if rel.is_external:
+                target, target_mode = rel.target_ref, RTM.EXTERNAL
+            elif rel.reltype == RT.SLIDE_LAYOUT:
+                target, target_mode = self._layout_for(rel.target_part), RTM.INTERNAL
+            elif rel.reltype == RT.NOTES_MASTER:
+                target, target_mode = self.target.part.notes_master_part, RTM.INTERNAL
+            elif rel.reltype == RT.SLIDE and rel.target_part not in self._copies:
+                # A link to a slide that is not copied along
+                _drop_links(copied, r_id)
+                continue
+            elif rel.reltype == RT.COMMENTS:
+                # Comment authors live in the source presentation part
+                continue
+            else:
+                target, target_mode = self._copy_part(rel.target_part), RTM.INTERNAL
+            target_rels._rels[r_id] = _Relationship(target_rels._base_uri, r_id, rel.reltype, target_mode, target)
+    
+    def copy_slides(self, source: Presentation, slide_indices: Optional[List[int]] = None) -> None:
+        """Append slides of source (all of them by default) to the target in the given order."""
+        source_part = source.part
+        sld_ids = list(source_part._element.get_or_add_sldIdLst())
+        if slide_indices is None:
+            slide_indices = range(len(sld_ids))
+        else:
+            _check_slide_selection(slide_indices, len(sld_ids))
+        self._copies = {}
+        
+        # Create the slides first so that links between copied slides can be kept
+        slide_parts = []
+        for index in slide_indices:
+            slide_part = source_part.related_part(sld_ids[index].rId)
+            copied = SlidePart(self._next_partname(slide_part.partname), slide_part.content_type,
+                               self.package, copy.deepcopy(slide_part._element))
+            self._copies[slide_part] = copied
+            slide_parts.append((slide_part, copied))
+        
+        sld_id_lst = self.target.part._element.get_or_add_sldIdLst()
+        for slide_part, copied in slide_parts:
+            self._copy_relationships(slide_part, copied)
+            sld_id_lst.add_sldId(self.target.part.relate_to(copied, RT.SLIDE))
+            self.stats["slides_added"] += 1
+
+
+def merge_presentations(target: Presentation, sources: List[tuple]) -> Dict:
+    """
+    Append slides of other presentations to a presentation.
+    
+    Slides are copied part by part with their relationships (notes, charts,
+    embedded files, media), without serializing anything. Images and media
+    with the same content are stored once across the target and all sources. Each
+    slide is attached to the target layout with its layout's name, else one
+    of the same layout type, else the target's first layout. Sources opened
+    with lazy_media or slide_indices (see open_presentation) are read only as
+    far as the copied slides need; their media stays in the source files
+    until the target is saved.
+    
+    Args:
+        target: The Presentation object to append to
+        sources: (Presentation, slide indices or None for all slides) pairs
+        
+    Returns:
+        Dictionary with slides_added, parts_copied, media_deduplicated and the
+        layout_mapping from source to target layout names
+        
+    Raises:
+        ValueError: If a slide index is out of range or listed twice
+    """
+    copier = _SlideCopier(target)
+    for source, slide_indices in sources:
+        copier.copy_slides(source, slide_indices)
+    return {**copier.stats, "layout_mapping": copier.layout_mapping}
+
+
+# Number of parsed templates a TemplatePool keeps by default
+DEFAULT_TEMPLATE_POOL_SIZE = 16
+
+
+class TemplatePool:
+    """
+    Parsed template presentations kept in memory.
+    
+    Each template file is parsed once and kept as a read-only master, keyed by
+    its real path and validated against its modification time and size on
+    every request. Callers receive independent copies made with
+    clone_presentation. The least recently used masters are evicted once
+    more than max_templates are cached.
+    """
+    
+    def __init__(self, max_templates: int = DEFAULT_TEMPLATE_POOL_SIZE):
+        self.max_templates = max_templates
+        # real path -> ((mtime_ns, size), master Presentation)
+        self._templates: "OrderedDict[str, tuple]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.load_time = 0.0
+        self.copy_time = 0.0
+    
+    def get(self, template_path: str) -> Presentation:
+        """
+        Return a new presentation based on a template file.
+        
+        Args:
+            template_path: Path to the template .pptx or .potx file
+            
+        Returns:
+            A new Presentation object, independent of every other copy
+            
+        Raises:
+            FileNotFoundError: If the template file doesn't exist
+            Exception: If the template file is corrupted or invalid
+        """
+        if not os.path.exists(template_path):
+            raise FileNotFoundError(f"Template file not found: {template_path}")
+        
+        path = os.path.realpath(template_path)
+        stat = os.stat(path)
+        version = (stat.st_mtime_ns, stat.st_size)
+        
+        entry = self._templates.get(path)
+        if entry is not None and entry[0] == version:
+            self.hits += 1
+            self._templates.move_to_end(path)
+            master = entry[1]
+        else:
+            self.misses += 1
+            start = time.perf_counter()
+            master = create_presentation_from_template(template_path)
+            self.load_time += time.perf_counter() - start
+            self._templates[path] = (version, master)
+            self._templates.move_to_end(path)
+            while len(self._templates) > self.max_templates:
+                self._templates.popitem(last=False)
+                self.evictions += 1
+        
+        start = time.perf_counter()
+        presentation = clone_presentation(master)
+        self.copy_time += time.perf_counter() - start
+        return presentation
+    
+    def clear(self) -> None:
+        """Drop all cached templates."""
+        self._templates.clear()
+    
+    def get_stats(self) -> Dict:
+        """Return cache size, hit rate and time spent loading and copying templates."""
+        requests = self.hits + self.misses
+        return {
+            "cached_templates": len(self._templates),
+            "max_templates": self.max_templates,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / requests, 4) if requests else 0.0,
+            "evictions": self.evictions,
+            "total_load_time_ms": round(self.load_time * 1000, 3),
+            "average_load_time_ms": round(self.load_time * 1000 / self.misses, 3) if self.misses else 0.0,
+            "average_copy_time_ms": round(self.copy_time * 1000 / requests, 3) if requests else 0.0,
+            "templates": [
+                {
+                    "template_path": path,
+                    "slide_count": len(master.slides),
+                    "layout_count": len(master.slide_layouts)
+                }
+                for path, (_, master) in self._templates.items()
+            ]
+        }
+
+
+# File extensions recognised as templates
+TEMPLATE_EXTENSIONS = ('.pptx', '.potx')
+
+# Seconds between checks of the template directories for added or removed files
+TEMPLATE_CATALOG_POLL_INTERVAL = 2.0
+
+
+class TemplateCatalog:
+    """
+    Index of the template files in the template search directories.
+    
+    The directories are scanned once into a file name -> path index; the
+    first directory in search order wins when a name appears more than once.
+    Afterwards each directory's mtime is polled at most every poll_interval
+    seconds and only directories whose mtime changed are rescanned. The
+    directory list itself is recomputed only when PPT_TEMPLATE_PATH changes.
+    """
+    
+    def __init__(self, get_search_directories: Callable[[], List[str]],
+                 poll_interval: float = TEMPLATE_CATALOG_POLL_INTERVAL):
+        self._get_search_directories = get_search_directories
+        self.poll_interval = poll_interval
+        self._env_path = None
+        self._directories: Optional[List[str]] = None
+        # directory -> (mtime_ns, {file name: path}); mtime_ns is None if missing
+        self._listings: Dict[str, tuple] = {}
+        self._index: Dict[str, str] = {}
+        self._last_poll = None
+    
+    @property
+    def directories(self) -> List[str]:
+        """Template search directories, in search order."""
+        env_path = os.environ.get("PPT_TEMPLATE_PATH")
+        if self._directories is None or env_path != self._env_path:
+            self._env_path = env_path
+            self._directories = self._get_search_directories()
+            self._last_poll = None
+        return self._directories
+    
+    @staticmethod
+    def _scan_directory(directory: str) -> tuple:
+        """Return (mtime_ns, {file name: path}) for one directory."""
+        try:
+            mtime = os.stat(directory).st_mtime_ns
+            with os.scandir(directory) as entries:
+                files = {
+                    entry.name: entry.path for entry in entries
+                    if entry.name.lower().endswith(TEMPLATE_EXTENSIONS) and entry.is_file()
+                }
+        except OSError:
+            return None, {}
+        return mtime, files
+    
+    def refresh(self, force: bool = False) -> None:
+        """
+        Rescan directories whose mtime changed.
+        
+        Args:
+            force: Check the directories even if the poll interval has not passed
+        """
+        directories = self.directories
+        now = time.monotonic()
+        if not force and self._last_poll is not None and now - self._last_poll < self.poll_interval:
+            return
+        self._last_poll = now
+        
+        changed = set(self._listings) != set(directories)
+        for directory in directories:
+            try:
+                mtime = os.stat(directory).st_mtime_ns
+            except OSError:
+                mtime = None
+            listing = self._listings.get(directory)
+            if listing is None or listing[0] != mtime:
+                self._listings[directory] = self._scan_directory(directory)
+                changed = True
+        
+        if changed:
+            for directory in set(self._listings) - set(directories):
+                del self._listings[directory]
+            index = {}
+            for directory in directories:
+                for name, path in self._listings[directory][1].items():
+                    index.setdefault(name, path)
+            self._index = index
+    
+    def find(self, template_path: str) -> Optional[str]:
+        """
+        Resolve a template path or file name.
+        
+        Args:
+            template_path: Path to a template file, or the name of a file in
+                one of the search directories
+            
+        Returns:
+            The path of the template file, or None if it cannot be found
+        """
+        if os.path.isfile(template_path):
+            return template_path
+        
+        name = os.path.basename(template_path)
+        self.refresh()
+        if name not in self._index:
+            # The file may have been added since the last poll
+            self.refresh(force=True)
+        return self._index.get(name)
+    
+    def list_templates(self, include_layouts: bool = True) -> List[Dict]:
+        """
+        List the template files in the search directories.
+        
+        Args:
+            include_layouts: Whether to include the number of slide layouts
+            
+        Returns:
+            List of dictionaries with name, path, size and modification time
+        """
+        self.refresh()
+        templates = []
+        for name, path in sorted(self._index.items()):
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            template = {
+                "name": name,
+                "path": path,
+                "directory": os.path.dirname(path),
+                "file_size_bytes": stat.st_size,
+                "modified": stat.st_mtime
+            }
+            if include_layouts:
+                # get_template_info caches by modification time and size
+                try:
+                    template["layout_count"] = get_template_info(path)["layout_count"]
+                except Exception:
+                    template["layout_count"] = None
+            templates.append(template)
+        return templates
+
+
+def save_presentation(presentation: Presentation, file_path: str,
+                      compression: Optional[ZipCompressionPolicy] = None) -> str:
     """
     Save a PowerPoint presentation to a file.
     
     Args:
         presentation: The Presentation object
         file_path: Path where the file should be saved
+        compression: How to compress the parts (see ZipCompressionPolicy); by
+            default every part is deflated, as python-pptx does
         
     Returns:
         The file path where the presentation was saved
     """
-    presentation.save(file_path)
+    if any(_is_lazy_part(part) for part in presentation.part.package.iter_parts()):
+        # Lazy parts are copied from their source file, which may be the file being
+        # written; replacing the file leaves the open source intact
+        members = {}
+        
+        def write(target_file):
+            members.update(_write_package(presentation, target_file, compression)[0])
+        
+        _write_file_replacing(file_path, write)
+    elif compression is None:
+        presentation.save(file_path)
+        members = None
+    else:
+        with open(file_path, 'wb') as target_file:
+            members, _ = _write_package(presentation, target_file, compression)
+    if isinstance(file_path, str):
+        _record_package_snapshot(presentation, file_path, members)
     return file_path
 
 
-def get_template_info(template_path: str) -> Dict:
+def save_presentation_to_bytes(presentation: Presentation,
+                               compression: Optional[ZipCompressionPolicy] = None) -> io.BytesIO:
     """
-    Get information about a template file.
+    Serialize a PowerPoint presentation into memory.
     
     Args:
-        template_path: Path to the template .pptx file
+        presentation: The Presentation object
+        compression: How to compress the parts (see save_presentation)
         
     Returns:
-        Dictionary containing template information
+        BytesIO holding the .pptx file, positioned at the start; use
+        getbuffer() to read it without copying
     """
-    if not os.path.exists(template_path):
-        raise FileNotFoundError(f"Template file not found: {template_path}")
+    buffer = io.BytesIO()
+    if compression is None and not any(_is_lazy_part(part) for part in presentation.part.package.iter_parts()):
+        presentation.save(buffer)
+    else:
+        _write_package(presentation, buffer, compression)
+    buffer.seek(0)
+    return buffer
+
+
+def _write_package(presentation: Presentation, target_file, compression: Optional[ZipCompressionPolicy],
+                   snapshot=None, dirty: Optional[set] = None, source_file=None) -> tuple:
+    """
+    Write the package of a presentation as a zip archive.
+    
+    Members are written in the same order as python-pptx's PackageWriter. With
+    a snapshot, parts it reports unchanged are copied from source_file instead.
+    Lazily loaded parts are always copied from the file they were opened from.
+    
+    Returns:
+        Tuple of ({member name: ZipInfo}, {"parts_written", "parts_copied", "bytes_copied"})
+    """
+    package = presentation.part.package
+    parts = tuple(package.iter_parts())
+    stats = {"parts_written": 0, "parts_copied": 0, "bytes_copied": 0}
     
+    with PackageZipWriter(target_file, compression) as writer:
+        writer.write(CONTENT_TYPES_URI.membername, serialize_part_xml(_ContentTypesItem.xml_for(parts)))
+        writer.write(PACKAGE_URI.rels_uri.membername, package._rels.xml)
+        for part in parts:
+            if _is_lazy_part(part):
+                info = part._lazy_source.members[part._lazy_member]
+                writer.copy(part._lazy_source.file, info, part.partname.membername, part._lazy_source.lock)
+                stats["parts_copied"] += 1
+                stats["bytes_copied"] += info.compress_size
+                if part._rels:
+                    # Serializing relationships is slow; most lazy parts still have the ones they were loaded with
+                    rels_info = part._lazy_source.members.get(PackURI('/' + part._lazy_member).rels_uri.membername)
+                    if rels_info is not None and part._lazy_rels == _rels_signature(part):
+                        writer.copy(part._lazy_source.file, rels_info, part.partname.rels_uri.membername,
+                                    part._lazy_source.lock)
+                    else:
+                        writer.write(part.partname.rels_uri.membername, part.rels.xml)
+                continue
+            source = snapshot.parts.get(part) if snapshot is not None else None
+            unchanged = source is not None and (
+                (dirty is not None and part not in dirty) if source[1] is None
+                else part.blob is source[1]
+            )
+            if unchanged:
+                info = snapshot.members[source[0]]
+                writer.copy(source_file, info, part.partname.membername)
+                stats["parts_copied"] += 1
+                stats["bytes_copied"] += info.compress_size
+            else:
+                writer.write(part.partname.membername, part.blob)
+                stats["parts_written"] += 1
+            if part._rels:
+                writer.write(part.partname.rels_uri.membername, part.rels.xml)
+    return {info.filename: info for info in writer.zip_file.infolist()}, stats
+
+
+class _PackageSnapshot:
+    """The file a presentation was last opened from or saved to, and which part is where in it."""
+
+    __slots__ = ('file_path', 'version', 'members', 'parts')
+
+    def __init__(self, file_path: str, version: tuple, members: Dict[str, zipfile.ZipInfo]):
+        self.file_path = file_path
+        self.version = version
+        self.members = members
+        # part -> (member name, blob object for binary parts or None for XML parts)
+        self.parts = weakref.WeakKeyDictionary()
+
+
+# presentation part -> _PackageSnapshot
+_package_snapshots = weakref.WeakKeyDictionary()
+
+
+def _file_version(file_path: str) -> tuple:
+    """Modification time and size, used to detect a file changed by someone else."""
+    stat = os.stat(file_path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _record_package_snapshot(presentation: Presentation, file_path: str,
+                             members: Optional[Dict[str, zipfile.ZipInfo]] = None) -> None:
+    """Remember which member of file_path holds each part of the presentation."""
     try:
-        presentation = Presentation(template_path)
+        if members is None:
+            with zipfile.ZipFile(file_path) as archive:
+                members = {info.filename: info for info in archive.infolist()}
+        snapshot = _PackageSnapshot(file_path, _file_version(file_path), members)
+    except (OSError, zipfile.BadZipFile):
+        _package_snapshots.pop(presentation.part, None)
+        return
+
+    for part in presentation.part.package.iter_parts():
+        member = part.partname.membername
+        # Lazy parts are copied from their own source on every save
+        if member in members and not _is_lazy_part(part):
+            snapshot.parts[part] = (member, None if isinstance(part, XmlPart) else part.blob)
+    _package_snapshots[presentation.part] = snapshot
+
+
+def _dirty_xml_parts(presentation: Presentation, changes) -> Optional[set]:
+    """
+    XML parts touched by the changes in a ChangeSet; None if every XML part may have changed.
+    
+    Slides count together with the XML parts they own (charts, notes); a
+    document-level change marks every XML part that does not belong to a slide.
+    """
+    if changes is None or changes.full:
+        return None
+    
+    dirty = set()
+    if changes.structure_changed:
+        dirty.add(presentation.part)
+    if changes.document_changed:
+        slide_owned = set()
+        for sld_id in presentation.slides._sldIdLst:
+            slide_part = presentation.part.related_part(sld_id.rId)
+            slide_owned.add(slide_part)
+            slide_owned.update(
+                rel.target_part for rel in slide_part.rels.values()
+                if not rel.is_external and rel.reltype != RT.SLIDE_LAYOUT
+            )
+        dirty.update(
+            part for part in presentation.part.package.iter_parts()
+            if isinstance(part, XmlPart) and part not in slide_owned
+        )
+    
+    changed_slide_ids = changes.affected_slide_ids()
+    if changed_slide_ids:
+        for sld_id in presentation.slides._sldIdLst:
+            if sld_id.id in changed_slide_ids:
+                slide_part = presentation.part.related_part(sld_id.rId)
+                dirty.add(slide_part)
+                dirty.update(
+                    rel.target_part for rel in slide_part.rels.values()
+                    if not rel.is_external and rel.reltype != RT.SLIDE_LAYOUT
+                )
+    return dirty
+
+
+def _write_file_replacing(file_path: str, write: Callable) -> None:
+    """Call write(file object) on a temporary file next to file_path, then move it into place."""
+    directory = os.path.dirname(os.path.abspath(file_path))
+    fd, temp_path = tempfile.mkstemp(suffix='.pptx', dir=directory)
+    try:
+        with os.fdopen(fd, 'wb') as target_file:
+            write(target_file)
+        # mkstemp creates the file as 0600; give it the mode a normal save would
+        if os.path.exists(file_path):
+            shutil.copymode(file_path, temp_path)
+        else:
+            umask = os.umask(0)
+            os.umask(umask)
+            os.chmod(temp_path, 0o666 & ~umask)
+        os.replace(temp_path, file_path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def save_presentation_incremental(presentation: Presentation, file_path: str, changes=None,
+                                  compression: Optional[ZipCompressionPolicy] = None) -> Dict:
+    """
+    Save a presentation, copying unchanged parts from the file it was last
+    opened from or saved to instead of serializing and compressing them again.
+    
+    Binary parts (media, embedded workbooks) are copied byte-for-byte, compressed
+    stream included, unless their data was replaced. XML parts are copied unless
+    'changes' marks them as modified; without 'changes' every XML part is
+    serialized and only binary parts are copied. Relationship parts and
+    [Content_Types].xml are always written, since slide part names can change.
+    Falls back to a full save if there is no source file or it was modified
+    since. The file is written to a temporary file and moved into place.
+    
+    Args:
+        presentation: The Presentation object
+        file_path: Path where the file should be saved (may be the source file)
+        changes: ChangeSet of the edits since the last open or save (from a
+            ChangeTracker consumer that was advanced at that open or save)
+        compression: How to compress the parts that are written (see
+            ZipCompressionPolicy); copied parts keep their compression
         
-        # Get slide layouts
-        layouts = get_slide_layouts(presentation)
+    Returns:
+        Dictionary with the saved path, whether the save was incremental, and
+        how many parts were written and copied
+    """
+    start_time = time.perf_counter()
+    snapshot = _package_snapshots.get(presentation.part)
+    reason = None
+    if snapshot is None:
+        reason = "presentation was not opened from or saved to a file"
+    else:
+        try:
+            if _file_version(snapshot.file_path) != snapshot.version:
+                reason = f"source file '{snapshot.file_path}' changed since it was read"
+        except OSError:
+            reason = f"source file '{snapshot.file_path}' is no longer available"
+    
+    if reason is not None:
+        save_presentation(presentation, file_path, compression)
+        return {
+            "file_path": file_path,
+            "incremental": False,
+            "reason": reason,
+            "save_time_ms": round((time.perf_counter() - start_time) * 1000, 3)
+        }
+    
+    dirty = _dirty_xml_parts(presentation, changes)
+    result = {}
+    
+    def write(target_file):
+        with open(snapshot.file_path, 'rb') as source_file:
+            result["members"], result["stats"] = _write_package(
+                presentation, target_file, compression, snapshot, dirty, source_file
+            )
+    
+    _write_file_replacing(file_path, write)
+    members, stats = result["members"], result["stats"]
+    
+    _record_package_snapshot(presentation, file_path, members)
+    return {
+        "file_path": file_path,
+        "incremental": True,
+        **stats,
+        "save_time_ms": round((time.perf_counter() - start_time) * 1000, 3)
+    }
+
+
+class _PartState:
+    """
+    Immutable content of one part at the time a snapshot was taken.
+    
+    Snapshots share a _PartState, and with it the serialized XML or blob, as
+    long as the part does not change between them.
+    """
+    
+    __slots__ = ('part_class', 'content_type', 'data', 'filename', 'lazy_source', 'lazy_member', 'lazy_rels', 'rels')
+    
+    def __init__(self, part_class, content_type: str, data: Optional[bytes], filename: Optional[str],
+                 lazy_source: Optional[_LazyPackageSource], lazy_member: Optional[str], lazy_rels, rels: tuple):
+        self.part_class = part_class
+        self.content_type = content_type
+        # Serialized XML or blob; None while the part is still only in lazy_source
+        self.data = data
+        self.filename = filename
+        self.lazy_source = lazy_source
+        self.lazy_member = lazy_member
+        self.lazy_rels = lazy_rels
+        # _rels_signature() of the part
+        self.rels = rels
+
+
+# part -> _PartState it had when its presentation was last snapshotted or restored
+_part_states = weakref.WeakKeyDictionary()
+
+
+class PresentationSnapshot:
+    """
+    The state of a presentation at one point in time, restorable with restore_snapshot.
+    
+    Holds serialized parts only, never the live part objects, so a snapshot
+    does not keep the presentation it was taken from alive.
+    """
+    
+    __slots__ = ('parts', 'package_rels', 'slide_count', 'created', 'copied_parts', 'copied_bytes')
+    
+    def __init__(self, parts: Dict[PackURI, _PartState], package_rels: tuple, slide_count: int,
+                 copied_parts: int, copied_bytes: int):
+        self.parts = parts
+        self.package_rels = package_rels
+        self.slide_count = slide_count
+        self.created = time.time()
+        # Parts and bytes this snapshot does not share with earlier ones
+        self.copied_parts = copied_parts
+        self.copied_bytes = copied_bytes
+
+
+def snapshot_presentation(presentation: Presentation, changes=None) -> PresentationSnapshot:
+    """
+    Capture the state of a presentation, sharing unchanged parts with its previous snapshot.
+    
+    Binary parts share their blob with the live presentation, and parts still
+    in a lazily opened source file are referenced rather than read. XML parts
+    are serialized only if they are new since the previous snapshot or marked
+    by 'changes'; a re-serialized part whose XML came out identical is still
+    shared. Memory therefore grows with what changed, not with the deck.
+    
+    Args:
+        presentation: The Presentation object
+        changes: ChangeSet of the edits since the previous snapshot or restore
+            (from a ChangeTracker consumer advanced at that point); without it
+            every XML part is serialized and compared
         
-        # Get core properties
-        core_props = get_core_properties(presentation)
+    Returns:
+        PresentationSnapshot of the presentation
+    """
+    dirty = _dirty_xml_parts(presentation, changes)
+    package = presentation.part.package
+    
+    parts = {}
+    copied_parts = copied_bytes = 0
+    for part in package.iter_parts():
+        previous = _part_states.get(part)
+        rels = _rels_signature(part)
+        if previous is not None and previous.rels != rels:
+            # Same content under new relationships (e.g. a slide was renamed)
+            previous = _PartState(
+                previous.part_class, previous.content_type, previous.data, previous.filename,
+                previous.lazy_source, previous.lazy_member, previous.lazy_rels, rels
+            )
         
-        # Get slide count
-        slide_count = len(presentation.slides)
+        if _is_lazy_part(part):
+            state = previous if previous is not None and previous.lazy_source is part._lazy_source else None
+            if state is None:
+                state = _PartState(type(part), part.content_type, None, None,
+                                   part._lazy_source, part._lazy_member, part._lazy_rels, rels)
+        elif isinstance(part, XmlPart):
+            state = previous
+            if state is None or state.data is None or dirty is None or part in dirty:
+                data = part.blob
+                if state is not None and state.data == data:
+                    data = state.data
+                else:
+                    copied_parts += 1
+                    copied_bytes += len(data)
+                state = _PartState(type(part), part.content_type, data, None, None, None, None, rels)
+        else:
+            blob = part._blob
+            state = previous if previous is not None and previous.data is blob else None
+            if state is None:
+                state = _PartState(type(part), part.content_type, blob, getattr(part, '_filename', None),
+                                   None, None, None, rels)
+        
+        _part_states[part] = state
+        parts[part.partname] = state
+    
+    package_rels = tuple(
+        (r_id, rel.reltype, rel.target_ref if rel.is_external else rel.target_part.partname)
+        for r_id, rel in package._rels.items()
+    )
+    return PresentationSnapshot(
+        parts, package_rels, len(presentation.slides._sldIdLst), copied_parts, copied_bytes
+    )
+
+
+def restore_snapshot(snapshot: PresentationSnapshot) -> Presentation:
+    """
+    Rebuild a presentation from a snapshot.
+    
+    XML parts are parsed from the snapshot, binary parts share its blobs and
+    parts that were still in a lazily opened source file read from it again.
+    The parts of the new presentation count as unchanged relative to the
+    snapshot, so the next snapshot of it shares everything not edited since.
+    
+    Args:
+        snapshot: PresentationSnapshot returned by snapshot_presentation
         
-        # Get file size
-        file_size = os.path.getsize(template_path)
+    Returns:
+        A new Presentation object
+    """
+    package = Package(None)
+    
+    parts = {}
+    for partname, state in snapshot.parts.items():
+        if state.lazy_source is not None:
+            part = _make_lazy_part(state.part_class, partname, state.content_type, package,
+                                   state.lazy_source, state.lazy_member)
+            part._lazy_rels = state.lazy_rels
+        elif issubclass(state.part_class, ImagePart):
+            part = state.part_class(partname, state.content_type, package, state.data, state.filename)
+        else:
+            part = state.part_class.load(partname, state.content_type, package, state.data)
+        parts[partname] = part
+        _part_states[part] = state
+    
+    def load_relationships(rels, signature):
+        for r_id, reltype, target in signature:
+            if isinstance(target, PackURI):
+                target, target_mode = parts[target], RTM.INTERNAL
+            else:
+                target_mode = RTM.EXTERNAL
+            rels._rels[r_id] = _Relationship(rels._base_uri, r_id, reltype, target_mode, target)
+    
+    load_relationships(package._rels, snapshot.package_rels)
+    for partname, state in snapshot.parts.items():
+        load_relationships(parts[partname].rels, state.rels[1])
+    
+    return package.main_document_part.presentation
+
+
+# Number of template files whose metadata get_template_info keeps
+TEMPLATE_INFO_CACHE_SIZE = 256
+
+# absolute path -> ((mtime_ns, size), template info), least recently used first
+_template_info_cache: "OrderedDict[str, tuple]" = OrderedDict()
+
+
+def get_template_info(template_path: str) -> Dict:
+    """
+    Get information about a template file.
+    
+    The metadata is read straight from the package XML and cached by path,
+    modification time and size, so repeated calls for an unchanged file do
+    not touch the archive.
+    
+    Args:
+        template_path: Path to the template .pptx file
         
-        return {
-            "template_path": template_path,
-            "file_size_bytes": file_size,
-            "slide_count": slide_count,
-            "layout_count": len(layouts),
-            "slide_layouts": layouts,
-            "core_properties": core_props
+    Returns:
+        Dictionary containing template information
+    """
+    try:
+        stat = os.stat(template_path)
+    except OSError:
+        raise FileNotFoundError(f"Template file not found: {template_path}")
+    
+    key = os.path.abspath(template_path)
+    version = (stat.st_mtime_ns, stat.st_size)
+    cached = _template_info_cache.get(key)
+    if cached is not None and cached[0] == version:
+        _template_info_cache.move_to_end(key)
+        info = cached[1]
+    else:
+        try:
+            metadata = read_template_metadata(template_path)
+        except Exception as e:
+            raise Exception(f"Failed to read template info from '{template_path}': {str(e)}")
+        
+        info = {
+            "file_size_bytes": stat.st_size,
+            "slide_count": metadata["slide_count"],
+            "layout_count": len(metadata["slide_layouts"]),
+            "slide_layouts": metadata["slide_layouts"],
+            "core_properties": metadata["core_properties"]
         }
-    except Exception as e:
-        raise Exception(f"Failed to read template info from '{template_path}': {str(e)}")
+        _template_info_cache[key] = (version, info)
+        _template_info_cache.move_to_end(key)
+        while len(_template_info_cache) > TEMPLATE_INFO_CACHE_SIZE:
+            _template_info_cache.popitem(last=False)
+    
+    # Callers get their own copy of the cached entry
+    return {
+        "template_path": template_path,
+        "file_size_bytes": info["file_size_bytes"],
+        "slide_count": info["slide_count"],
+        "layout_count": info["layout_count"],
+        "slide_layouts": [dict(layout) for layout in info["slide_layouts"]],
+        "core_properties": dict(info["core_properties"])
+    }
 
 
 def get_presentation_info(presentation: Presentation) -> Dict:
@@ -0,0 +1,312 @@
+"""
+Full-text search utilities for PowerPoint MCP Server.
+Maintains an in-memory inverted index over the text of all loaded presentations.
+"""
+import re
+import time
+from bisect import bisect_left
+from typing import Dict, List, Optional, Set, Tuple
+import utils.content_utils as content_utils
+
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+_QUERY_PATTERN = re.compile(r'"([^"]*)"|(\S+)')
+
+# Characters of context shown around the first match in a result snippet
+SNIPPET_CONTEXT_BEFORE = 60
+SNIPPET_CONTEXT_AFTER = 120
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into lowercase word tokens.
+
+    Args:
+        text: Text to tokenize
+
+    Returns:
+        List of tokens in document order
+    """
+    return [token.casefold() for token in _TOKEN_PATTERN.findall(text)]
+
+
+def parse_search_query(query: str) -> List[List[Tuple[str, bool]]]:
+    """
+    Parse a search query into clauses that must all match the same shape.
+
+    Quoted text is a phrase whose tokens must appear consecutively. An unquoted
+    word is a clause of its own (words such as "Q3-churn" that tokenize to
+    several tokens are treated as a phrase). A trailing '*' turns the last
+    token of a word into a prefix match.
+
+    Args:
+        query: Query string, e.g. 'revenue "q3 churn" forecast*'
+
+    Returns:
+        List of clauses, each a list of (token, is_prefix) tuples
+    """
+    clauses = []
+    for phrase, word in _QUERY_PATTERN.findall(query):
+        terms = []
+        for chunk in (phrase.split() if phrase else [word]):
+            tokens = tokenize(chunk)
+            if not tokens:
+                continue
+            terms.extend((token, False) for token in tokens[:-1])
+            terms.append((tokens[-1], chunk.endswith('*')))
+        if terms:
+            clauses.append(terms)
+    return clauses
+
+
+class PresentationSearchIndex:
+    """
+    Inverted index from token to the shapes containing it.
+
+    Postings are keyed by (presentation_id, slide_index, shape_index) and keep
+    the token positions within the shape text, which makes phrase queries
+    possible. The index is maintained incrementally: presentations that appear
+    in the store are indexed on the next search, and afterwards only the
+    slides and shapes reported by the change tracker are re-read.
+    """
+
+    # Consumer key used with the change tracker
+    CHANGE_CONSUMER = "search_index"
+
+    def __init__(self, presentations: Dict, change_tracker):
+        self.presentations = presentations
+        self.change_tracker = change_tracker
+        # token -> {(presentation_id, slide_index, shape_index): [positions]}
+        self._postings: Dict[str, Dict[Tuple[str, int, int], List[int]]] = {}
+        self._shape_text: Dict[Tuple[str, int, int], str] = {}
+        self._shape_tokens: Dict[Tuple[str, int, int], Set[str]] = {}
+        # (presentation_id, slide_index) -> keys of the slide's indexed shapes
+        self._slide_keys: Dict[Tuple[str, int], Set[Tuple[str, int, int]]] = {}
+        # presentation_id -> (presentation object, slide ids at indexing time)
+        self._indexed: Dict[str, Tuple[object, List[int]]] = {}
+        self._vocabulary: Optional[List[str]] = None
+
+    def refresh(self) -> None:
+        """Bring the index up to date with the presentation store."""
+        for pres_id in list(self._indexed):
+            pres = self.presentations.get(pres_id)
+            if pres is None or pres is not self._indexed[pres_id][0]:
+                self._drop_presentation(pres_id)
+
+        for pres_id, pres in self.presentations.items():
+            changes = self.change_tracker.collect(self.CHANGE_CONSUMER, pres_id)
+            if pres_id not in self._indexed or changes.full:
+                if pres_id in self._indexed:
+                    self._drop_presentation(pres_id)
+                self._update_presentation(pres_id, pres, None)
+            elif changes.structure_changed or changes.slide_ids or changes.shape_ids:
+                self._update_presentation(pres_id, pres, changes)
+
+    def _update_presentation(self, pres_id: str, pres, changes) -> None:
+        """Re-index changed, new or moved slides and changed shapes of one presentation."""
+        sld_ids = pres.slides._sldIdLst
+        slide_ids = [sld_id.id for sld_id in sld_ids]
+        old_ids = [] if changes is None else self._indexed[pres_id][1]
+
+        for slide_index in range(len(slide_ids), len(old_ids)):
+            self._remove_slide(pres_id, slide_index)
+
+        for slide_index, slide_id in enumerate(slide_ids):
+            moved = slide_index >= len(old_ids) or old_ids[slide_index] != slide_id
+            changed_shapes = None if moved else changes.changed_shapes(slide_id)
+            if changed_shapes is not None and not changed_shapes:
+                continue
+
+            slide_element = pres.part.related_slide(sld_ids[slide_index].rId)._element
+            if changed_shapes is None:
+                self._index_slide(pres_id, slide_index, slide_element)
+            else:
+                self._index_shapes(pres_id, slide_index, slide_element, changed_shapes)
+
+        self._indexed[pres_id] = (pres, slide_ids)
+
+    def _index_slide(self, pres_id: str, slide_index: int, slide_element) -> None:
+        """Replace the postings of one slide with its current text."""
+        self._remove_slide(pres_id, slide_index)
+        for shape_index, text in content_utils.iter_shape_text_xml(slide_element):
+            self._index_shape(pres_id, slide_index, shape_index, text)
+
+    def _index_shapes(self, pres_id: str, slide_index: int, slide_element, shape_ids: Set[int]) -> None:
+        """Replace the postings of specific shapes, addressed by shape id."""
+        found = content_utils.get_shape_text_by_id_xml(slide_element, shape_ids)
+        if len(found) < len(shape_ids):
+            # A changed shape was removed, so the indexes of the others may have shifted
+            self._index_slide(pres_id, slide_index, slide_element)
+            return
+        for shape_index, text in found.values():
+            self._remove_shape((pres_id, slide_index, shape_index))
+            if text:
+                self._index_shape(pres_id, slide_index, shape_index, text)
+
+    def _index_shape(self, pres_id: str, slide_index: int, shape_index: int, text: str) -> None:
+        """Add the postings of one shape."""
+        key = (pres_id, slide_index, shape_index)
+        tokens = set()
+        self._shape_text[key] = text
+        for position, token in enumerate(tokenize(text)):
+            postings = self._postings.get(token)
+            if postings is None:
+                postings = self._postings[token] = {}
+                self._vocabulary = None
+            postings.setdefault(key, []).append(position)
+            tokens.add(token)
+        self._shape_tokens[key] = tokens
+        self._slide_keys.setdefault((pres_id, slide_index), set()).add(key)
+
+    def _remove_shape(self, key: Tuple[str, int, int]) -> None:
+        """Remove all postings of one shape."""
+        tokens = self._shape_tokens.pop(key, None)
+        if tokens is None:
+            return
+        for token in tokens:
+            postings = self._postings[token]
+            del postings[key]
+            if not postings:
+                del self._postings[token]
+                self._vocabulary = None
+        del self._shape_text[key]
+        self._slide_keys[key[:2]].discard(key)
+
+    def _remove_slide(self, pres_id: str, slide_index: int) -> None:
+        """Remove all postings of one slide."""
+        for key in self._slide_keys.pop((pres_id, slide_index), ()):
+            tokens = self._shape_tokens.pop(key)
+            for token in tokens:
+                postings = self._postings[token]
+                del postings[key]
+                if not postings:
+                    del self._postings[token]
+                    self._vocabulary = None
+            del self._shape_text[key]
+
+    def _drop_presentation(self, pres_id: str) -> None:
+        """Remove a presentation that was closed or replaced in the store."""
+        _, slide_ids = self._indexed.pop(pres_id)
+        for slide_index in range(len(slide_ids)):
+            self._remove_slide(pres_id, slide_index)
+
+    def _term_positions(self, token: str, is_prefix: bool) -> Dict[Tuple[str, int, int], List[int]]:
+        """Postings for an exact token, or merged postings of all tokens with a prefix."""
+        if not is_prefix:
+            return self._postings.get(token, {})
+
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self._postings)
+        vocabulary = self._vocabulary
+
+        merged = {}
+        i = bisect_left(vocabulary, token)
+        while i < len(vocabulary) and vocabulary[i].startswith(token):
+            for key, positions in self._postings[vocabulary[i]].items():
+                merged.setdefault(key, []).extend(positions)
+            i += 1
+        return merged
+
+    def _match_clause(self, terms: List[Tuple[str, bool]]) -> Dict[Tuple[str, int, int], Tuple[int, int]]:
+        """Shapes matching a clause, with (occurrence count, first match position)."""
+        first = self._term_positions(*terms[0])
+        if len(terms) == 1:
+            return {key: (len(positions), min(positions)) for key, positions in first.items()}
+
+        following = [self._term_positions(*term) for term in terms[1:]]
+        matches = {}
+        for key, starts in first.items():
+            position_sets = []
+            for postings in following:
+                positions = postings.get(key)
+                if positions is None:
+                    break
+                position_sets.append(set(positions))
+            else:
+                hits = [
+                    start for start in starts
+                    if all(start + offset in positions
+                           for offset, positions in enumerate(position_sets, 1))
+                ]
+                if hits:
+                    matches[key] = (len(hits), min(hits))
+        return matches
+
+    def _snippet(self, text: str, token_position: int) -> str:
+        """Text around the token at the given position."""
+        for position, match in enumerate(_TOKEN_PATTERN.finditer(text)):
+            if position == token_position:
+                start = max(0, match.start() - SNIPPET_CONTEXT_BEFORE)
+                end = min(len(text), match.start() + SNIPPET_CONTEXT_AFTER)
+                snippet = text[start:end].replace("\n", " ").replace("\v", " ")
+                return ("..." if start > 0 else "") + snippet + ("..." if end < len(text) else "")
+        return text[:SNIPPET_CONTEXT_AFTER]
+
+    def search(self, query: str, presentation_ids: Optional[List[str]] = None,
+               limit: int = 50) -> Dict:
+        """
+        Find the shapes whose text matches every clause of a query.
+
+        Args:
+            query: Query string; see parse_search_query for the syntax
+            presentation_ids: Restrict results to these presentations (all if None)
+            limit: Maximum number of results to return
+
+        Returns:
+            Dictionary with the ranked results and index statistics
+        """
+        start_time = time.perf_counter()
+        clauses = parse_search_query(query)
+        if not clauses:
+            raise ValueError("Query does not contain any searchable words")
+
+        self.refresh()
+
+        # Match the most selective clauses first so the candidate set shrinks quickly
+        matches = None
+        for clause in sorted(clauses, key=lambda terms: len(self._postings.get(terms[0][0], ()))):
+            clause_matches = self._match_clause(clause)
+            if matches is None:
+                matches = clause_matches
+            else:
+                matches = {
+                    key: (matches[key][0] + count, min(matches[key][1], position))
+                    for key, (count, position) in clause_matches.items()
+                    if key in matches
+                }
+            if not matches:
+                break
+
+        if presentation_ids is not None:
+            wanted = set(presentation_ids)
+            matches = {key: value for key, value in matches.items() if key[0] in wanted}
+
+        ranked = sorted(matches.items(), key=lambda item: (-item[1][0], item[0]))
+        results = [
+            {
+                "presentation_id": pres_id,
+                "slide_index": slide_index,
+                "shape_index": shape_index,
+                "score": count,
+                "snippet": self._snippet(self._shape_text[(pres_id, slide_index, shape_index)], position)
+            }
+            for (pres_id, slide_index, shape_index), (count, position) in ranked[:limit]
+        ]
+
+        return {
+            "query": query,
+            "total_matches": len(ranked),
+            "matching_slides": len({key[:2] for key, _ in ranked}),
+            "results": results,
+            "search_time_ms": round((time.perf_counter() - start_time) * 1000, 3)
+        }
+
+    def get_stats(self) -> Dict:
+        """Return the size of the index after bringing it up to date."""
+        self.refresh()
+        return {
+            "indexed_presentations": len(self._indexed),
+            "indexed_slides": sum(len(slide_ids) for _, slide_ids in self._indexed.values()),
+            "indexed_shapes": len(self._shape_text),
+            "vocabulary_size": len(self._postings)
+        }
@@ -0,0 +1,152 @@
+"""
+Snapshot utilities for PowerPoint MCP Server.
+Keeps a bounded history of snapshots per presentation so that edits can be undone.
+"""
+from collections import OrderedDict
+from typing import Dict, List, Optional
+from pptx.opc.package import XmlPart
+from utils.presentation_utils import PresentationSnapshot, restore_snapshot, snapshot_presentation
+
+
+# Snapshots kept per presentation; the oldest is dropped when another is taken
+DEFAULT_MAX_SNAPSHOTS = 20
+
+
+class _History:
+    """Snapshots of one presentation, oldest first."""
+
+    __slots__ = ('snapshots', 'labels', 'next_number')
+
+    def __init__(self):
+        # snapshot_id -> PresentationSnapshot
+        self.snapshots: "OrderedDict[str, PresentationSnapshot]" = OrderedDict()
+        self.labels: Dict[str, Optional[str]] = {}
+        self.next_number = 1
+
+
+class SnapshotHistory:
+    """
+    Bounded undo history of the presentations in the store.
+
+    Consecutive snapshots share every part that did not change between them,
+    so a snapshot costs memory in proportion to the edits made since the
+    previous one. Which XML parts changed comes from the change tracker, as
+    for incremental saves; when it reports that anything may have changed,
+    every XML part is serialized and still shared if it came out identical.
+    """
+
+    # Consumer key used with the change tracker
+    CHANGE_CONSUMER = "snapshots"
+
+    def __init__(self, presentations: Dict, change_tracker, max_snapshots: int = DEFAULT_MAX_SNAPSHOTS):
+        if max_snapshots < 1:
+            raise ValueError(f"max_snapshots must be at least 1, got {max_snapshots}")
+        self.presentations = presentations
+        self.change_tracker = change_tracker
+        self.max_snapshots = max_snapshots
+        self._histories: Dict[str, _History] = {}
+
+    def _prune(self) -> None:
+        """Forget the snapshots of presentations no longer in the store."""
+        for pres_id in [pres_id for pres_id in self._histories if pres_id not in self.presentations]:
+            del self._histories[pres_id]
+
+    def _describe(self, history: _History, snapshot_id: str) -> Dict:
+        snapshot = history.snapshots[snapshot_id]
+        return {
+            "snapshot_id": snapshot_id,
+            "label": history.labels[snapshot_id],
+            "created": snapshot.created,
+            "slide_count": snapshot.slide_count,
+            "copied_parts": snapshot.copied_parts,
+            "shared_parts": len(snapshot.parts) - snapshot.copied_parts,
+            "copied_bytes": snapshot.copied_bytes
+        }
+
+    def take(self, pres_id: str, label: Optional[str] = None) -> Dict:
+        """
+        Snapshot a presentation in the store.
+
+        Args:
+            pres_id: ID of the presentation
+            label: Optional description, e.g. the edit about to be made
+
+        Returns:
+            Dictionary describing the snapshot, with 'undo_depth' (the
+            number of snapshots now kept for the presentation)
+        """
+        self._prune()
+        # Advance only once the snapshot exists, so a failed one leaves the changes for the next
+        changes = self.change_tracker.collect(self.CHANGE_CONSUMER, pres_id, advance=False)
+        snapshot = snapshot_presentation(self.presentations[pres_id], changes)
+        self.change_tracker.collect(self.CHANGE_CONSUMER, pres_id)
+
+        history = self._histories.setdefault(pres_id, _History())
+        snapshot_id = f"snapshot_{history.next_number}"
+        history.next_number += 1
+        history.snapshots[snapshot_id] = snapshot
+        history.labels[snapshot_id] = label
+        while len(history.snapshots) > self.max_snapshots:
+            dropped_id, _ = history.snapshots.popitem(last=False)
+            del history.labels[dropped_id]
+
+        return {**self._describe(history, snapshot_id), "undo_depth": len(history.snapshots)}
+
+    def restore(self, pres_id: str, snapshot_id: Optional[str] = None, drop_newer: bool = False) -> Dict:
+        """
+        Replace a presentation in the store with one rebuilt from a snapshot.
+
+        Args:
+            pres_id: ID of the presentation
+            snapshot_id: Snapshot to restore (defaults to the most recent one)
+            drop_newer: Whether to discard the snapshots taken after it, as an undo would
+
+        Returns:
+            Dictionary describing the restored snapshot
+
+        Raises:
+            KeyError: If the presentation has no snapshots or snapshot_id is unknown
+        """
+        self._prune()
+        history = self._histories.get(pres_id)
+        if history is None or not history.snapshots:
+            raise KeyError(f"No snapshots of presentation {pres_id}")
+        if snapshot_id is None:
+            snapshot_id = next(reversed(history.snapshots))
+        elif snapshot_id not in history.snapshots:
+            raise KeyError(
+                f"Unknown snapshot id: {snapshot_id}. Available snapshots: {list(history.snapshots.keys())}"
+            )
+
+        self.presentations[pres_id] = restore_snapshot(history.snapshots[snapshot_id])
+        # The restored parts match the snapshot, so the next one starts from here
+        self.change_tracker.collect(self.CHANGE_CONSUMER, pres_id)
+
+        result = self._describe(history, snapshot_id)
+        if drop_newer:
+            newer = list(history.snapshots.keys())
+            for newer_id in newer[newer.index(snapshot_id) + 1:]:
+                del history.snapshots[newer_id]
+                del history.labels[newer_id]
+        result["undo_depth"] = len(history.snapshots)
+        return result
+
+    def list(self, pres_id: str) -> List[Dict]:
+        """Describe the snapshots of a presentation, oldest first."""
+        self._prune()
+        history = self._histories.get(pres_id)
+        if history is None:
+            return []
+        return [self._describe(history, snapshot_id) for snapshot_id in history.snapshots]
+
+    def retained_bytes(self, pres_id: str) -> int:
+        """Serialized XML held by the snapshots of a presentation, counting shared parts once."""
+        history = self._histories.get(pres_id)
+        if history is None:
+            return 0
+        seen = {}
+        for snapshot in history.snapshots.values():
+            for state in snapshot.parts.values():
+                if state.data is not None and issubclass(state.part_class, XmlPart):
+                    seen[id(state.data)] = len(state.data)
+        return sum(seen.values())
@@ -455,26 +455,37 @@ class EnhancedTemplateManager:
         return features
 
 
-# Global instance for enhanced features
-enhanced_template_manager = EnhancedTemplateManager()
+# Global instance for enhanced features; created on first use because loading
+# the template JSON is not needed to start the server
+_enhanced_template_manager: Optional[EnhancedTemplateManager] = None
 
 
 def get_enhanced_template_manager() -> EnhancedTemplateManager:
     """Get the global enhanced template manager instance."""
-    return enhanced_template_manager
+    global _enhanced_template_manager
+    if _enhanced_template_manager is None:
+        _enhanced_template_manager = EnhancedTemplateManager()
+    return _enhanced_template_manager
+
+
+def __getattr__(name: str):
+    """Create the module-level enhanced_template_manager on first access."""
+    if name == "enhanced_template_manager":
+        return get_enhanced_template_manager()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def calculate_dynamic_font_size(text: str, container_width: float, container_height: float, 
                                font_type: str = 'body') -> int:
     """Calculate optimal font size for given text and container."""
-    return enhanced_template_manager.text_calculator.calculate_optimal_font_size(
+    return get_enhanced_template_manager().text_calculator.calculate_optimal_font_size(
         text, container_width, container_height, font_type
     )
 
 
 def wrap_text_automatically(text: str, container_width: float, font_size: int) -> str:
     """Automatically wrap text to fit container width."""
-    return enhanced_template_manager.text_calculator.wrap_text_intelligently(
+    return get_enhanced_template_manager().text_calculator.wrap_text_intelligently(
         text, container_width, font_size
     )
 
@@ -1008,7 +1019,7 @@ def apply_slide_template(slide, template_id: str, color_scheme: str = 'modern_bl
         Dictionary with application results
     """
     # All templates now have enhanced features built-in
-    return enhanced_template_manager.apply_enhanced_slide_template(
+    return get_enhanced_template_manager().apply_enhanced_slide_template(
         slide, template_id, color_scheme, content_mapping, image_paths
     )
 
@@ -0,0 +1,421 @@
+"""
+Transfer utilities for PowerPoint MCP Server.
+Moves files between the server and clients that cannot reach its filesystem:
+serialized presentations are held in memory and handed out in chunks, and
+uploads are spooled to temporary files addressed by upload:// handles.
+"""
+import base64
+import hashlib
+import io
+import os
+import secrets
+import shutil
+import tempfile
+import threading
+import time
+import weakref
+from typing import Dict, Iterator, Optional
+
+
+# Raw bytes per chunk returned by read_chunk (base64 adds a third on top)
+DEFAULT_TRANSFER_CHUNK_SIZE = 4 * 1024 * 1024
+MAX_TRANSFER_CHUNK_SIZE = 32 * 1024 * 1024
+
+# Seconds a download stays available if it is never completed
+DEFAULT_DOWNLOAD_TTL = 600
+
+# Total size of the downloads held at once
+DEFAULT_MAX_DOWNLOAD_BYTES = 2 * 1024 * 1024 * 1024
+
+# Bytes per write when streaming a download over HTTP
+STREAM_CHUNK_SIZE = 1024 * 1024
+
+# Prefix of the handles that stand in for a file path once an upload finished
+UPLOAD_SCHEME = "upload://"
+
+# Seconds an upload is kept after its last chunk or use
+DEFAULT_UPLOAD_TTL = 3600
+
+# Largest single upload
+DEFAULT_MAX_UPLOAD_BYTES = 2 * 1024 * 1024 * 1024
+
+
+class _Download:
+    """One serialized file waiting to be downloaded."""
+
+    __slots__ = ('data', 'file_name', 'chunk_size', 'sha256', 'expires')
+
+    def __init__(self, buffer: io.BytesIO, file_name: str, chunk_size: int, ttl: float):
+        # A view of the buffer's memory; slices of it are not copies
+        self.data = buffer.getbuffer()
+        self.file_name = file_name
+        self.chunk_size = chunk_size
+        self.sha256 = hashlib.sha256(self.data).hexdigest()
+        self.expires = time.monotonic() + ttl
+
+    @property
+    def chunk_count(self) -> int:
+        return max(1, -(-len(self.data) // self.chunk_size))
+
+
+class DownloadStore:
+    """
+    Serialized presentations waiting to be fetched, addressed by random ids.
+
+    A file is held once, in the BytesIO it was serialized into; chunks and
+    HTTP streams are slices of that buffer. A download is released once its
+    last chunk was read or its HTTP stream finished, and abandoned downloads
+    expire after ttl seconds.
+    """
+
+    def __init__(self, ttl: float = DEFAULT_DOWNLOAD_TTL, max_bytes: int = DEFAULT_MAX_DOWNLOAD_BYTES):
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._downloads: Dict[str, _Download] = {}
+        self._lock = threading.Lock()
+
+    def _expire(self) -> None:
+        """Drop downloads past their expiry time; call with the lock held."""
+        now = time.monotonic()
+        for download_id in [key for key, download in self._downloads.items() if download.expires < now]:
+            del self._downloads[download_id]
+
+    def add(self, buffer: io.BytesIO, file_name: str, chunk_size: int = DEFAULT_TRANSFER_CHUNK_SIZE) -> Dict:
+        """
+        Hold a serialized file for download.
+
+        Args:
+            buffer: BytesIO with the file contents; it must not be written to afterwards
+            file_name: File name offered to the client
+            chunk_size: Raw bytes per chunk for read_chunk
+
+        Returns:
+            Dictionary with download_id, file_name, size_bytes, sha256, chunk_size,
+            chunk_count and expires_in_seconds
+
+        Raises:
+            ValueError: If the chunk size is invalid or the store is full
+        """
+        if not 0 < chunk_size <= MAX_TRANSFER_CHUNK_SIZE:
+            raise ValueError(f"Invalid chunk size: {chunk_size}. Must be between 1 and {MAX_TRANSFER_CHUNK_SIZE}")
+
+        download = _Download(buffer, file_name, chunk_size, self.ttl)
+        with self._lock:
+            self._expire()
+            held = sum(len(existing.data) for existing in self._downloads.values())
+            if held + len(download.data) > self.max_bytes:
+                raise ValueError(
+                    f"Download store is full ({held} of {self.max_bytes} bytes held); "
+                    "finish or wait for pending downloads first"
+                )
+            download_id = secrets.token_urlsafe(24)
+            self._downloads[download_id] = download
+
+        return {
+            "download_id": download_id,
+            "file_name": file_name,
+            "size_bytes": len(download.data),
+            "sha256": download.sha256,
+            "chunk_size": chunk_size,
+            "chunk_count": download.chunk_count,
+            "expires_in_seconds": self.ttl
+        }
+
+    def _get(self, download_id: str) -> _Download:
+        with self._lock:
+            self._expire()
+            download = self._downloads.get(download_id)
+        if download is None:
+            raise KeyError(f"Unknown or expired download id: {download_id}")
+        return download
+
+    def get_file_name(self, download_id: str) -> str:
+        """File name of a pending download."""
+        return self._get(download_id).file_name
+
+    def read_chunk(self, download_id: str, chunk_index: int) -> Dict:
+        """
+        Return one chunk of a download as base64.
+
+        Reading the last chunk releases the download.
+
+        Args:
+            download_id: ID returned by add
+            chunk_index: 0-based chunk number
+
+        Returns:
+            Dictionary with the base64 'data', chunk_index, chunk_count and is_last
+
+        Raises:
+            KeyError: If the download does not exist or expired
+            ValueError: If the chunk index is out of range
+        """
+        download = self._get(download_id)
+        if not 0 <= chunk_index < download.chunk_count:
+            raise ValueError(f"Invalid chunk index: {chunk_index}. Available chunks: 0-{download.chunk_count - 1}")
+
+        start = chunk_index * download.chunk_size
+        data = base64.b64encode(download.data[start:start + download.chunk_size]).decode('ascii')
+        is_last = chunk_index == download.chunk_count - 1
+        if is_last:
+            self.release(download_id)
+        else:
+            download.expires = time.monotonic() + self.ttl
+        return {
+            "download_id": download_id,
+            "chunk_index": chunk_index,
+            "chunk_count": download.chunk_count,
+            "is_last": is_last,
+            "data": data
+        }
+
+    def iter_stream(self, download_id: str, chunk_size: int = STREAM_CHUNK_SIZE) -> Iterator[bytes]:
+        """
+        Yield the bytes of a download for streaming; the download is released at the end.
+
+        Raises:
+            KeyError: If the download does not exist or expired
+        """
+        download = self._get(download_id)
+
+        def chunks():
+            try:
+                for start in range(0, len(download.data), chunk_size):
+                    yield bytes(download.data[start:start + chunk_size])
+            finally:
+                self.release(download_id)
+
+        return chunks()
+
+    def release(self, download_id: str) -> bool:
+        """Forget a download; returns False if it did not exist."""
+        with self._lock:
+            return self._downloads.pop(download_id, None) is not None
+
+    def get_stats(self) -> Dict:
+        """Number and total size of pending downloads."""
+        with self._lock:
+            self._expire()
+            return {
+                "pending_downloads": len(self._downloads),
+                "held_bytes": sum(len(download.data) for download in self._downloads.values()),
+                "max_bytes": self.max_bytes
+            }
+
+
+class _Upload:
+    """One file being received into a spool file."""
+
+    __slots__ = ('path', 'file_name', 'file', 'hasher', 'size', 'expected_size', 'sha256', 'expires', 'lock')
+
+    def __init__(self, path: str, file_name: str, file_obj, expected_size: Optional[int], ttl: float):
+        self.path = path
+        self.file_name = file_name
+        self.file = file_obj
+        self.hasher = hashlib.sha256()
+        self.size = 0
+        self.expected_size = expected_size
+        # Set when the upload finished
+        self.sha256 = None
+        self.expires = time.monotonic() + ttl
+        # Serializes appends to this upload without blocking other uploads
+        self.lock = threading.Lock()
+
+    @property
+    def finished(self) -> bool:
+        return self.sha256 is not None
+
+    def close(self) -> None:
+        if not self.file.closed:
+            self.file.close()
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+
+
+class UploadStore:
+    """
+    Files uploaded in chunks, spooled to a private temporary directory.
+
+    begin() opens an upload, append() writes chunks to its spool file while
+    hashing them, and finish() checks the size and hash and turns the upload
+    into an upload:// handle. resolve_path() maps such handles to the spool
+    file, so tools that take a path accept a handle as well. Uploads are
+    removed by release() or after ttl seconds without use; the spool
+    directory is deleted when the store is garbage collected or at exit.
+    """
+
+    def __init__(self, ttl: float = DEFAULT_UPLOAD_TTL, max_upload_bytes: int = DEFAULT_MAX_UPLOAD_BYTES):
+        self.ttl = ttl
+        self.max_upload_bytes = max_upload_bytes
+        self._uploads: Dict[str, _Upload] = {}
+        self._lock = threading.Lock()
+        self._spool_dir = None
+
+    def _get_spool_dir(self) -> str:
+        """Create the spool directory on first use; call with the lock held."""
+        if self._spool_dir is None:
+            self._spool_dir = tempfile.mkdtemp(prefix="ppt_mcp_uploads_")
+            weakref.finalize(self, shutil.rmtree, self._spool_dir, True)
+        return self._spool_dir
+
+    def _expire(self) -> None:
+        """Remove uploads past their expiry time; call with the lock held."""
+        now = time.monotonic()
+        for upload_id in [key for key, upload in self._uploads.items() if upload.expires < now]:
+            self._uploads.pop(upload_id).close()
+
+    def begin(self, file_name: str, size_bytes: Optional[int] = None) -> Dict:
+        """
+        Open an upload.
+
+        Args:
+            file_name: Name of the file being uploaded; its extension is kept on the spool file
+            size_bytes: Expected size, checked on every append and by finish
+
+        Returns:
+            Dictionary with upload_id, handle, file_name and max_upload_bytes
+
+        Raises:
+            ValueError: If the expected size is invalid or too large
+        """
+        if size_bytes is not None and not 0 <= size_bytes <= self.max_upload_bytes:
+            raise ValueError(f"Invalid size: {size_bytes}. Uploads must be at most {self.max_upload_bytes} bytes")
+
+        upload_id = secrets.token_urlsafe(24)
+        suffix = os.path.splitext(os.path.basename(file_name))[1]
+        with self._lock:
+            self._expire()
+            fd, path = tempfile.mkstemp(suffix=suffix, dir=self._get_spool_dir())
+            self._uploads[upload_id] = _Upload(path, file_name, os.fdopen(fd, "wb"), size_bytes, self.ttl)
+
+        return {
+            "upload_id": upload_id,
+            "handle": UPLOAD_SCHEME + upload_id,
+            "file_name": file_name,
+            "max_upload_bytes": self.max_upload_bytes
+        }
+
+    def _get(self, upload_id: str) -> _Upload:
+        if upload_id.startswith(UPLOAD_SCHEME):
+            upload_id = upload_id[len(UPLOAD_SCHEME):]
+        with self._lock:
+            self._expire()
+            upload = self._uploads.get(upload_id)
+            if upload is not None:
+                upload.expires = time.monotonic() + self.ttl
+        if upload is None:
+            raise KeyError(f"Unknown or expired upload id: {upload_id}")
+        return upload
+
+    def append(self, upload_id: str, data: bytes, offset: Optional[int] = None) -> Dict:
+        """
+        Write the next chunk of an upload.
+
+        Args:
+            upload_id: ID returned by begin
+            data: Raw chunk bytes
+            offset: Position of the chunk in the file; when given it must match the
+                bytes received so far, which makes retries after a lost reply detectable
+
+        Returns:
+            Dictionary with upload_id and received_bytes
+
+        Raises:
+            KeyError: If the upload does not exist or expired
+            ValueError: If the upload finished, the offset does not match or the upload grows too large
+        """
+        upload = self._get(upload_id)
+        with upload.lock:
+            if upload.finished:
+                raise ValueError(f"Upload {upload_id} is already finished")
+            if offset is not None and offset != upload.size:
+                raise ValueError(f"Chunk offset {offset} does not match the {upload.size} bytes received so far")
+            limit = upload.expected_size if upload.expected_size is not None else self.max_upload_bytes
+            if upload.size + len(data) > limit:
+                raise ValueError(f"Upload exceeds its size limit of {limit} bytes")
+
+            upload.file.write(data)
+            upload.hasher.update(data)
+            upload.size += len(data)
+            return {"upload_id": upload_id, "received_bytes": upload.size}
+
+    def finish(self, upload_id: str, sha256: Optional[str] = None) -> Dict:
+        """
+        Complete an upload and make its handle usable as a path.
+
+        Args:
+            upload_id: ID returned by begin
+            sha256: Expected hex digest of the whole file
+
+        Returns:
+            Dictionary with upload_id, handle, file_name, size_bytes and sha256
+
+        Raises:
+            KeyError: If the upload does not exist or expired
+            ValueError: If the size or hash does not match; the upload is removed
+        """
+        upload = self._get(upload_id)
+        with upload.lock:
+            if not upload.finished:
+                upload.file.close()
+                digest = upload.hasher.hexdigest()
+                problem = None
+                if upload.expected_size is not None and upload.size != upload.expected_size:
+                    problem = f"received {upload.size} bytes, expected {upload.expected_size}"
+                elif sha256 is not None and sha256.lower() != digest:
+                    problem = f"sha256 {digest} does not match the expected {sha256.lower()}"
+                if problem is not None:
+                    self.release(upload_id)
+                    raise ValueError(f"Upload {upload_id} failed: {problem}")
+                upload.sha256 = digest
+
+        return {
+            "upload_id": upload_id,
+            "handle": UPLOAD_SCHEME + upload_id,
+            "file_name": upload.file_name,
+            "size_bytes": upload.size,
+            "sha256": upload.sha256
+        }
+
+    def resolve_path(self, path: str) -> str:
+        """
+        Map an upload:// handle to its spool file; other paths are returned unchanged.
+
+        Raises:
+            KeyError: If the handle names an unknown or expired upload
+            ValueError: If the upload has not finished yet
+        """
+        if not isinstance(path, str) or not path.startswith(UPLOAD_SCHEME):
+            return path
+        upload = self._get(path)
+        if not upload.finished:
+            raise ValueError(f"Upload {path} is not finished; call finish_upload first")
+        return upload.path
+
+    def get_file_name(self, upload_id: str) -> str:
+        """File name the client gave an upload."""
+        return self._get(upload_id).file_name
+
+    def release(self, upload_id: str) -> bool:
+        """Remove an upload and its spool file; returns False if it did not exist."""
+        if upload_id.startswith(UPLOAD_SCHEME):
+            upload_id = upload_id[len(UPLOAD_SCHEME):]
+        with self._lock:
+            upload = self._uploads.pop(upload_id, None)
+        if upload is None:
+            return False
+        upload.close()
+        return True
+
+    def get_stats(self) -> Dict:
+        """Number and size of pending and finished uploads."""
+        with self._lock:
+            self._expire()
+            uploads = list(self._uploads.values())
+        return {
+            "pending_uploads": sum(1 for upload in uploads if not upload.finished),
+            "finished_uploads": sum(1 for upload in uploads if upload.finished),
+            "spooled_bytes": sum(upload.size for upload in uploads),
+            "spool_directory": self._spool_dir
+        }
+
@@ -2,7 +2,15 @@
 Validation utilities for PowerPoint MCP Server.
 Functions for validating and fixing slide content, text fit, and layouts.
 """
-from typing import Dict, List, Optional, Any
+from array import array
+from typing import Callable, Dict, List, Optional, Any, Set, Tuple
+from concurrent.futures import ProcessPoolExecutor
+import os
+import weakref
+from lxml import etree
+from pptx.shapes.shapetree import SlideShapeFactory
+import utils.content_utils as content_utils
+from utils.core_utils import get_worker_context
 
 
 def validate_text_fit(shape, text_content: str = None, font_size: int = 12) -> Dict:
@@ -17,14 +25,7 @@ def validate_text_fit(shape, text_content: str = None, font_size: int = 12) -> D
     Returns:
         Dictionary with validation results and suggestions
     """
-    result = {
-        'fits': True,
-        'estimated_overflow': False,
-        'suggested_font_size': font_size,
-        'suggested_dimensions': None,
-        'warnings': [],
-        'needs_optimization': False
-    }
+    result = _new_text_fit_result(font_size)
     
     try:
         # Use existing text if not provided
@@ -36,42 +37,9 @@ def validate_text_fit(shape, text_content: str = None, font_size: int = 12) -> D
         
         # Basic heuristic: estimate if text will overflow
         if hasattr(shape, 'width') and hasattr(shape, 'height'):
-            # Rough estimation: average character width is about 0.6 * font_size
-            avg_char_width = font_size * 0.6
-            estimated_width = len(text_content) * avg_char_width
-            
-            # Convert shape dimensions to points (assuming they're in EMU)
-            shape_width_pt = shape.width / 12700  # EMU to points conversion
-            shape_height_pt = shape.height / 12700
-            
-            if estimated_width > shape_width_pt:
-                result['fits'] = False
-                result['estimated_overflow'] = True
-                result['needs_optimization'] = True
-                
-                # Suggest smaller font size
-                suggested_size = int((shape_width_pt / len(text_content)) * 0.8)
-                result['suggested_font_size'] = max(suggested_size, 8)
-                
-                # Suggest larger dimensions
-                result['suggested_dimensions'] = {
-                    'width': estimated_width * 1.2,
-                    'height': shape_height_pt
-                }
-                
-                result['warnings'].append(
-                    f"Text may overflow. Consider font size {result['suggested_font_size']} "
-                    f"or increase width to {result['suggested_dimensions']['width']:.1f} points"
-                )
-        
-        # Check for very long lines that might cause formatting issues
-        lines = text_content.split('\n')
-        max_line_length = max(len(line) for line in lines) if lines else 0
-        
-        if max_line_length > 100:  # Arbitrary threshold
-            result['warnings'].append("Very long lines detected. Consider adding line breaks.")
-            result['needs_optimization'] = True
+            _estimate_text_overflow(result, text_content, shape.width, shape.height, font_size)
         
+        _check_line_lengths(result, text_content)
         return result
         
     except Exception as e:
@@ -80,8 +48,92 @@ def validate_text_fit(shape, text_content: str = None, font_size: int = 12) -> D
         return result
 
 
+def check_text_fit(text_content: str, width: int, height: int, font_size: int = 12) -> Dict:
+    """
+    Validate if text will fit in a container of the given size.
+    
+    Same heuristics as validate_text_fit, for text and dimensions that were
+    already extracted from the shape (e.g. in a worker process).
+    
+    Args:
+        text_content: The text to validate
+        width: Container width in EMU
+        height: Container height in EMU
+        font_size: The font size to check
+    
+    Returns:
+        Dictionary with validation results and suggestions
+    """
+    result = _new_text_fit_result(font_size)
+    
+    if not text_content:
+        return result
+    
+    try:
+        _estimate_text_overflow(result, text_content, width, height, font_size)
+        _check_line_lengths(result, text_content)
+        return result
+    except Exception as e:
+        result['fits'] = False
+        result['error'] = str(e)
+        return result
+
+
+def _new_text_fit_result(font_size: int) -> Dict:
+    """Initial result of a text fit check."""
+    return {
+        'fits': True,
+        'estimated_overflow': False,
+        'suggested_font_size': font_size,
+        'suggested_dimensions': None,
+        'warnings': [],
+        'needs_optimization': False
+    }
+
+
+def _estimate_text_overflow(result: Dict, text_content: str, width: int, height: int, font_size: int) -> None:
+    """Flag text whose estimated width exceeds the container width."""
+    # Rough estimation: average character width is about 0.6 * font_size
+    avg_char_width = font_size * 0.6
+    estimated_width = len(text_content) * avg_char_width
+    
+    # Convert shape dimensions to points (assuming they're in EMU)
+    shape_width_pt = width / 12700  # EMU to points conversion
+    shape_height_pt = height / 12700
+    
+    if estimated_width > shape_width_pt:
+        result['fits'] = False
+        result['estimated_overflow'] = True
+        result['needs_optimization'] = True
+        
+        # Suggest smaller font size
+        suggested_size = int((shape_width_pt / len(text_content)) * 0.8)
+        result['suggested_font_size'] = max(suggested_size, 8)
+        
+        # Suggest larger dimensions
+        result['suggested_dimensions'] = {
+            'width': estimated_width * 1.2,
+            'height': shape_height_pt
+        }
+        
+        result['warnings'].append(
+            f"Text may overflow. Consider font size {result['suggested_font_size']} "
+            f"or increase width to {result['suggested_dimensions']['width']:.1f} points"
+        )
+
+
+def _check_line_lengths(result: Dict, text_content: str) -> None:
+    """Flag very long lines that might cause formatting issues."""
+    lines = text_content.split('\n')
+    max_line_length = max(len(line) for line in lines) if lines else 0
+    
+    if max_line_length > 100:  # Arbitrary threshold
+        result['warnings'].append("Very long lines detected. Consider adding line breaks.")
+        result['needs_optimization'] = True
+
+
 def validate_and_fix_slide(slide, auto_fix: bool = True, min_font_size: int = 8, 
-                          max_font_size: int = 72) -> Dict:
+                          max_font_size: int = 72, shape_indexes: Optional[Set[int]] = None) -> Dict:
     """
     Comprehensively validate and automatically fix slide content issues.
     
@@ -90,6 +142,7 @@ def validate_and_fix_slide(slide, auto_fix: bool = True, min_font_size: int = 8,
         auto_fix: Whether to automatically apply fixes
         min_font_size: Minimum allowed font size
         max_font_size: Maximum allowed font size
+        shape_indexes: Only check the text shapes at these indexes (all if None)
         
     Returns:
         Dictionary with validation results and applied fixes
@@ -100,7 +153,8 @@ def validate_and_fix_slide(slide, auto_fix: bool = True, min_font_size: int = 8,
         'fixes_applied': [],
         'warnings': [],
         'shapes_processed': 0,
-        'text_shapes_optimized': 0
+        'text_shapes_optimized': 0,
+        'fixed_shape_indexes': []
     }
     
     try:
@@ -108,6 +162,8 @@ def validate_and_fix_slide(slide, auto_fix: bool = True, min_font_size: int = 8,
         
         # Find all shapes with text content
         for i, shape in enumerate(slide.shapes):
+            if shape_indexes is not None and i not in shape_indexes:
+                continue
             result['shapes_processed'] += 1
             
             if hasattr(shape, 'text_frame') and shape.text_frame.text.strip():
@@ -131,14 +187,11 @@ def validate_and_fix_slide(slide, auto_fix: bool = True, min_font_size: int = 8,
                         suggested_size = max(min_font_size, 
                                            min(text_validation['suggested_font_size'], max_font_size))
                         
-                        # Apply font size to all runs in the text frame
-                        for paragraph in shape.text_frame.paragraphs:
-                            for run in paragraph.runs:
-                                if hasattr(run, 'font'):
-                                    run.font.size = suggested_size * 12700  # Convert to EMU
+                        _apply_font_size(shape, suggested_size)
                         
                         fix = f"{shape_name}: Adjusted font size to {suggested_size}pt"
                         result['fixes_applied'].append(fix)
+                        result['fixed_shape_indexes'].append(shape_index)
                         result['text_shapes_optimized'] += 1
                         
                     except Exception as e:
@@ -174,6 +227,14 @@ def validate_and_fix_slide(slide, auto_fix: bool = True, min_font_size: int = 8,
         return result
 
 
+def _apply_font_size(shape, font_size: int) -> None:
+    """Apply a font size in points to all runs in a shape's text frame."""
+    for paragraph in shape.text_frame.paragraphs:
+        for run in paragraph.runs:
+            if hasattr(run, 'font'):
+                run.font.size = font_size * 12700  # Convert to EMU
+
+
 def validate_slide_layout(slide) -> Dict:
     """
     Validate slide layout for common issues.
@@ -193,18 +254,16 @@ def validate_slide_layout(slide) -> Dict:
     }
     
     try:
-        shapes = list(slide.shapes)
+        geometry = snapshot_slide_geometry(slide)
         
         # Check for overlapping shapes
-        for i, shape1 in enumerate(shapes):
-            for j, shape2 in enumerate(shapes[i+1:], i+1):
-                if shapes_overlap(shape1, shape2):
-                    result['overlapping_shapes'].append({
-                        'shape1_index': i,
-                        'shape2_index': j,
-                        'shape1_name': getattr(shape1, 'name', f'Shape {i}'),
-                        'shape2_name': getattr(shape2, 'name', f'Shape {j}')
-                    })
+        for i, j in find_overlapping_pairs(geometry):
+            result['overlapping_shapes'].append({
+                'shape1_index': i,
+                'shape2_index': j,
+                'shape1_name': geometry.names[i],
+                'shape2_name': geometry.names[j]
+            })
         
         if result['overlapping_shapes']:
             result['layout_valid'] = False
@@ -216,10 +275,10 @@ def validate_slide_layout(slide) -> Dict:
         slide_height = 7.5 * 914400  # Standard slide height in EMU
         
         shapes_outside = []
-        for i, shape in enumerate(shapes):
-            if (shape.left < 0 or shape.top < 0 or 
-                shape.left + shape.width > slide_width or 
-                shape.top + shape.height > slide_height):
+        for i, (left, top, width, height) in enumerate(geometry.boxes):
+            if (left < 0 or top < 0 or 
+                left + width > slide_width or 
+                top + height > slide_height):
                 shapes_outside.append(i)
         
         if shapes_outside:
@@ -228,8 +287,8 @@ def validate_slide_layout(slide) -> Dict:
             result['suggestions'].append("Reposition shapes to fit within slide boundaries")
         
         # Check shape spacing
-        if len(shapes) > 1:
-            min_spacing = check_minimum_spacing(shapes)
+        if geometry.count > 1:
+            min_spacing = minimum_spacing(geometry)
             if min_spacing < 0.1 * 914400:  # Less than 0.1 inch spacing
                 result['suggestions'].append("Consider increasing spacing between shapes")
         
@@ -241,6 +300,204 @@ def validate_slide_layout(slide) -> Dict:
         return result
 
 
+# Shape elements and transforms, read directly so geometry needs no shape proxies
+_GEOMETRY_NAMESPACES = {
+    'a': 'http://schemas.openxmlformats.org/drawingml/2006/main',
+    'p': 'http://schemas.openxmlformats.org/presentationml/2006/main',
+}
+_XPATH_SHAPE_ELEMENTS = etree.XPath(
+    './p:cSld/p:spTree/*[self::p:sp or self::p:grpSp or self::p:graphicFrame'
+    ' or self::p:cxnSp or self::p:pic or self::p:contentPart]',
+    namespaces=_GEOMETRY_NAMESPACES
+)
+_XPATH_XFRM = etree.XPath('./p:spPr/a:xfrm | ./p:grpSpPr/a:xfrm | ./p:xfrm', namespaces=_GEOMETRY_NAMESPACES)
+_XPATH_SHAPE_NAME = etree.XPath('string(./*[1]/p:cNvPr/@name)', namespaces=_GEOMETRY_NAMESPACES)
+_TAG_OFF = '{%s}off' % _GEOMETRY_NAMESPACES['a']
+_TAG_EXT = '{%s}ext' % _GEOMETRY_NAMESPACES['a']
+
+
+class ShapeGeometry:
+    """
+    Bounding boxes of a set of shapes, read once and packed into arrays.
+    
+    'boxes' keeps the raw (left, top, width, height) of every shape, with None
+    where python-pptx reports no value. The packed arrays hold the edges of
+    the shapes whose four values are all known; 'valid' lists their indexes.
+    """
+    
+    __slots__ = ('count', 'boxes', 'names', 'valid', 'left', 'top', 'right', 'bottom')
+    
+    def __init__(self, boxes: List[Tuple], names: List[str]):
+        self.count = len(boxes)
+        self.boxes = boxes
+        self.names = names
+        self.valid = array('l')
+        self.left = array('q')
+        self.top = array('q')
+        self.right = array('q')
+        self.bottom = array('q')
+        for i, (left, top, width, height) in enumerate(boxes):
+            if left is None or top is None or width is None or height is None:
+                left = top = width = height = 0
+            else:
+                self.valid.append(i)
+            self.left.append(left)
+            self.top.append(top)
+            self.right.append(left + width)
+            self.bottom.append(top + height)
+    
+    @property
+    def is_regular(self) -> bool:
+        """True if no valid shape has a negative width or height."""
+        return all(self.right[i] >= self.left[i] and self.bottom[i] >= self.top[i] for i in self.valid)
+
+
+def _element_box(element) -> Optional[Tuple[int, int, int, int]]:
+    """(left, top, width, height) from a shape's own a:xfrm, or None if any value is missing."""
+    xfrms = _XPATH_XFRM(element)
+    if not xfrms:
+        return None
+    off = xfrms[0].find(_TAG_OFF)
+    ext = xfrms[0].find(_TAG_EXT)
+    if off is None or ext is None:
+        return None
+    try:
+        return int(off.get('x')), int(off.get('y')), int(ext.get('cx')), int(ext.get('cy'))
+    except (TypeError, ValueError):
+        # Missing attributes or universal measures ("1in"); let python-pptx parse them
+        return None
+
+
+def _snapshot_geometry(elements: List, get_shape: Callable[[int], Any]) -> ShapeGeometry:
+    """Snapshot shape boxes, falling back to the shape proxy for inherited or unusual values."""
+    boxes = []
+    for i, element in enumerate(elements):
+        box = _element_box(element)
+        if box is None:
+            # Placeholders without their own xfrm inherit position from the layout
+            shape = get_shape(i)
+            box = (shape.left, shape.top, shape.width, shape.height)
+        boxes.append(box)
+    return ShapeGeometry(boxes, [_XPATH_SHAPE_NAME(element) for element in elements])
+
+
+def snapshot_slide_geometry(slide) -> ShapeGeometry:
+    """
+    Snapshot the geometry of all shapes on a slide.
+    
+    Args:
+        slide: The slide object
+        
+    Returns:
+        ShapeGeometry with one entry per shape, in slide.shapes order
+    """
+    elements = _XPATH_SHAPE_ELEMENTS(slide._element)
+    return _snapshot_geometry(elements, lambda i: SlideShapeFactory(elements[i], slide.shapes))
+
+
+def snapshot_shape_geometry(shapes: List) -> ShapeGeometry:
+    """
+    Snapshot the geometry of a list of shapes.
+    
+    Args:
+        shapes: List of shapes
+        
+    Returns:
+        ShapeGeometry with one entry per shape, in list order
+    """
+    return _snapshot_geometry([shape._element for shape in shapes], lambda i: shapes[i])
+
+
+def find_overlapping_pairs(geometry: ShapeGeometry) -> List[Tuple[int, int]]:
+    """
+    Find all pairs of overlapping shapes with a sweep line over the left edges.
+    
+    Gives the same pairs as calling shapes_overlap on every pair, in the same order.
+    
+    Args:
+        geometry: Snapshot from snapshot_slide_geometry or snapshot_shape_geometry
+        
+    Returns:
+        Sorted list of (i, j) index pairs with i < j
+    """
+    left, top, right, bottom = geometry.left, geometry.top, geometry.right, geometry.bottom
+    pairs = []
+    
+    if not geometry.is_regular:
+        # Negative extents break the sweep ordering; compare every pair instead
+        valid = geometry.valid
+        for a, i in enumerate(valid):
+            for j in valid[a + 1:]:
+                if not (right[i] <= left[j] or right[j] <= left[i] or
+                        bottom[i] <= top[j] or bottom[j] <= top[i]):
+                    pairs.append((i, j))
+        return pairs
+    
+    active = []
+    for i in sorted(geometry.valid, key=left.__getitem__):
+        x = left[i]
+        # Shapes ending at or before this left edge cannot overlap it or any later shape
+        active = [j for j in active if right[j] > x]
+        for j in active:
+            if right[i] > left[j] and bottom[j] > top[i] and bottom[i] > top[j]:
+                pairs.append((j, i) if j < i else (i, j))
+        active.append(i)
+    
+    pairs.sort()
+    return pairs
+
+
+def _minimum_axis_gap(starts: array, ends: array, indexes) -> float:
+    """Smallest non-negative gap between any two intervals along one axis."""
+    order = sorted(indexes, key=starts.__getitem__)
+    min_gap = float('inf')
+    max_end = ends[order[0]]
+    for i in order[1:]:
+        gap = starts[i] - max_end
+        min_gap = min(min_gap, gap if gap > 0 else 0)
+        if not min_gap:
+            break
+        max_end = max(max_end, ends[i])
+    return min_gap
+
+
+def minimum_spacing(geometry: ShapeGeometry) -> float:
+    """
+    Minimum spacing between shapes, as check_minimum_spacing computes it.
+    
+    The distance of a pair is the smaller of its horizontal and vertical edge
+    gaps, so the minimum over all pairs is the smaller of the minimum gaps
+    along each axis. Those are found by sorting, without comparing every pair.
+    
+    Args:
+        geometry: Snapshot from snapshot_slide_geometry or snapshot_shape_geometry
+        
+    Returns:
+        Minimum spacing found between shapes (in EMU)
+    """
+    # Shapes without complete geometry count as touching every other shape
+    if geometry.count < 2 or len(geometry.valid) < geometry.count:
+        return 0
+    
+    if not geometry.is_regular:
+        min_spacing = float('inf')
+        left, top, right, bottom = geometry.left, geometry.top, geometry.right, geometry.bottom
+        for i in range(geometry.count):
+            for j in range(i + 1, geometry.count):
+                dx = abs((left[j] + right[j]) / 2 - (left[i] + right[i]) / 2)
+                dy = abs((top[j] + bottom[j]) / 2 - (top[i] + bottom[i]) / 2)
+                edge_distance_x = max(0, dx - (right[i] - left[i] + right[j] - left[j]) / 2)
+                edge_distance_y = max(0, dy - (bottom[i] - top[i] + bottom[j] - top[j]) / 2)
+                min_spacing = min(min_spacing, edge_distance_x, edge_distance_y)
+        return min_spacing
+    
+    min_spacing = min(
+        _minimum_axis_gap(geometry.left, geometry.right, geometry.valid),
+        _minimum_axis_gap(geometry.top, geometry.bottom, geometry.valid)
+    )
+    return float(min_spacing) if min_spacing else 0
+
+
 def shapes_overlap(shape1, shape2) -> bool:
     """
     Check if two shapes overlap.
@@ -276,16 +533,8 @@ def check_minimum_spacing(shapes: List) -> float:
     Returns:
         Minimum spacing found between shapes (in EMU)
     """
-    min_spacing = float('inf')
-    
     try:
-        for i, shape1 in enumerate(shapes):
-            for shape2 in shapes[i+1:]:
-                # Calculate distance between shape edges
-                distance = calculate_shape_distance(shape1, shape2)
-                min_spacing = min(min_spacing, distance)
-        
-        return min_spacing if min_spacing != float('inf') else 0
+        return minimum_spacing(snapshot_shape_geometry(shapes))
     except:
         return 0
 
@@ -320,4 +569,231 @@ def calculate_shape_distance(shape1, shape2) -> float:
         # Return minimum edge distance
         return min(edge_distance_x, edge_distance_y)
     except:
-        return 0
\ No newline at end of file
+        return 0
+
+
+# ---- Whole-presentation validation ----
+
+# Slide count from which analysis is spread over worker processes
+PARALLEL_VALIDATION_MIN_SLIDES = 16
+
+# Thresholds shared with validate_and_fix_slide and validate_slide_layout
+MAX_SHAPES_PER_SLIDE = 20
+MAX_TEXT_LENGTH = 500
+MAX_EMPTY_PARAGRAPHS = 2
+MIN_SHAPE_SPACING = 0.1 * 914400  # 0.1 inch in EMU
+STANDARD_SLIDE_WIDTH = 10 * 914400
+STANDARD_SLIDE_HEIGHT = 7.5 * 914400
+
+# Per-presentation results of the last validate_presentation run, keyed by the
+# presentation part: ((min_font_size, max_font_size), {slide_id: analysis})
+_presentation_validation_state = weakref.WeakKeyDictionary()
+
+
+def snapshot_slide_for_validation(slide) -> Dict:
+    """
+    Extract the plain data validate_presentation needs from a slide.
+    
+    The snapshot contains only built-in types so it can be sent to a worker process.
+    
+    Args:
+        slide: The slide object
+        
+    Returns:
+        Dictionary with shape boxes and names plus the text of each text frame
+    """
+    geometry = snapshot_slide_geometry(slide)
+    text_shapes = []
+    for shape_index, paragraphs in content_utils.iter_text_frame_paragraphs_xml(slide._element):
+        text = "\n".join(paragraphs)
+        if text.strip():
+            empty_paragraphs = sum(1 for paragraph in paragraphs if not paragraph.strip())
+            text_shapes.append((shape_index, text, empty_paragraphs))
+    
+    return {
+        'boxes': [tuple(None if value is None else int(value) for value in box) for box in geometry.boxes],
+        'names': geometry.names,
+        'text_shapes': text_shapes
+    }
+
+
+def analyze_slide_snapshot(snapshot: Dict, min_font_size: int = 8, max_font_size: int = 72) -> Dict:
+    """
+    Run the read-only slide checks on a snapshot.
+    
+    Covers text fit, long text, empty paragraphs, shape count, overlap,
+    slide boundaries and spacing. Nothing is modified; font size fixes are
+    returned for the caller to apply.
+    
+    Args:
+        snapshot: Result of snapshot_slide_for_validation
+        min_font_size: Minimum allowed font size for suggested fixes
+        max_font_size: Maximum allowed font size for suggested fixes
+        
+    Returns:
+        Dictionary with 'issues' (list of {'check', 'message'}) and
+        'font_fixes' (list of (shape_index, font size))
+    """
+    boxes = snapshot['boxes']
+    names = snapshot['names']
+    issues = []
+    font_fixes = []
+    
+    for shape_index, text, empty_paragraphs in snapshot['text_shapes']:
+        label = f"Shape {shape_index} ({names[shape_index]})"
+        _, _, width, height = boxes[shape_index]
+        
+        text_validation = check_text_fit(text, width, height, font_size=12)
+        if not text_validation['fits'] or text_validation['needs_optimization']:
+            issues.append({'check': 'text_fit', 'message': f"{label}: Text may not fit properly"})
+            if text_validation['suggested_font_size']:
+                suggested_size = max(min_font_size, min(text_validation['suggested_font_size'], max_font_size))
+                font_fixes.append((shape_index, suggested_size))
+        
+        if len(text) > MAX_TEXT_LENGTH:
+            issues.append({'check': 'long_text',
+                           'message': f"{label}: Contains very long text (>{MAX_TEXT_LENGTH} chars)"})
+        
+        if empty_paragraphs > MAX_EMPTY_PARAGRAPHS:
+            issues.append({'check': 'empty_paragraphs',
+                           'message': f"{label}: Contains {empty_paragraphs} empty paragraphs"})
+    
+    if len(boxes) > MAX_SHAPES_PER_SLIDE:
+        issues.append({'check': 'shape_count',
+                       'message': f"Slide contains many shapes ({len(boxes)} > {MAX_SHAPES_PER_SLIDE})"})
+    
+    geometry = ShapeGeometry(boxes, names)
+    
+    overlapping = find_overlapping_pairs(geometry)
+    if overlapping:
+        examples = ", ".join(f"{i}-{j}" for i, j in overlapping[:5])
+        more = ", ..." if len(overlapping) > 5 else ""
+        issues.append({'check': 'overlap',
+                       'message': f"Found {len(overlapping)} overlapping shape pairs ({examples}{more})"})
+    
+    shapes_outside = [
+        i for i in geometry.valid
+        if (boxes[i][0] < 0 or boxes[i][1] < 0 or
+            boxes[i][0] + boxes[i][2] > STANDARD_SLIDE_WIDTH or
+            boxes[i][1] + boxes[i][3] > STANDARD_SLIDE_HEIGHT)
+    ]
+    if shapes_outside:
+        issues.append({'check': 'out_of_bounds',
+                       'message': f"Found {len(shapes_outside)} shapes outside slide boundaries"})
+    
+    if geometry.count > 1 and minimum_spacing(geometry) < MIN_SHAPE_SPACING:
+        issues.append({'check': 'spacing', 'message': "Shapes are closer than 0.1 inch"})
+    
+    return {'issues': issues, 'font_fixes': font_fixes}
+
+
+def _analyze_snapshots(snapshots: List[Dict], min_font_size: int, max_font_size: int,
+                       max_workers: Optional[int]) -> List[Dict]:
+    """Analyze snapshots, in worker processes when there are enough of them."""
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+    
+    if max_workers <= 1 or len(snapshots) < PARALLEL_VALIDATION_MIN_SLIDES:
+        return [analyze_slide_snapshot(snapshot, min_font_size, max_font_size) for snapshot in snapshots]
+    
+    max_workers = min(max_workers, len(snapshots))
+    chunksize = max(1, len(snapshots) // (max_workers * 4))
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=get_worker_context()) as executor:
+        return list(executor.map(
+            analyze_slide_snapshot, snapshots,
+            [min_font_size] * len(snapshots), [max_font_size] * len(snapshots),
+            chunksize=chunksize
+        ))
+
+
+def validate_presentation(presentation, auto_fix: bool = False,
+                          changed_slide_ids: Optional[Set[int]] = None,
+                          min_font_size: int = 8, max_font_size: int = 72,
+                          max_workers: Optional[int] = None) -> Dict:
+    """
+    Lint every slide of a presentation and optionally apply font size fixes.
+    
+    Slides are snapshotted to plain data, analyzed (in parallel for larger
+    decks), and fixes are then applied serially in this process.
+    
+    Args:
+        presentation: The Presentation object
+        auto_fix: Whether to apply the suggested font sizes to overflowing text
+        changed_slide_ids: Ids of the slides changed since the last run; results
+            of the last run are reused for the other slides. None re-checks all
+        min_font_size: Minimum allowed font size
+        max_font_size: Maximum allowed font size
+        max_workers: Maximum number of worker processes (defaults to CPU count)
+        
+    Returns:
+        Dictionary with per-check totals and a summary for each slide with issues
+    """
+    font_range = (min_font_size, max_font_size)
+    previous_range, previous_state = _presentation_validation_state.get(presentation.part, (None, {}))
+    if changed_slide_ids is None or previous_range != font_range:
+        previous_state = {}
+    state = {}  # slide_id -> analysis
+    
+    slides = list(presentation.slides)
+    changed = []
+    for slide_index, slide in enumerate(slides):
+        previous = previous_state.get(slide.slide_id)
+        if previous is not None and slide.slide_id not in changed_slide_ids:
+            state[slide.slide_id] = previous
+        else:
+            changed.append(slide_index)
+    
+    snapshots = [snapshot_slide_for_validation(slides[slide_index]) for slide_index in changed]
+    analyses = _analyze_snapshots(snapshots, min_font_size, max_font_size, max_workers)
+    for slide_index, analysis in zip(changed, analyses):
+        state[slides[slide_index].slide_id] = analysis
+    
+    # Apply fixes serially, including fixes still pending from an earlier read-only run
+    changed_set = set(changed)
+    slide_summaries = []
+    totals = {}
+    for slide_index, slide in enumerate(slides):
+        analysis = state[slide.slide_id]
+        issues = [f"{issue['check']}: {issue['message']}" for issue in analysis['issues']]
+        for issue in analysis['issues']:
+            totals[issue['check']] = totals.get(issue['check'], 0) + 1
+        
+        fixes_applied = []
+        fixed_shape_indexes = []
+        if auto_fix and analysis['font_fixes']:
+            for shape_index, font_size in analysis['font_fixes']:
+                try:
+                    _apply_font_size(slide.shapes[shape_index], font_size)
+                    fixes_applied.append(f"Shape {shape_index}: Adjusted font size to {font_size}pt")
+                    fixed_shape_indexes.append(shape_index)
+                except Exception as e:
+                    issues.append(f"auto_fix: Shape {shape_index}: Could not auto-fix font size: {str(e)}")
+            # Fixes are applied once
+            state[slide.slide_id] = dict(analysis, font_fixes=[])
+        
+        if issues or fixes_applied:
+            entry = {
+                'slide_index': slide_index,
+                'slide_id': slide.slide_id,
+                'issues': issues
+            }
+            if fixes_applied:
+                entry['fixes_applied'] = fixes_applied
+                entry['fixed_shape_indexes'] = fixed_shape_indexes
+            if slide_index not in changed_set:
+                entry['unchanged'] = True
+            slide_summaries.append(entry)
+    
+    _presentation_validation_state[presentation.part] = (font_range, state)
+    
+    return {
+        'validation_passed': not totals,
+        'total_slides': len(slides),
+        'slides_checked': len(changed),
+        'slides_unchanged': len(slides) - len(changed),
+        'slides_with_issues': sum(1 for entry in slide_summaries if entry['issues']),
+        'issue_totals': totals,
+        'fixes_applied': sum(len(entry.get('fixes_applied', [])) for entry in slide_summaries),
+        'slides': slide_summaries
+    }
+